@@ -27,6 +27,9 @@ class AdvancedSearchDialog(QDialog):
         
         # 파일 크기 검색
         size_group = QGroupBox("파일 크기")
+        size_group.setCheckable(True)  # 체크한 조건만 검색에 사용
+        size_group.setChecked(False)
+        self.size_group = size_group
         size_layout = QHBoxLayout()
         self.size_combo = QComboBox()
         self.size_combo.addItems(["이상", "이하", "정확히"])
@@ -42,6 +45,9 @@ class AdvancedSearchDialog(QDialog):
         
         # 날짜 검색
         date_group = QGroupBox("날짜")
+        date_group.setCheckable(True)
+        date_group.setChecked(False)
+        self.date_group = date_group
         date_layout = QFormLayout()
         self.date_type = QComboBox()
         self.date_type.addItems(["수정일", "생성일", "접근일"])
@@ -82,11 +88,13 @@ class AdvancedSearchDialog(QDialog):
                 'case_sensitive': self.name_case_sensitive.isChecked()
             },
             'size': {
+                'enabled': self.size_group.isChecked(),
                 'operator': self.size_combo.currentText(),
                 'value': self.size_input.value(),
                 'unit': self.size_unit.currentText()
             },
             'date': {
+                'enabled': self.date_group.isChecked(),
                 'type': self.date_type.currentText(),
                 'from': self.date_from.date().toPython(),
                 'to': self.date_to.date().toPython()
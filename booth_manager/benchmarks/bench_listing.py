@@ -0,0 +1,89 @@
+"""
+디렉토리 목록 읽기 벤치마크 (listdir + 개별 stat 딕셔너리 vs scandir + DirectoryItem).
+
+사용법:
+    python benchmarks/bench_listing.py [--entries N] [--repeat N] [--dir 경로]
+
+--dir를 지정하지 않으면 임시 폴더에 N개(기본 50000)의 항목(파일 90%, 폴더 10%)을 만들어 측정합니다.
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_manager import DataManager
+from widgets import HIDDEN_FILES
+
+
+def list_with_listdir(dir_path):
+    """이전 방식: listdir 후 항목마다 isdir/exists/getmtime/exists/getsize 호출"""
+    items = []
+    for entry in os.listdir(dir_path):
+        if entry in HIDDEN_FILES or entry.startswith('.'):
+            continue
+        item_path = os.path.join(dir_path, entry)
+        is_dir = os.path.isdir(item_path)
+        mtime = os.path.getmtime(item_path) if os.path.exists(item_path) else 0
+        size = os.path.getsize(item_path) if not is_dir and os.path.exists(item_path) else 0
+        items.append({"path": item_path, "name": entry, "is_dir": is_dir, "mtime": mtime, "size": size})
+    return items
+
+
+def list_with_scandir(dir_path):
+    """현재 방식: DataManager.iter_directory_items (scandir + __slots__ 레코드)"""
+    return list(DataManager(dir_path).iter_directory_items(dir_path))
+
+
+def make_entries(directory, count):
+    """빈 파일과 폴더를 만들어 큰 디렉토리를 흉내냄"""
+    for i in range(count):
+        path = os.path.join(directory, f"item_{i:06d}")
+        if i % 10 == 0:
+            os.mkdir(path)
+        else:
+            with open(path + ".jpg", "wb") as f:
+                f.write(b"x" * (i % 100))
+
+
+def measure(lister, dir_path, repeat):
+    """최소 실행 시간(ms)과 결과 리스트의 메모리 사용량(KB)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        lister(dir_path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    items = lister(dir_path)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, current / 1024, len(items)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="디렉토리 목록 읽기 벤치마크")
+    parser.add_argument("--entries", type=int, default=50000, help="생성할 항목 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    parser.add_argument("--dir", help="측정할 기존 디렉토리 (지정 시 항목을 만들지 않음)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        dir_path = args.dir
+        if not dir_path:
+            dir_path = temp_dir
+            print(f"항목 {args.entries}개 생성 중...")
+            make_entries(dir_path, args.entries)
+
+        for name, lister in (("listdir + stat (이전)", list_with_listdir),
+                             ("scandir + DirectoryItem", list_with_scandir)):
+            elapsed_ms, memory_kb, count = measure(lister, dir_path, args.repeat)
+            print(f"{name:<24}: {elapsed_ms:9.1f} ms  메모리 {memory_kb:9.0f} KB  (항목 {count}개)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+태그 검색 벤치마크 (os.walk + .meta.json 읽기 vs 태그 비트맵 색인 / 질의 계획).
+
+사용법:
+    python benchmarks/bench_tag_query.py [--items N] [--repeat N] [--dir 경로]
+
+--dir를 지정하지 않으면 임시 폴더에 N개(기본 5000)의 아이템 폴더(상점 폴더 아래, 태그 .meta.json과
+.unitypackage/.png 파일 포함)를 만들어 측정합니다. 색인을 만드는 시간은 따로 표시합니다.
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_manager import DataManager
+
+TAGS = ["헤어", "의상", "리본", "무료", "유료", "texture", "shader", "액세서리", "모자", "신발",
+        "고양이", "드레스", "원피스", "귀걸이", "머리핀", "quest", "pc", "vrchat", "모션", "이펙트"]
+MB = 1024 ** 2
+
+
+def walk_items(base_path):
+    """이전 방식: 전체 폴더를 훑으며 .meta.json을 읽음 (아이템 폴더, 태그 집합, 파일 이름 리스트)"""
+    for root, dirs, files in os.walk(base_path):
+        if ".meta.json" not in files:
+            continue
+        try:
+            with open(os.path.join(root, ".meta.json"), 'r', encoding='utf-8') as f:
+                raw_tags = json.load(f).get("tags", [])
+        except (json.JSONDecodeError, IOError):
+            continue
+        item_tags = {str(tag).strip().lower() for tag in raw_tags if str(tag).strip()}
+        yield root, item_tags, files
+        dirs[:] = []  # 아이템 폴더 아래는 더 훑지 않음
+
+
+def walk_search(base_path, predicate):
+    """이전 방식의 검색 (predicate(root, tags, files)가 참인 아이템)"""
+    return [root for root, tags, files in walk_items(base_path) if predicate(root, tags, files)]
+
+
+def make_library(base_path, count):
+    """상점 폴더 / 아이템 폴더 / 태그와 파일이 있는 라이브러리를 흉내냄 (큰 파일은 희소 파일)"""
+    rng = random.Random(0)
+    for i in range(count):
+        item_path = os.path.join(base_path, f"shop_{i % 50:02d}", f"item_{i:06d}")
+        os.makedirs(item_path)
+        tags = rng.sample(TAGS, rng.randint(1, 5))
+        with open(os.path.join(item_path, ".meta.json"), 'w', encoding='utf-8') as f:
+            json.dump({"tags": tags}, f, ensure_ascii=False)
+        with open(os.path.join(item_path, f"item_{i}.png"), 'wb') as f:
+            f.write(b"x" * 100)
+        if i % 3 == 0:
+            with open(os.path.join(item_path, f"item_{i}.unitypackage"), 'wb') as f:
+                f.truncate(rng.randint(1, 300) * MB)
+
+
+def file_size(root, name):
+    try:
+        return os.path.getsize(os.path.join(root, name))
+    except OSError:
+        return 0
+
+
+# (이름, 질의, 같은 결과를 내는 이전 방식의 조건)
+CASES = [
+    ("태그 AND", "헤어, 리본",
+     lambda root, tags, files: {"헤어", "리본"} <= tags),
+    ("OR / NOT", "(헤어 OR 모자) -유료",
+     lambda root, tags, files: ("헤어" in tags or "모자" in tags) and "유료" not in tags),
+    ("접두어", "tex* quest",
+     lambda root, tags, files: "quest" in tags and any(tag.startswith("tex") for tag in tags)),
+    ("태그 + ext + size", "의상 ext:unitypackage size:>100MB",
+     lambda root, tags, files: "의상" in tags and any(
+         name.endswith(".unitypackage") and file_size(root, name) > 100 * MB for name in files)),
+]
+
+
+def best_time(function, repeat):
+    """최소 실행 시간(ms)과 마지막 결과"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="태그 검색 벤치마크")
+    parser.add_argument("--items", type=int, default=5000, help="생성할 아이템 폴더 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    parser.add_argument("--dir", help="측정할 기존 라이브러리 (지정 시 아이템을 만들지 않음)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_path = args.dir
+        if not base_path:
+            base_path = temp_dir
+            print(f"아이템 폴더 {args.items}개 생성 중...")
+            make_library(base_path, args.items)
+
+        data_manager = DataManager(base_path)
+        start = time.perf_counter()
+        data_manager.refresh_tag_index()
+        print(f"색인 생성 (카탈로그 + 저장소 + 비트맵): {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+        for name, query, predicate in CASES:
+            walk_ms, expected = best_time(lambda: walk_search(base_path, predicate), args.repeat)
+            query_ms, result = best_time(lambda: data_manager.query_items(query), args.repeat)
+            same = "일치" if sorted(expected) == sorted(result) else "불일치"
+            speedup = walk_ms / query_ms if query_ms else float("inf")
+            print(f"{name:<16} {query!r}")
+            print(f"    os.walk + json (이전): {walk_ms:9.1f} ms  (결과 {len(expected)}개)")
+            print(f"    질의 계획 + 비트맵   : {query_ms:9.2f} ms  (결과 {len(result)}개, {same}, {speedup:.0f}배)")
+
+        search_tags = {"헤어", "리본"}
+        index_ms, _ = best_time(lambda: data_manager.find_items_by_tags(search_tags), args.repeat)
+        print(f"TagIndex.search {sorted(search_tags)}: {index_ms:9.2f} ms")
+
+        data_manager.file_catalog.close()
+        data_manager.metadata_store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+썸네일 디코딩 백엔드 벤치마크 (스레드 vs 프로세스).
+
+사용법:
+    python benchmarks/bench_thumbnail_backends.py [이미지 폴더] [--repeat N] [--workers N]
+
+폴더를 지정하지 않으면 저장소의 '부스 다운로드 폴더'를 사용합니다.
+"""
+import os
+import sys
+import time
+import argparse
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from widgets import THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT
+from thumbnail_decoder import decode_thumbnail
+from thumbnail_scheduler import load_scaled_image, image_from_buffer
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp'}
+
+
+def collect_images(root):
+    """폴더 아래의 모든 이미지 파일 경로를 수집합니다."""
+    paths = []
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if os.path.splitext(filename)[1].lower() in IMAGE_EXTENSIONS:
+                paths.append(os.path.join(dirpath, filename))
+    return paths
+
+
+def run_thread_backend(paths, workers):
+    """스레드 백엔드: QImage 디코딩 + 축소 (ThumbnailJob과 동일)"""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return sum(1 for image in executor.map(load_scaled_image, paths) if not image.isNull())
+
+
+def run_process_backend(paths, workers):
+    """프로세스 백엔드: 워커에서 PIL 디코딩 후 픽셀 버퍼를 받아 QImage로 변환"""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(decode_thumbnail, paths,
+                               [THUMBNAIL_WIDTH] * len(paths), [THUMBNAIL_HEIGHT] * len(paths))
+        return sum(1 for result in results if not image_from_buffer(result).isNull())
+
+
+def main():
+    default_root = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "부스 다운로드 폴더")
+    parser = argparse.ArgumentParser(description="썸네일 디코딩 백엔드 벤치마크")
+    parser.add_argument("root", nargs="?", default=default_root, help="이미지가 들어있는 폴더")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    parser.add_argument("--workers", type=int, default=max(1, multiprocessing.cpu_count() - 1),
+                        help="워커 수")
+    args = parser.parse_args()
+
+    paths = collect_images(args.root)
+    if not paths:
+        print(f"이미지가 없습니다: {args.root}")
+        return
+    print(f"이미지 {len(paths)}개, 워커 {args.workers}개, 반복 {args.repeat}회")
+
+    for name, runner in (("thread", run_thread_backend), ("process", run_process_backend)):
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            decoded = runner(paths, args.workers)
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        print(f"{name:>8}: 최소 {best * 1000:8.1f} ms  ({len(paths) / best:7.1f} 이미지/초, 성공 {decoded}개)")
+
+
+if __name__ == "__main__":
+    main()
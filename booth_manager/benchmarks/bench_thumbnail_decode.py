@@ -0,0 +1,116 @@
+"""
+썸네일 디코딩 빠른 경로 벤치마크 (전체 디코딩 vs EXIF 썸네일/DCT 축소 디코딩).
+
+사용법:
+    python benchmarks/bench_thumbnail_decode.py [이미지 폴더] [--repeat N]
+    python benchmarks/bench_thumbnail_decode.py --synthetic 20
+
+--synthetic을 지정하면 임시 폴더에 큰 JPEG(절반은 EXIF 썸네일 포함)을 만들어 측정합니다.
+폴더를 지정하지 않으면 저장소의 '부스 다운로드' 폴더를 사용합니다.
+"""
+import io
+import os
+import sys
+import time
+import struct
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage
+
+from widgets import THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT
+from thumbnail_decoder import decode_thumbnail
+from thumbnail_scheduler import load_scaled_image
+from bench_thumbnail_backends import collect_images
+
+
+def qt_full_decode(source_path):
+    """이전 방식: QImage로 전체 디코딩 후 축소"""
+    loaded = QImage(source_path)
+    return loaded.scaled(THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def pil_full_decode(source_path):
+    """이전 방식: PIL thumbnail (EXIF 썸네일 미사용)"""
+    with Image.open(source_path) as img:
+        img.thumbnail((THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT), Image.LANCZOS)
+        rgba = img.convert("RGBA")
+        return rgba.width, rgba.height, rgba.tobytes()
+
+
+def pil_fast_decode(source_path):
+    return decode_thumbnail(source_path, THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT)
+
+
+def _exif_with_thumbnail(size):
+    """IFD1에 JPEG 썸네일을 담은 EXIF 블록 생성"""
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (90, 120, 200)).save(buffer, "JPEG", quality=85)
+    thumb = buffer.getvalue()
+    # TIFF 헤더(8) + 빈 IFD0(6) + IFD1(30) 다음에 썸네일 데이터
+    ifd0 = struct.pack("<HI", 0, 14)
+    ifd1 = (struct.pack("<H", 2)
+            + struct.pack("<HHII", 0x0201, 4, 1, 44)
+            + struct.pack("<HHII", 0x0202, 4, 1, len(thumb))
+            + struct.pack("<I", 0))
+    return b"Exif\x00\x00" + b"II*\x00" + struct.pack("<I", 8) + ifd0 + ifd1 + thumb
+
+
+def make_synthetic_images(directory, count, size=(3000, 2000)):
+    """큰 JPEG 샘플 생성 (짝수 번째는 EXIF 썸네일 포함)"""
+    base = Image.radial_gradient("L").resize(size).convert("RGB")
+    exif = _exif_with_thumbnail((size[0] // 10, size[1] // 10))
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"{i:03d}.jpg")
+        base.save(path, "JPEG", quality=90, exif=exif if i % 2 == 0 else b"")
+        paths.append(path)
+    return paths
+
+
+def measure(decoder, paths, repeat):
+    """이미지당 평균 디코딩 시간(ms) (반복 중 최소값)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for path in paths:
+            decoder(path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000 / len(paths)
+
+
+def main():
+    default_root = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "부스 다운로드")
+    parser = argparse.ArgumentParser(description="썸네일 디코딩 빠른 경로 벤치마크")
+    parser.add_argument("root", nargs="?", default=default_root, help="이미지가 들어있는 폴더")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    parser.add_argument("--synthetic", type=int, default=0, help="생성할 샘플 JPEG 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if args.synthetic:
+            paths = make_synthetic_images(temp_dir, args.synthetic)
+        else:
+            paths = collect_images(args.root)
+        if not paths:
+            print(f"이미지가 없습니다: {args.root}")
+            return
+        print(f"이미지 {len(paths)}개, 반복 {args.repeat}회 (이미지당 평균)")
+
+        cases = (
+            ("Qt 전체 디코딩 (이전)", qt_full_decode),
+            ("Qt 빠른 경로 (스레드 백엔드)", load_scaled_image),
+            ("PIL 전체 디코딩 (이전)", pil_full_decode),
+            ("PIL 빠른 경로 (프로세스 백엔드)", pil_fast_decode),
+        )
+        for name, decoder in cases:
+            print(f"{name:<28}: {measure(decoder, paths, args.repeat):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import time
+import sqlite3
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from data_manager import DirectoryItem
+
+# 검색 도중 카탈로그가 이 시간(초)보다 오래됐으면 검색이 끝난 뒤 갱신 (다음 검색에 반영)
+CATALOG_REFRESH_INTERVAL = 300
+
+
+class CatalogSearchSignals(QObject):
+    batch_ready = Signal(int, list)  # generation, DirectoryItem 리스트
+    finished = Signal(int, str)      # generation, 오류 메시지 (성공 시 빈 문자열)
+
+
+class CatalogSearchJob(QRunnable):
+    """
+    파일 카탈로그에 고급 검색 조건을 질의하여 결과를 묶음 단위로 전달하는 작업.
+    카탈로그가 아직 없으면 먼저 만들고, 오래됐으면 결과를 다 보낸 뒤 갱신합니다.
+    """
+    def __init__(self, search, generation, catalog, criteria):
+        super().__init__()
+        self.search = search
+        self.generation = generation
+        self.catalog = catalog
+        self.criteria = criteria
+
+    def _cancelled(self):
+        return self.generation != self.search.generation
+
+    def run(self):
+        signals = self.search.signals
+        try:
+            self.catalog.ensure_built()
+            for rows in self.catalog.search(self.criteria):
+                if self._cancelled():
+                    return
+                signals.batch_ready.emit(self.generation, [
+                    DirectoryItem(path, name, False, mtime or 0, size or 0)
+                    for path, name, size, mtime in rows])
+        except sqlite3.Error as e:
+            print(f"고급 검색 오류: {e}")
+            signals.finished.emit(self.generation, str(e))
+            return
+        signals.finished.emit(self.generation, "")
+
+        updated_at = self.catalog.updated_at
+        if updated_at is None or time.monotonic() - updated_at > CATALOG_REFRESH_INTERVAL:
+            self.catalog.update()
+
+
+class CatalogSearch(QObject):
+    """
+    백그라운드 스레드에서 파일 카탈로그를 검색해 결과를 묶음 단위로 전달합니다.
+    새 검색을 시작하면 이전 검색은 취소되고, 이전 검색의 결과는 generation으로 걸러집니다.
+    """
+    batch_ready = Signal(int, list)
+    finished = Signal(int, str)
+
+    def __init__(self, catalog, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.generation = 0
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+
+        self.signals = CatalogSearchSignals()
+        self.signals.batch_ready.connect(self._on_batch_ready)
+        self.signals.finished.connect(self._on_finished)
+
+    def search(self, criteria):
+        """
+        고급 검색을 시작합니다.
+
+        Args:
+            criteria (dict): AdvancedSearchDialog.get_search_criteria()의 결과.
+
+        Returns:
+            int: 이번 검색의 generation.
+        """
+        self.generation += 1
+        self.thread_pool.start(CatalogSearchJob(self, self.generation, self.catalog, criteria))
+        return self.generation
+
+    def cancel(self):
+        """진행 중인 검색을 취소합니다."""
+        self.generation += 1
+
+    def _on_batch_ready(self, generation, items):
+        if generation == self.generation:
+            self.batch_ready.emit(generation, items)
+
+    def _on_finished(self, generation, error):
+        if generation == self.generation:
+            self.finished.emit(generation, error)
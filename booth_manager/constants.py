@@ -7,6 +7,9 @@ PADDING_SMALL = "2px 5px"  # 작은 패딩
 PADDING_MEDIUM = "4px 8px"  # 중간 패딩
 MARGIN_SMALL = "2px"  # 작은 마진
 
+# Thumbnail Settings
+THUMBNAIL_BACKEND = "thread"  # 썸네일 디코딩 백엔드 ("thread" 또는 "process")
+
 # Theme Colors
 THEME_COLORS = {
     "white": {  # 흰색 테마
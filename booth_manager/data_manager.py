@@ -1,7 +1,65 @@
 import os
-import json
+import sqlite3
 import time
 from widgets import HIDDEN_FILES # Import constant from widgets
+from text_utils import natural_sort_key, fold_text
+from tag_index import TagIndex
+from tag_query import TagQuery
+from tag_stats import TagStatistics
+from fuzzy_index import FuzzyIndex
+from file_catalog import get_file_catalog
+from metadata_store import get_metadata_store
+
+class DirectoryItem:
+    """
+    디렉토리 아이템 하나의 정보 (목록이 클 때 메모리를 줄이기 위해 __slots__ 사용).
+    이름 정렬 키(sort_name)와 필터 비교용 이름(match_name)은 생성 시 한 번만 계산합니다 (목록 읽기 스레드에서).
+    """
+    __slots__ = ("path", "name", "is_dir", "mtime", "size", "sort_name", "match_name")
+
+    def __init__(self, path, name, is_dir, mtime=0, size=0):
+        self.path = path
+        self.name = name
+        self.is_dir = is_dir
+        self.mtime = mtime
+        self.size = size
+        self.sort_name = natural_sort_key(name)
+        self.match_name = fold_text(name)
+
+    def __repr__(self):
+        return f"DirectoryItem({self.path!r}, is_dir={self.is_dir})"
+
+
+# 정렬 옵션 (정렬 콤보박스 순서와 같음): 인덱스 -> (표시 이름, 키 함수, 역순 여부)
+# 같은 값끼리는 이름 순서로 정렬되도록 보조 키로 sort_name을 사용
+SORT_OPTIONS = {
+    0: ("이름 (오름차순)", lambda x: x.sort_name, False),
+    1: ("이름 (내림차순)", lambda x: x.sort_name, True),
+    2: ("날짜 (최신순)", lambda x: (-x.mtime, x.sort_name), False),
+    3: ("날짜 (오래된순)", lambda x: (x.mtime, x.sort_name), False),
+    4: ("크기 (큰순)", lambda x: (-x.size, x.sort_name), False),
+    5: ("크기 (작은순)", lambda x: (x.size, x.sort_name), False),
+    6: ("유형 (폴더 우선)", lambda x: (not x.is_dir, x.sort_name), False),
+    7: ("유형 (파일 우선)", lambda x: (x.is_dir, x.sort_name), False),
+}
+
+
+def sort_key(sort_criteria):
+    """정렬 기준 인덱스의 (키 함수, 역순 여부)"""
+    _, key, reverse = SORT_OPTIONS.get(sort_criteria, SORT_OPTIONS[0])
+    return key, reverse
+
+
+def matches_filter(item, folded_filter):
+    """
+    이름 필터 일치 여부 (폴더는 항상 포함, 파일은 이름/확장자에 필터 문자열이 있을 때 포함).
+
+    Args:
+        item (DirectoryItem): 검사할 아이템.
+        folded_filter (str): fold_text로 접은 필터 문자열.
+    """
+    return item.is_dir or folded_filter in item.match_name
+
 
 class DataManager:
     """
@@ -10,6 +68,30 @@ class DataManager:
     """
     def __init__(self, base_path):
         self.base_path = base_path
+        # 태그 등 아이템 메타데이터 저장소 (.meta.json은 사이드카로 함께 유지)
+        self.metadata_store = get_metadata_store(base_path)
+        # 전체 파일 카탈로그 (고급 검색, 사이드카 위치 조회용. 태그 색인을 갱신할 때 함께 갱신)
+        self.file_catalog = get_file_catalog(base_path)
+        # 태그 -> 아이템 폴더 역색인 (처음 검색할 때 또는 refresh_tag_index()에서 준비)
+        self.tag_index = TagIndex(self.metadata_store, self.file_catalog)
+        # 이름/태그/제목 유사 검색 색인 (처음 검색할 때 또는 refresh_indexes()에서 준비)
+        self.fuzzy_index = FuzzyIndex(self.file_catalog, self.metadata_store)
+        self.tag_stats = TagStatistics(self.tag_index)
+
+    def refresh_tag_index(self):
+        """
+        파일 카탈로그를 갱신하고, 사이드카를 저장소와 맞춰 태그 색인을 갱신합니다
+        (바뀐 폴더/메타 파일만 읽음, 백그라운드 호출용).
+        """
+        return self.tag_index.refresh()
+
+    def refresh_indexes(self):
+        """
+        파일 카탈로그, 태그 색인, 유사 검색 색인을 디스크와 맞춥니다
+        (바뀐 폴더/메타 파일/문서만 다시 읽음, 백그라운드 호출용).
+        """
+        self.refresh_tag_index()
+        self.fuzzy_index.refresh()
 
     def get_items_in_directory(self, dir_path, sort_criteria=0, filter_text=""):
         """
@@ -18,68 +100,83 @@ class DataManager:
 
         Args:
             dir_path (str): 탐색할 디렉토리 경로.
-            sort_criteria (int): 정렬 기준 (0: 이름, 1: 날짜, 2: 크기).
+            sort_criteria (int): 정렬 기준 (SORT_OPTIONS의 인덱스).
             filter_text (str): 필터링할 텍스트 (파일 이름 또는 확장자).
 
         Returns:
-            list: 아이템 정보를 담은 딕셔너리 리스트.
-                  각 딕셔너리는 'path', 'name', 'is_dir', 'mtime', 'size' 키를 포함.
+            list: DirectoryItem 리스트.
             None: 경로가 유효하지 않거나 오류 발생 시.
         """
         if not os.path.exists(dir_path) or not os.path.isdir(dir_path):
             print(f"Error: Path is not a valid directory - {dir_path}")
             return None
 
-        items_to_display = []
         try:
-            entries = os.listdir(dir_path)
+            items_to_display = list(self.iter_directory_items(dir_path, filter_text))
+            key, reverse = sort_key(sort_criteria)
+            items_to_display.sort(key=key, reverse=reverse)
+            return items_to_display
+
+        except Exception as e:
+            print(f"Error listing directory {dir_path}: {e}")
+            return None
+
+    def iter_directory_items(self, dir_path, filter_text=""):
+        """
+        디렉토리의 아이템 정보를 하나씩 생성합니다 (정렬하지 않음).
+        숨김 파일은 제외하고, 파일은 이름/확장자가 filter_text를 포함할 때만 포함합니다.
+
+        Yields:
+            DirectoryItem: 아이템 정보.
+
+        Raises:
+            OSError: 디렉토리를 읽을 수 없는 경우.
+        """
+        folded_filter = fold_text(filter_text)
+        # scandir의 DirEntry는 종류를 캐시하므로 아이템당 stat은 최대 한 번 (Windows에서는 0번)
+        with os.scandir(dir_path) as entries:
             for entry in entries:
-                if entry in HIDDEN_FILES or entry.startswith('.'):
+                name = entry.name
+                if name in HIDDEN_FILES or name.startswith('.'):
                     continue
-                item_path = os.path.join(dir_path, entry)
                 try:
-                    is_dir = os.path.isdir(item_path)
-                    mtime = os.path.getmtime(item_path) if os.path.exists(item_path) else 0
-                    size = os.path.getsize(item_path) if not is_dir and os.path.exists(item_path) else 0
-
-                    items_to_display.append({
-                        "path": item_path,
-                        "name": entry,
-                        "is_dir": is_dir,
-                        "mtime": mtime,
-                        "size": size
-                    })
+                    is_dir = entry.is_dir()
+                    # 필터링 (폴더는 항상 포함, 파일은 이름/확장자 매치 시 포함)
+                    if folded_filter and not is_dir and folded_filter not in fold_text(name):
+                        continue
+                    try:
+                        stat = entry.stat()
+                        mtime = stat.st_mtime
+                        size = 0 if is_dir else stat.st_size
+                    except FileNotFoundError:
+                        # 깨진 심볼릭 링크 등
+                        mtime, size = 0, 0
                 except OSError as e:
-                    print(f"Error accessing file properties for {item_path}: {e}")
+                    print(f"Error accessing file properties for {entry.path}: {e}")
                     continue # Skip this item if properties cannot be accessed
 
-            # 필터링 (파일만 필터링)
-            if filter_text:
-                filter_text_lower = filter_text.lower()
-                filtered_items = []
-                for item in items_to_display:
-                    # 폴더는 항상 포함, 파일은 이름/확장자 매치 시 포함
-                    if item["is_dir"] or filter_text_lower in item["name"].lower():
-                        filtered_items.append(item)
-                items_to_display = filtered_items
-
-            # 정렬
-            if sort_criteria == 0: # 이름
-                items_to_display.sort(key=lambda x: x["name"].lower())
-            elif sort_criteria == 1: # 날짜 (최신순, 폴더 우선)
-                items_to_display.sort(key=lambda x: (not x["is_dir"], -x["mtime"]), reverse=False) # Sort by is_dir (False comes first), then mtime descending
-            elif sort_criteria == 2: # 크기 (큰 순, 폴더 우선)
-                 items_to_display.sort(key=lambda x: (not x["is_dir"], -x["size"]), reverse=False) # Sort by is_dir, then size descending
+                yield DirectoryItem(entry.path, name, is_dir, mtime, size)
 
-            return items_to_display
+    def fuzzy_search(self, query):
+        """
+        이름/태그/Booth 상품 제목·상점 이름에서 검색어와 비슷한 폴더와 파일을 찾습니다
+        (부분 일치, 접두어, 오타 허용, 관련도순).
+        입력할 때마다 GUI 스레드에서 호출되므로 색인을 여기서 만들지 않습니다
+        (시작 시 백그라운드 refresh_indexes가 만듦).
 
-        except Exception as e:
-            print(f"Error listing directory {dir_path}: {e}")
+        Returns:
+            list: DirectoryItem 리스트 (관련도순).
+            None: 색인을 아직 만드는 중인 경우.
+        """
+        if not self.fuzzy_index.loaded:
             return None
+        return [DirectoryItem(path, os.path.basename(path), is_dir)
+                for path, is_dir in self.fuzzy_index.search(query)]
 
     def find_items_by_tags(self, search_tags):
         """
         주어진 태그를 모두 포함하는 아이템 폴더 경로를 찾습니다.
+        디스크를 훑지 않고 태그 역색인(TagIndex)의 집합 교집합으로 처리합니다.
 
         Args:
             search_tags (set): 검색할 태그 문자열 집합 (소문자).
@@ -87,34 +184,92 @@ class DataManager:
         Returns:
             list: 매칭되는 아이템 폴더 경로 리스트.
         """
-        matching_paths = []
-        if not search_tags:
-            return matching_paths
+        return self.tag_index.search(search_tags)
 
-        for root, dirs, files in os.walk(self.base_path):
-            meta_path = os.path.join(root, ".meta.json")
-            if os.path.exists(meta_path):
-                try:
-                    with open(meta_path, 'r', encoding='utf-8') as f:
-                        meta_data = json.load(f)
-                        # Ensure tags are loaded correctly as a set of lowercase strings
-                        raw_tags = meta_data.get("tags", [])
-                        if isinstance(raw_tags, list):
-                             item_tags = {str(tag).strip().lower() for tag in raw_tags if str(tag).strip()}
-                        else:
-                             item_tags = set() # Ignore if tags are not a list
-
-                        # Check if all search tags are present in the item's tags
-                        if search_tags.issubset(item_tags):
-                            matching_paths.append(root)
-                            # Stop searching deeper in this branch once a match is found
-                            dirs[:] = []
-                except (json.JSONDecodeError, IOError) as e:
-                    print(f"Error reading or parsing meta file {meta_path}: {e}")
-                except Exception as e:
-                    print(f"Unexpected error processing meta file {meta_path}: {e}")
-
-        return matching_paths
-
-    # Note: Tag saving logic remains in BaseItemWidget as it's directly tied to the widget's state.
-    # If a more centralized tag management system is needed later, it could be moved here.
+    def index_version(self):
+        """
+        태그 색인, 파일 카탈로그, 메타데이터 저장소의 현재 버전 (하나라도 바뀌면 달라짐).
+        저장된 검색의 캐시된 결과가 아직 유효한지 확인하는 데 씁니다 (태그 색인을 먼저 준비).
+        shop:/title: 조건은 저장소의 제목/상점을 읽으므로 저장소 버전도 포함합니다.
+        """
+        self.tag_index.ensure_loaded()
+        return (self.tag_index.version, self.file_catalog.version, self.metadata_store.version)
+
+    def query_items(self, query_text):
+        """
+        태그 질의(AND/OR/NOT, 괄호, 접두어*, ext:/size:/shop:/title: 조건)에 맞는 아이템 폴더를 찾습니다.
+        문법이 없는 입력은 예전처럼 쉼표로 나눈 태그를 모두 가진 아이템을 찾습니다.
+
+        Args:
+            query_text (str): 검색어.
+
+        Raises:
+            QueryError: 검색어를 해석할 수 없는 경우.
+
+        Returns:
+            list: 매칭되는 아이템 폴더 경로 리스트.
+        """
+        self.tag_index.ensure_loaded()
+        return TagQuery(query_text).evaluate(self.tag_index, self.file_catalog, self.metadata_store)
+
+    def load_tags(self, item_path):
+        """
+        아이템 폴더의 태그를 메타데이터 저장소에서 로드합니다.
+        .meta.json 사이드카가 밖에서 바뀌었으면 먼저 저장소로 가져옵니다.
+
+        Args:
+            item_path (str): 아이템 폴더 경로.
+
+        Returns:
+            list: 정렬된 태그 리스트 (태그가 없거나 오류 시 빈 리스트).
+        """
+        try:
+            if self.metadata_store.import_sidecar(item_path):
+                self.tag_index.update(item_path, self.metadata_store.get_tags(item_path))
+                self.fuzzy_index.update_item(item_path)
+            return self.metadata_store.get_tags(item_path)
+        except sqlite3.Error as e:
+            print(f"{item_path}에서 태그 로드 오류: {e}")
+            return []
+
+    def load_tags_batch(self, item_paths):
+        """
+        여러 아이템 폴더의 태그를 한 번에 로드합니다 (디렉토리 목록 단위, 백그라운드 호출용).
+        밖에서 바뀐 .meta.json 사이드카만 먼저 가져오고, 태그는 저장소에 묶어서 조회합니다.
+
+        Args:
+            item_paths (list): 아이템 폴더 경로 리스트.
+
+        Returns:
+            dict: {item_path: 정렬된 태그 리스트} (오류 시 빈 딕셔너리).
+        """
+        try:
+            imported = [path for path in item_paths if self.metadata_store.import_sidecar(path)]
+            tags_by_path = self.metadata_store.get_tags_batch(item_paths)
+        except sqlite3.Error as e:
+            print(f"태그 일괄 로드 오류: {e}")
+            return {}
+        self.tag_index.update_many({path: tags_by_path.get(path, []) for path in imported})
+        for path in imported:
+            self.fuzzy_index.update_item(path)
+        return tags_by_path
+
+    def save_tags(self, item_path, tags):
+        """
+        태그를 메타데이터 저장소에 저장하고 .meta.json 사이드카도 갱신합니다.
+        사이드카의 다른 필드는 유지합니다.
+
+        Args:
+            item_path (str): 아이템 폴더 경로.
+            tags (list): 저장할 태그 리스트.
+
+        Returns:
+            str: 오류 메시지. 성공 시 None.
+        """
+        tags = list(tags) if isinstance(tags, (list, tuple, set)) else []
+        error = self.metadata_store.set_tags(item_path, tags)
+        if error is None:
+            print(f"태그 저장 완료: {item_path}")
+            self.tag_index.update(item_path, tags)
+            self.fuzzy_index.update_item(item_path)
+        return error
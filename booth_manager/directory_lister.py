@@ -0,0 +1,127 @@
+import time
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+# 첫 묶음은 작게 보내 첫 화면이 바로 그려지도록 하고, 이후에는 크게 묶어서 전달
+FIRST_BATCH_SIZE = 64
+BATCH_SIZE = 512
+# 묶음이 다 차지 않아도 이 시간(초)이 지나면 전달 (느린 드라이브 대응)
+BATCH_INTERVAL = 0.05
+
+
+class DirectoryListSignals(QObject):
+    batch_ready = Signal(int, list)  # generation, 아이템 정보 리스트
+    rescanned = Signal(int, list)    # generation, 전체 아이템 정보 리스트 (다시 읽기)
+    finished = Signal(int, str)      # generation, 오류 메시지 (성공 시 빈 문자열)
+
+
+class DirectoryListJob(QRunnable):
+    """
+    디렉토리를 읽으면서 아이템 정보를 묶음 단위로 전달하는 작업.
+    rescan이면 묶음으로 나누지 않고 다 읽은 뒤 전체 목록을 한 번에 전달합니다 (변경 반영용).
+    """
+    def __init__(self, lister, generation, data_manager, dir_path, filter_text, rescan=False):
+        super().__init__()
+        self.lister = lister
+        self.generation = generation
+        self.data_manager = data_manager
+        self.dir_path = dir_path
+        self.filter_text = filter_text
+        self.rescan = rescan
+
+    def _cancelled(self):
+        # 새 목록 요청이 들어오면 generation이 바뀜
+        return self.generation != self.lister.generation
+
+    def run(self):
+        signals = self.lister.signals
+        batch = []
+        batch_size = FIRST_BATCH_SIZE
+        last_emit = time.monotonic()
+        try:
+            for item in self.data_manager.iter_directory_items(self.dir_path, self.filter_text):
+                if self._cancelled():
+                    return
+                batch.append(item)
+                if self.rescan:
+                    continue
+                if len(batch) >= batch_size or time.monotonic() - last_emit >= BATCH_INTERVAL:
+                    signals.batch_ready.emit(self.generation, batch)
+                    batch = []
+                    batch_size = BATCH_SIZE
+                    last_emit = time.monotonic()
+        except OSError as e:
+            print(f"Error listing directory {self.dir_path}: {e}")
+            signals.finished.emit(self.generation, str(e))
+            return
+
+        if self._cancelled():
+            return
+        if self.rescan:
+            signals.rescanned.emit(self.generation, batch)
+        elif batch:
+            signals.batch_ready.emit(self.generation, batch)
+        signals.finished.emit(self.generation, "")
+
+
+class DirectoryLister(QObject):
+    """
+    백그라운드 스레드에서 디렉토리 목록을 읽어 묶음 단위로 전달합니다.
+    새 목록을 요청하면 이전 요청은 취소되고, 이전 요청의 결과는 generation으로 걸러집니다.
+    """
+    batch_ready = Signal(int, list)
+    rescanned = Signal(int, list)
+    finished = Signal(int, str)
+
+    def __init__(self, data_manager, parent=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self.generation = 0
+        # 썸네일 작업 뒤에 밀리지 않도록 목록 전용 스레드 사용
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+
+        self.signals = DirectoryListSignals()
+        self.signals.batch_ready.connect(self._on_batch_ready)
+        self.signals.rescanned.connect(self._on_rescanned)
+        self.signals.finished.connect(self._on_finished)
+
+    def list_directory(self, dir_path, filter_text=""):
+        """
+        디렉토리 목록 읽기를 시작합니다.
+
+        Returns:
+            int: 이번 요청의 generation (batch_ready/finished 시그널에서 비교용).
+        """
+        self.generation += 1
+        self.thread_pool.start(DirectoryListJob(self, self.generation, self.data_manager,
+                                                dir_path, filter_text))
+        return self.generation
+
+    def rescan(self, dir_path):
+        """
+        이미 표시 중인 디렉토리를 다시 읽어 전체 목록을 rescanned로 한 번에 전달합니다.
+        진행 중인 목록 읽기는 취소되므로, 목록 읽기가 끝난 뒤에 호출해야 합니다.
+
+        Returns:
+            int: 이번 요청의 generation.
+        """
+        self.generation += 1
+        self.thread_pool.start(DirectoryListJob(self, self.generation, self.data_manager,
+                                                dir_path, "", rescan=True))
+        return self.generation
+
+    def cancel(self):
+        """진행 중인 목록 읽기를 취소합니다."""
+        self.generation += 1
+
+    def _on_batch_ready(self, generation, items):
+        if generation == self.generation:
+            self.batch_ready.emit(generation, items)
+
+    def _on_rescanned(self, generation, items):
+        if generation == self.generation:
+            self.rescanned.emit(generation, items)
+
+    def _on_finished(self, generation, error):
+        if generation == self.generation:
+            self.finished.emit(generation, error)
@@ -0,0 +1,118 @@
+import os
+import time
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+
+from metadata_store import META_FILE_NAME
+
+# 마지막 변경 후 이 시간(ms) 동안 조용하면 한 번에 알림 (연속 이벤트 합치기)
+SETTLE_INTERVAL = 300
+# 변경이 계속 이어져도 (압축 해제 등) 이 시간(초)마다는 알림
+MAX_COALESCE_DELAY = 2.0
+# 사이드카를 감시할 최대 아이템 폴더 수 (아이템마다 폴더와 .meta.json 두 개를 감시)
+MAX_WATCHED_ITEMS = 2000
+
+
+class DirectoryWatcher(QObject):
+    """
+    현재 표시 중인 디렉토리의 변경(추가/삭제/이름 변경)과
+    그 안의 아이템 폴더 .meta.json 사이드카 변경(직접 고침, 새로 만듦, 바꿔 쓰기)을 감시합니다.
+    QFileSystemWatcher(Linux에서는 inotify)의 이벤트를 모아 잠잠해지면
+    changed / sidecars_changed를 한 번씩만 보냅니다.
+    """
+    changed = Signal(str)            # 변경된 디렉토리 경로
+    sidecars_changed = Signal(list)  # .meta.json이 바뀌었을 수 있는 아이템 폴더 경로 리스트
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.path = None
+        self._items = set()            # 사이드카를 감시하는 아이템 폴더
+        self._directory_changed = False
+        self._changed_items = set()
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(SETTLE_INTERVAL)
+        self._settle_timer.timeout.connect(self._emit_changed)
+        self._first_event_time = 0.0
+
+    def watch(self, path):
+        """감시할 디렉토리를 바꿉니다 (None이면 감시 중지). 아이템 사이드카 감시도 해제됩니다."""
+        if path == self.path:
+            return
+        self._settle_timer.stop()
+        self._directory_changed = False
+        self._changed_items.clear()
+        self._items = set()
+        watched = self._watcher.directories() + self._watcher.files()
+        if watched:
+            self._watcher.removePaths(watched)
+        self.path = path
+        if path and not self._watcher.addPath(path):
+            print(f"디렉토리 감시 시작 실패: {path}")
+
+    def watch_items(self, item_paths):
+        """
+        현재 디렉토리의 아이템 폴더들의 .meta.json을 감시합니다 (이전 아이템 목록을 대체).
+        폴더는 사이드카가 새로 만들어지거나 바꿔 써지는 것을, 파일은 직접 고쳐지는 것을 알려줍니다.
+        """
+        items = set(item_paths[:MAX_WATCHED_ITEMS]) if self.path else set()
+        removed = self._items - items
+        if removed:
+            stale = set(self._watcher.directories()) | set(self._watcher.files())
+            paths = [path for item in removed
+                     for path in (item, os.path.join(item, META_FILE_NAME)) if path in stale]
+            if paths:
+                self._watcher.removePaths(paths)
+        added = sorted(items - self._items)
+        if added:
+            self._watcher.addPaths(added)
+            sidecars = [path for path in (os.path.join(item, META_FILE_NAME) for item in added)
+                        if os.path.isfile(path)]
+            if sidecars:
+                self._watcher.addPaths(sidecars)
+        self._items = items
+
+    def _on_directory_changed(self, path):
+        if path == self.path:
+            self._directory_changed = True
+        elif path in self._items:
+            self._changed_items.add(path)  # 사이드카가 생기거나 바꿔 써졌을 수 있음
+        else:
+            return
+        self._schedule()
+
+    def _on_file_changed(self, path):
+        item_path = os.path.dirname(path)
+        if item_path not in self._items:
+            return
+        self._changed_items.add(item_path)
+        self._schedule()
+
+    def _schedule(self):
+        # 첫 이벤트부터 MAX_COALESCE_DELAY가 지나기 전까지는 타이머를 다시 시작하여 합침
+        if not self._settle_timer.isActive():
+            self._first_event_time = time.monotonic()
+            self._settle_timer.start()
+        elif time.monotonic() - self._first_event_time < MAX_COALESCE_DELAY:
+            self._settle_timer.start()
+
+    def _emit_changed(self):
+        if self._changed_items:
+            changed_items = sorted(self._changed_items)
+            self._changed_items.clear()
+            # 바꿔 쓰기/삭제 후 다시 만들어진 사이드카는 감시가 풀리므로 다시 등록
+            watched = set(self._watcher.files())
+            paths = [path for path in (os.path.join(item, META_FILE_NAME) for item in changed_items)
+                     if path not in watched and os.path.isfile(path)]
+            if paths:
+                self._watcher.addPaths(paths)
+            self.sidecars_changed.emit(changed_items)
+        if self._directory_changed:
+            self._directory_changed = False
+            # 디렉토리가 지워졌다가 다시 만들어지면 감시가 풀리므로 다시 등록
+            if self.path and self.path not in self._watcher.directories():
+                self._watcher.addPath(self.path)
+            self.changed.emit(self.path)
@@ -1,6 +1,7 @@
 import sys
 import os
 import re
+import sqlite3
 from datetime import datetime
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLineEdit, QPushButton, QLabel, 
@@ -14,6 +15,8 @@ from PySide6.QtGui import QIcon, QPixmap
 
 # Import the style from widgets.py
 from widgets import TAG_BUTTON_STYLE
+from metadata_store import get_metadata_store
+from file_catalog import get_file_catalog
 
 class DownloadThread(QThread):
     """
@@ -27,7 +30,7 @@ class DownloadThread(QThread):
     all_finished = Signal()             # 모든 다운로드 완료 신호
     log_message = Signal(str)           # 로그 메시지
 
-    def __init__(self, urls, cookies, headers, subfolders_list):
+    def __init__(self, urls, cookies, headers, subfolders_list, metadata_store=None):
         """
         다운로드 스레드 초기화
         
@@ -36,13 +39,16 @@ class DownloadThread(QThread):
             cookies (dict): Booth 웹사이트 쿠키
             headers (dict): HTTP 요청 헤더
             subfolders_list (list): 선택된 하위 폴더 목록
+            metadata_store (MetadataStore): 다운로드 정보(상품 ID/제목/상점/파일 목록)를 기록할 저장소
         """
         super().__init__()
         self.urls = urls
         self.cookies = cookies
         self.headers = headers
         self.subfolders_list = subfolders_list
+        self.metadata_store = metadata_store
         self.downloaded_files = []  # 다운로드된 파일 경로 저장
+        self.item_info = {}  # 상품 ID -> {"title": ..., "shop": ...} (상품 페이지에서 추출)
         # 이미지 다운로드를 위한 별도 헤더
         self.image_headers = {
             'accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
@@ -79,9 +85,10 @@ class DownloadThread(QThread):
                     os.makedirs(output_dir, exist_ok=True)
 
                     # 이미지 다운로드
+                    item_files = []
                     image_urls = self.get_image_urls(item_id)
                     if image_urls:
-                        self.download_images(image_urls, output_dir)
+                        item_files.extend(self.download_images(image_urls, output_dir))
 
                     # 각 다운로드 URL에 대해 파일 다운로드
                     for download_url in download_urls:
@@ -144,6 +151,7 @@ class DownloadThread(QThread):
                             
                             file_path = os.path.join(output_dir, filename)
                             self.downloaded_files.append(file_path)
+                            item_files.append(file_path)
                             
                             total_size = int(response.headers.get('content-length', 0))
                             downloaded = 0
@@ -162,6 +170,12 @@ class DownloadThread(QThread):
                         except Exception as e:
                             self.error.emit(f"파일 다운로드 중 오류 발생 ({download_url}): {str(e)}")
 
+                    # 상품 정보와 받은 파일 목록을 메타데이터 저장소에 기록 (.meta.json도 갱신)
+                    if self.metadata_store is not None:
+                        info = self.item_info.get(item_id, {})
+                        self.metadata_store.record_download(output_dir, item_id, info.get("title"),
+                                                            info.get("shop"), item_files)
+
             except Exception as e:
                 self.error.emit(f"오류 발생 ({url}): {str(e)}")
 
@@ -186,6 +200,7 @@ class DownloadThread(QThread):
         
         if response.status_code == 200:
             soup = BeautifulSoup(response.text, 'html.parser')
+            self.item_info[item_id] = self.parse_item_info(soup)
             
             # 1. data-download-url 속성을 가진 요소 찾기
             for element in soup.find_all(attrs={"data-download-url": True}):
@@ -222,6 +237,26 @@ class DownloadThread(QThread):
         # 중복 제거 및 유효한 URL만 필터링
         return list(set(url for url in download_urls if url))
 
+    def parse_item_info(self, soup):
+        """
+        상품 페이지에서 제목과 상점 이름을 추출하는 메서드
+
+        Returns:
+            dict: {"title": 제목 또는 None, "shop": 상점 서브도메인 또는 None}
+        """
+        title = None
+        og_title = soup.find('meta', attrs={'property': 'og:title'})
+        if og_title and og_title.get('content'):
+            title = og_title['content'].strip()
+
+        shop = None
+        for link in soup.find_all('a', href=True):
+            match = re.match(r'https://([\w-]+)\.booth\.pm/?', link['href'])
+            if match and match.group(1) not in ('www', 'accounts', 'manage', 'checkout'):
+                shop = match.group(1)
+                break
+        return {"title": title, "shop": shop}
+
     def get_image_urls(self, item_id):
         """
         상품 페이지에서 이미지 URL을 추출하는 메서드
@@ -258,7 +293,11 @@ class DownloadThread(QThread):
         Args:
             image_urls (list): 다운로드할 이미지 URL 목록
             output_dir (str): 이미지를 저장할 디렉토리 경로
+
+        Returns:
+            list: 저장한 이미지 파일 경로 목록
         """
+        saved_paths = []
         total_images = len(image_urls)
         for idx, img_url in enumerate(image_urls, 1):
             try:
@@ -270,10 +309,12 @@ class DownloadThread(QThread):
                     
                     with open(file_path, 'wb') as f:
                         f.write(response.content)
+                    saved_paths.append(file_path)
                     
                     self.image_progress.emit(idx, total_images)
             except Exception as e:
                 print(f"이미지 다운로드 실패 ({img_url}): {str(e)}")
+        return saved_paths
 
 class SubfolderDialog(QDialog):
     recent_folders = []  # 클래스 변수로 변경하여 모든 다이얼로그에서 공유
@@ -363,9 +404,8 @@ class SubfolderDialog(QDialog):
         search_text = self.search_input.text().lower()
         self.current_folders_list.clear()
         
-        # 모든 폴더 가져오기
-        all_folders = self.get_all_folders(self.base_path, self.base_path)
-        all_folders.sort()
+        # 모든 폴더 가져오기 (입력할 때마다 호출되므로 카탈로그 조회만)
+        all_folders = self.get_all_folders()
         
         # 검색어로 필터링
         filtered_folders = [folder for folder in all_folders if search_text in folder.lower()]
@@ -391,12 +431,9 @@ class SubfolderDialog(QDialog):
                 os.makedirs(self.base_path, exist_ok=True)
                 print(f"기본 폴더 생성: {self.base_path}")
 
-            # 모든 폴더 가져오기 (base_path 기준 상대 경로)
-            all_folders = self.get_all_folders(self.base_path, self.base_path)
-            
-            # 폴더 정렬 (알파벳 순)
-            all_folders.sort()
-            
+            # 모든 폴더 가져오기 (base_path 기준 상대 경로, 경로순)
+            all_folders = self.get_all_folders(refresh=True)
+
             # 리스트에 추가
             self.current_folders_list.addItems(all_folders)
         except Exception as e:
@@ -473,37 +510,29 @@ class SubfolderDialog(QDialog):
         """
         return folder_name.isdigit()
         
-    def get_all_folders(self, current_dir, relative_to):
+    def get_all_folders(self, refresh=False):
         """
-        지정된 디렉토리와 하위 디렉토리의 폴더 목록을 재귀적으로 가져옵니다.
-        
+        base_path 아래의 폴더 목록을 파일 카탈로그에서 가져옵니다 (트리를 직접 훑지 않음).
+        숫자 폴더(아이템 ID 폴더)와 그 안쪽 폴더는 제외합니다.
+
         Args:
-            current_dir (str): 탐색 시작 디렉토리 경로
-            relative_to (str): 상대 경로를 계산할 기준 디렉토리 경로
-            
+            refresh (bool): True면 조회 전에 카탈로그를 갱신 (바뀐 폴더만 다시 읽음).
+
         Returns:
-            list: 기준 디렉토리에 대한 상대 폴더 경로 목록
+            list: base_path 기준 상대 폴더 경로 목록 (경로순).
         """
-        folders = []
+        catalog = get_file_catalog(self.base_path)
+        if refresh:
+            catalog.update()
+        else:
+            catalog.ensure_built()
         try:
-            for item in os.listdir(current_dir):
-                full_path = os.path.join(current_dir, item)
-                if os.path.isdir(full_path):
-                    # 숫자 폴더(아이템 ID 폴더)는 제외
-                    if not self.is_numeric_folder(item):
-                        # 현재 폴더 추가 (상대 경로)
-                        relative_path = os.path.relpath(full_path, relative_to)
-                        # 루트 폴더 자체는 제외 (상대 경로가 '.' 인 경우)
-                        if relative_path != '.':
-                            folders.append(relative_path)
-                        
-                        # 하위 폴더도 탐색
-                        sub_folders = self.get_all_folders(full_path, relative_to)
-                        folders.extend(sub_folders)
-        except Exception as e:
-            print(f"폴더 탐색 중 오류 발생 ({current_dir}): {str(e)}")
-            
-        return folders
+            folders = catalog.folders()
+        except sqlite3.Error as e:
+            print(f"폴더 목록 조회 중 오류 발생: {str(e)}")
+            return []
+        return [folder for folder in folders
+                if not any(self.is_numeric_folder(part) for part in folder.split(os.sep))]
 
 class URLItemWidget(QWidget):
     # Signal to notify parent when remove button is clicked
@@ -649,6 +678,8 @@ class DownloaderWidget(QWidget): # BoothDownloader(QMainWindow)에서 변경
     """
     Booth 다운로더 GUI 위젯 (QWidget 상속)
     """
+    download_started = Signal()  # 다운로드 작업 시작
+    download_stopped = Signal()  # 모든 다운로드 작업 종료
     def __init__(self, base_path, parent=None): # base_path 인자 추가
         """
         GUI 위젯 초기화
@@ -896,7 +927,8 @@ class DownloaderWidget(QWidget): # BoothDownloader(QMainWindow)에서 변경
              QMessageBox.warning(self, "진행 중", "이미 다운로드가 진행 중입니다.")
              return
 
-        self.download_thread = DownloadThread(urls, cookies, headers, subfolders_list)
+        self.download_thread = DownloadThread(urls, cookies, headers, subfolders_list,
+                                              get_metadata_store(self.base_path))
         # 시그널 연결
         self.download_thread.progress.connect(self.update_progress)
         self.download_thread.finished.connect(self.download_finished)
@@ -904,10 +936,12 @@ class DownloaderWidget(QWidget): # BoothDownloader(QMainWindow)에서 변경
         self.download_thread.image_progress.connect(self.update_image_progress)
         self.download_thread.url_progress.connect(self.update_url_progress)
         self.download_thread.all_finished.connect(self.enable_buttons) # 모든 작업 완료 시 버튼 활성화
+        self.download_thread.all_finished.connect(self.download_stopped) # 외부에 작업 종료 알림
         self.download_thread.log_message.connect(self.log_output.append)  # 스레드 로그 메시지 연결
 
         self.download_button.setEnabled(False) # 다운로드 중 버튼 비활성화
         self.download_thread.start() # 스레드 시작
+        self.download_started.emit()
 
     def update_progress(self, value):
         """파일 다운로드 진행률 업데이트 (현재는 사용 안 함)"""
@@ -0,0 +1,411 @@
+import os
+import time
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as dt_time, timedelta
+
+from metadata_store import META_FILE_NAME
+from text_utils import fold_text
+from widgets import HIDDEN_FILES
+
+CATALOG_FILE_NAME = ".file_catalog.sqlite3"
+SCHEMA_VERSION = 2
+# 최상위 하위 트리마다 하나씩 맡아 병렬로 훑는 스레드 수 (scandir/stat은 GIL을 놓음)
+SCAN_WORKERS = min(8, os.cpu_count() or 1)
+# 검색 결과를 한 번에 읽어 오는 행 수
+FETCH_BATCH_SIZE = 512
+
+# 고급 검색 조건 -> 카탈로그 열/값
+SIZE_UNITS = {"KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3}
+DATE_COLUMNS = {"수정일": "mtime", "생성일": "ctime", "접근일": "atime"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,          -- base_path 기준 상대 경로 (base_path 자신은 '')
+    parent TEXT NOT NULL,           -- 상위 폴더 상대 경로 (base_path는 '')
+    item TEXT,                      -- 속한 아이템 폴더(.meta.json이 있는 가장 가까운 폴더, 자신 포함) 상대 경로
+    name TEXT NOT NULL,
+    match_name TEXT NOT NULL,       -- 대소문자 무시 비교용 이름 (fold_text)
+    ext TEXT NOT NULL,              -- 점 없는 소문자 확장자 (폴더는 '')
+    is_dir INTEGER NOT NULL,
+    size INTEGER,                   -- 폴더는 NULL
+    mtime REAL,
+    ctime REAL,
+    atime REAL,
+    meta_mtime REAL                 -- 폴더의 .meta.json 수정 시간 (없으면 NULL)
+);
+CREATE INDEX IF NOT EXISTS files_size ON files (size) WHERE size IS NOT NULL;
+CREATE INDEX IF NOT EXISTS files_mtime ON files (mtime);
+CREATE INDEX IF NOT EXISTS files_ctime ON files (ctime);
+CREATE INDEX IF NOT EXISTS files_atime ON files (atime);
+CREATE INDEX IF NOT EXISTS files_ext ON files (ext, size);
+CREATE INDEX IF NOT EXISTS files_parent ON files (parent);
+"""
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_file_catalog(base_path):
+    """base_path의 파일 카탈로그 (같은 경로는 프로세스 안에서 하나를 공유)"""
+    key = os.path.normpath(os.path.abspath(base_path))
+    with _stores_lock:
+        catalog = _stores.get(key)
+        if catalog is None:
+            catalog = _stores[key] = FileCatalog(key)
+        return catalog
+
+
+def normalize_extension(ext):
+    """확장자를 점 없는 소문자로 ('.JPG' -> 'jpg')"""
+    return ext.strip().lstrip('.').lower()
+
+
+def build_query(criteria):
+    """
+    고급 검색 조건(AdvancedSearchDialog.get_search_criteria)을 SQL WHERE 절로 바꿉니다.
+    크기/날짜/확장자 조건은 색인을 타고, 파일명 조건은 그 결과에만 적용됩니다.
+    'enabled'가 False인 조건 그룹은 무시합니다 (키가 없으면 사용하는 것으로 간주).
+
+    Returns:
+        tuple: (WHERE 절 문자열, 매개변수 리스트).
+    """
+    clauses = ["is_dir = 0"]
+    params = []
+
+    name = criteria.get('name') or {}
+    text = name.get('text', '').strip()
+    if text:
+        if name.get('case_sensitive'):
+            clauses.append("instr(name, ?) > 0")
+            params.append(text)
+        else:
+            clauses.append("instr(match_name, ?) > 0")
+            params.append(fold_text(text))
+
+    size = criteria.get('size') or {}
+    if size.get('enabled', True) and size:
+        unit = SIZE_UNITS.get(size.get('unit'), 1)
+        value = size.get('value', 0) * unit
+        operator = size.get('operator')
+        if operator == "이상":
+            clauses.append("size >= ?")
+            params.append(value)
+        elif operator == "이하":
+            clauses.append("size <= ?")
+            params.append(value)
+        elif operator == "정확히":
+            # 단위에 맞춰 내림한 값이 같은 크기 (예: 5 MB -> 5 MB 이상 6 MB 미만)
+            clauses.append("size >= ? AND size < ?")
+            params.extend((value, value + unit))
+
+    date = criteria.get('date') or {}
+    column = DATE_COLUMNS.get(date.get('type'))
+    if date.get('enabled', True) and column:
+        if date.get('from'):
+            clauses.append(f"{column} >= ?")
+            params.append(datetime.combine(date['from'], dt_time.min).timestamp())
+        if date.get('to'):
+            clauses.append(f"{column} < ?")  # 종료일 당일 포함
+            params.append(datetime.combine(date['to'] + timedelta(days=1), dt_time.min).timestamp())
+
+    extensions = sorted({normalize_extension(ext) for ext in criteria.get('type') or []} - {''})
+    if extensions:
+        clauses.append(f"ext IN ({','.join('?' * len(extensions))})")
+        params.extend(extensions)
+
+    return " AND ".join(clauses), params
+
+
+class FileCatalog:
+    """
+    base_path 아래 모든 파일/폴더의 카탈로그 (경로, 이름, 확장자, 크기, 수정/생성/접근 시간, 소속 아이템 폴더).
+    base_path의 SQLite 데이터베이스(WAL 모드)에 저장되며, 크기/날짜/확장자 색인으로
+    고급 검색의 범위/조합 조건을 트리를 탐색하지 않고 바로 처리합니다.
+
+    태그 동기화(.meta.json 위치), 폴더 목록 등 "base_path 아래 전체"가 필요한 기능도 트리 대신 카탈로그를 조회합니다.
+
+    update()는 최상위 하위 트리별로 병렬로 훑되 수정 시간이 그대로인 폴더는 건너뜁니다 (백그라운드 호출용).
+    연결은 스레드마다 따로 열어 갱신 중에도 검색할 수 있습니다.
+    """
+    def __init__(self, base_path):
+        self.base_path = base_path
+        self.db_path = os.path.join(base_path, CATALOG_FILE_NAME)
+        self._local = threading.local()
+        self._update_lock = threading.Lock()
+        self.updated_at = None  # 이 프로세스에서 마지막으로 갱신한 시각 (time.monotonic)
+        self.version = 0  # 내용이 바뀔 때마다 증가 (저장된 검색 결과 캐시 검증용)
+        self._init_schema()
+
+    # --- 연결 ---
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        conn = self._connection()
+        with conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS files")  # 형식이 바뀌면 다음 갱신 때 새로 만듦
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def close(self):
+        """현재 스레드의 연결 닫기"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def abs_path(self, rel_path):
+        return os.path.normpath(os.path.join(self.base_path, rel_path))
+
+    # --- 갱신 ---
+    def is_built(self):
+        """카탈로그가 한 번이라도 만들어졌는지 여부"""
+        return self._connection().execute("SELECT 1 FROM files LIMIT 1").fetchone() is not None
+
+    def ensure_built(self):
+        """카탈로그가 비어 있으면 만듭니다 (다른 스레드가 갱신 중이면 끝날 때까지 기다림)."""
+        with self._update_lock:
+            if self.updated_at is not None or self.is_built():
+                return
+        self.update()
+
+    def update(self, full=False):
+        """
+        base_path 아래를 훑어 카탈로그를 갱신합니다 (한 트랜잭션).
+        최상위 하위 트리마다 스레드 하나가 맡아 병렬로 훑고,
+        수정 시간이 카탈로그와 같은 폴더는 목록을 다시 읽지 않습니다
+        (항목 추가/삭제/이름 변경은 폴더 수정 시간을 바꿈). 단, .meta.json은 매번 확인합니다.
+
+        Args:
+            full (bool): True면 수정 시간과 관계없이 모든 폴더를 다시 읽음
+                (제자리에서 덮어쓴 파일의 크기/시간까지 반영).
+
+        Returns:
+            int: 새로 쓰거나 바꾼 항목 수. 실패 시 -1.
+        """
+        with self._update_lock:
+            conn = self._connection()
+            try:
+                known, children = self._load_dirs(conn)
+                root_stat = os.stat(self.base_path)
+                rows, cleared, removed = [], [], []
+                top_dirs = self._scan_dir("", root_stat, None, known, children, full, rows, cleared, removed)
+                with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+                    futures = [executor.submit(self._scan_tree, rel_dir, stat, item, known, children, full)
+                               for rel_dir, stat, item in top_dirs]
+                    for future in futures:
+                        tree_rows, tree_cleared, tree_removed = future.result()
+                        rows.extend(tree_rows)
+                        cleared.extend(tree_cleared)
+                        removed.extend(tree_removed)
+
+                with conn:
+                    for rel_dir in removed:
+                        self._delete_subtree(conn, rel_dir)
+                    conn.executemany("DELETE FROM files WHERE parent = ? AND is_dir = 0",
+                                     [(rel_dir,) for rel_dir in cleared])
+                    conn.executemany(
+                        "INSERT INTO files (path, parent, item, name, match_name, ext, is_dir, "
+                        "size, mtime, ctime, atime, meta_mtime) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT (path) DO UPDATE SET item = excluded.item, size = excluded.size, "
+                        "mtime = excluded.mtime, ctime = excluded.ctime, atime = excluded.atime, "
+                        "meta_mtime = excluded.meta_mtime",
+                        rows)
+                if rows or cleared or removed:
+                    self.version += 1
+                self.updated_at = time.monotonic()
+                return len(rows)
+            except (sqlite3.Error, OSError) as e:
+                print(f"파일 카탈로그 갱신 오류: {e}")
+                return -1
+
+    def _load_dirs(self, conn):
+        """
+        카탈로그에 있는 폴더 정보.
+
+        Returns:
+            tuple: ({폴더: (item, mtime, meta_mtime)}, {상위 폴더: 하위 폴더 set}).
+        """
+        known = {}
+        children = {}
+        for path, parent, item, mtime, meta_mtime in conn.execute(
+                "SELECT path, parent, item, mtime, meta_mtime FROM files WHERE is_dir = 1"):
+            known[path] = (item, mtime, meta_mtime)
+            if path:
+                children.setdefault(parent, set()).add(path)
+        return known, children
+
+    def _delete_subtree(self, conn, rel_dir):
+        """사라진 폴더와 그 아래 모든 항목 삭제 (경로 범위 조회라 기본 키 색인을 탐)"""
+        prefix = rel_dir + os.sep
+        upper = rel_dir + chr(ord(os.sep) + 1)
+        conn.execute("DELETE FROM files WHERE path = ? OR (path > ? AND path < ?)", (rel_dir, prefix, upper))
+
+    def _scan_tree(self, rel_root, root_stat, parent_item, known, children, full):
+        """
+        하위 트리 하나를 훑습니다 (작업 스레드에서 실행).
+
+        Returns:
+            tuple: (쓸 행 리스트, 파일 목록을 다시 쓸 폴더 리스트, 사라진 폴더 리스트).
+        """
+        rows, cleared, removed = [], [], []
+        stack = [(rel_root, root_stat, parent_item)]
+        while stack:
+            rel_dir, stat, item = stack.pop()
+            stack.extend(self._scan_dir(rel_dir, stat, item, known, children, full, rows, cleared, removed))
+        return rows, cleared, removed
+
+    def _scan_dir(self, rel_dir, stat, parent_item, known, children, full, rows, cleared, removed):
+        """
+        폴더 하나를 처리하고 하위 폴더 목록을 반환합니다.
+        바뀌지 않은 폴더는 목록을 읽지 않고 카탈로그의 하위 폴더만 확인합니다.
+
+        Returns:
+            list: [(하위 폴더 상대 경로, stat 결과, 속한 아이템 폴더)].
+        """
+        dir_path = self.abs_path(rel_dir) if rel_dir else self.base_path
+        old = known.get(rel_dir)
+        # 위쪽 아이템 폴더가 바뀐 경우(.meta.json 추가/삭제)에는 소속을 다시 계산해야 하므로 다시 읽음
+        if (not full and old is not None and old[1] == stat.st_mtime
+                and (old[0] == rel_dir or old[0] == parent_item)):
+            item = old[0]
+            if item == rel_dir:
+                # 제자리에서 고친 .meta.json은 폴더 수정 시간을 바꾸지 않으므로 직접 확인
+                meta_mtime = self._meta_mtime(dir_path)
+                if meta_mtime != old[2]:
+                    rows.append(self._dir_row(rel_dir, stat, item, meta_mtime))
+            subdirs = []
+            for child in children.get(rel_dir, ()):
+                try:
+                    subdirs.append((child, os.stat(self.abs_path(child)), item))
+                except OSError:
+                    continue  # 사라졌다면 상위 폴더 수정 시간도 바뀌므로 다음 갱신에서 정리
+            return subdirs
+
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError as e:
+            print(f"카탈로그 탐색 오류 {dir_path}: {e}")
+            return []
+        meta_mtime = None
+        item = parent_item
+        # .meta.json이 있는 폴더부터는 그 안의 모든 항목이 이 아이템에 속함
+        if rel_dir and any(entry.name == META_FILE_NAME for entry in entries):
+            item = rel_dir
+            meta_mtime = self._meta_mtime(dir_path)
+        rows.append(self._dir_row(rel_dir, stat, item, meta_mtime))
+        cleared.append(rel_dir)
+
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            if name in HIDDEN_FILES or name.startswith('.'):
+                continue
+            rel_path = os.path.join(rel_dir, name) if rel_dir else name
+            try:
+                is_dir = entry.is_dir()
+                entry_stat = entry.stat()
+            except OSError:
+                continue
+            if is_dir:
+                subdirs.append((rel_path, entry_stat, item))
+            else:
+                rows.append((rel_path, rel_dir, item, name, fold_text(name),
+                             normalize_extension(os.path.splitext(name)[1]), 0, entry_stat.st_size,
+                             entry_stat.st_mtime, entry_stat.st_ctime, entry_stat.st_atime, None))
+        current = {rel_path for rel_path, _, _ in subdirs}
+        removed.extend(children.get(rel_dir, set()) - current)
+        return subdirs
+
+    def _dir_row(self, rel_dir, stat, item, meta_mtime):
+        name = os.path.basename(rel_dir)
+        return (rel_dir, os.path.dirname(rel_dir), item, name, fold_text(name), "", 1, None,
+                stat.st_mtime, stat.st_ctime, stat.st_atime, meta_mtime)
+
+    def _meta_mtime(self, dir_path):
+        try:
+            return os.stat(os.path.join(dir_path, META_FILE_NAME)).st_mtime
+        except OSError:
+            return None
+
+    # --- 폴더 조회 ---
+    def folders(self):
+        """카탈로그의 모든 폴더 (base_path 기준 상대 경로, 경로순)"""
+        return [path for (path,) in self._connection().execute(
+            "SELECT path FROM files WHERE is_dir = 1 AND path != '' ORDER BY path")]
+
+    def entries(self):
+        """
+        카탈로그의 모든 파일/폴더 (검색 색인 생성용).
+
+        Returns:
+            list: (절대 경로, 이름, 폴더 여부) 튜플 리스트.
+        """
+        prefix = self.base_path + os.sep  # 카탈로그 경로는 이미 정규화되어 있음
+        return [(prefix + path, name, bool(is_dir)) for path, name, is_dir in self._connection().execute(
+            "SELECT path, name, is_dir FROM files WHERE path != ''")]
+
+    def items_with_extension(self, ext, prefix=False):
+        """
+        확장자가 ext인 (prefix면 ext로 시작하는) 파일을 가진 아이템 폴더 (태그 질의의 ext: 조건).
+
+        Returns:
+            list: 아이템 폴더 절대 경로 리스트.
+        """
+        ext = normalize_extension(ext)
+        if prefix:
+            rows = self._connection().execute(
+                "SELECT DISTINCT item FROM files WHERE ext >= ? AND ext < ? AND is_dir = 0 AND item IS NOT NULL",
+                (ext, ext + "\uffff"))
+        else:
+            rows = self._connection().execute(
+                "SELECT DISTINCT item FROM files WHERE ext = ? AND is_dir = 0 AND item IS NOT NULL", (ext,))
+        return [self.abs_path(item) for (item,) in rows]
+
+    def items_with_size(self, low=None, high=None):
+        """
+        크기가 low 이상 high 이하인 파일을 가진 아이템 폴더 (태그 질의의 size: 조건, 바이트 단위).
+
+        Returns:
+            list: 아이템 폴더 절대 경로 리스트.
+        """
+        rows = self._connection().execute(
+            "SELECT DISTINCT item FROM files WHERE size >= ? AND size <= ? AND item IS NOT NULL",
+            (0 if low is None else low, (1 << 62) if high is None else high))
+        return [self.abs_path(item) for (item,) in rows]
+
+    def item_sidecars(self):
+        """
+        .meta.json이 있는 폴더와 그 수정 시간 (메타데이터 저장소 동기화용).
+
+        Returns:
+            dict: {아이템 폴더 절대 경로: .meta.json 수정 시간}.
+        """
+        return {self.abs_path(path): meta_mtime for path, meta_mtime in self._connection().execute(
+            "SELECT path, meta_mtime FROM files WHERE meta_mtime IS NOT NULL")}
+
+    # --- 검색 ---
+    def search(self, criteria, batch_size=FETCH_BATCH_SIZE):
+        """
+        고급 검색 조건에 맞는 파일을 묶음 단위로 생성합니다 (정렬하지 않음).
+
+        Yields:
+            list: (절대 경로, 이름, 크기, 수정 시간) 튜플 리스트.
+        """
+        where, params = build_query(criteria)
+        cursor = self._connection().execute(f"SELECT path, name, size, mtime FROM files WHERE {where}", params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield [(self.abs_path(rel_path), name, size, mtime) for rel_path, name, size, mtime in rows]
@@ -0,0 +1,83 @@
+import os
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from widgets import find_folder_cover, EMPTY_FOLDER_IMAGE
+
+# 결과를 나누어 전달하는 단위 (첫 화면이 목록 전체를 기다리지 않도록)
+RESOLVE_CHUNK_SIZE = 64
+
+
+class CoverResolveSignals(QObject):
+    resolved = Signal(int, dict)  # generation, {folder_path: (mtime, cover_path)}
+
+
+class CoverResolveJob(QRunnable):
+    """폴더 목록의 커버 이미지를 한 번에 찾는 작업 (수정 시간이 같은 폴더는 다시 읽지 않음)"""
+    def __init__(self, generation, entries, signals):
+        super().__init__()
+        self.generation = generation
+        self.entries = entries  # [(folder_path, 캐시된 (mtime, cover_path) 또는 None)]
+        self.signals = signals
+
+    def run(self):
+        results = {}
+        for folder_path, cached in self.entries:
+            try:
+                mtime = os.stat(folder_path).st_mtime
+                if cached is not None and cached[0] == mtime:
+                    results[folder_path] = cached
+                else:
+                    # 이미지가 없으면 빈폴더.png 사용
+                    results[folder_path] = (mtime, find_folder_cover(folder_path) or EMPTY_FOLDER_IMAGE)
+            except OSError as e:
+                print(f"썸네일 검색 오류 ({folder_path}): {e}")
+                results[folder_path] = (None, None)
+
+            if len(results) >= RESOLVE_CHUNK_SIZE:
+                self.signals.resolved.emit(self.generation, results)
+                results = {}
+
+        if results:
+            self.signals.resolved.emit(self.generation, results)
+
+
+class FolderCoverCache(QObject):
+    """
+    폴더별 커버 이미지 경로를 기억하는 캐시.
+    폴더 수정 시간이 바뀌면 (파일 추가/삭제/이름 변경) 다시 찾고,
+    목록 전체를 백그라운드 스레드에서 한 번에 처리합니다.
+    """
+    covers_resolved = Signal(dict)  # {folder_path: cover_path} (현재 요청분만)
+
+    def __init__(self, thread_pool=None, parent=None):
+        super().__init__(parent)
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self._covers = {}  # folder_path -> (mtime, cover_path)
+        self._generation = 0
+
+        self._signals = CoverResolveSignals()
+        self._signals.resolved.connect(self._on_resolved)
+
+    def get(self, folder_path):
+        """캐시된 커버 경로 (검증 전 값일 수 있음). 없으면 None."""
+        entry = self._covers.get(folder_path)
+        return entry[1] if entry else None
+
+    def resolve(self, folder_paths, append=False):
+        """
+        폴더 목록의 커버를 백그라운드에서 찾습니다.
+        append가 False면 새 목록으로 간주하여, 이전 resolve 요청의 결과는
+        캐시에만 반영되고 covers_resolved로 전달되지 않습니다.
+        append가 True면 현재 목록에 이어지는 폴더들로 취급합니다 (목록을 나누어 읽는 경우).
+        """
+        if not append:
+            self._generation += 1
+        if not folder_paths:
+            return
+        entries = [(path, self._covers.get(path)) for path in folder_paths]
+        self.thread_pool.start(CoverResolveJob(self._generation, entries, self._signals))
+
+    def _on_resolved(self, generation, results):
+        self._covers.update(results)
+        if generation == self._generation:
+            self.covers_resolved.emit({path: entry[1] for path, entry in results.items()})
@@ -0,0 +1,91 @@
+import os
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from metadata_store import META_FILE_NAME
+
+# 결과를 나누어 전달하는 단위 (첫 화면이 목록 전체를 기다리지 않도록)
+LOAD_CHUNK_SIZE = 256
+
+
+class TagLoadSignals(QObject):
+    loaded = Signal(int, dict)  # generation, {folder_path: (meta_mtime, tags)}
+
+
+class TagLoadJob(QRunnable):
+    """
+    폴더 목록의 태그를 한 번에 읽는 작업.
+    메타 파일 수정 시간이 캐시와 같은 폴더는 건너뛰고, 나머지는 묶어서 저장소에 한 번에 조회합니다.
+    """
+    def __init__(self, generation, entries, data_manager, signals):
+        super().__init__()
+        self.generation = generation
+        self.entries = entries  # [(folder_path, 캐시된 (meta_mtime, tags) 또는 None)]
+        self.data_manager = data_manager
+        self.signals = signals
+
+    def run(self):
+        for start in range(0, len(self.entries), LOAD_CHUNK_SIZE):
+            results = {}
+            to_load = {}
+            for folder_path, cached in self.entries[start:start + LOAD_CHUNK_SIZE]:
+                try:
+                    meta_mtime = os.stat(os.path.join(folder_path, META_FILE_NAME)).st_mtime
+                except OSError:
+                    meta_mtime = None  # 메타 파일 없음 (저장소에 남은 태그가 있으면 사용)
+                if cached is not None and cached[0] == meta_mtime:
+                    results[folder_path] = cached
+                else:
+                    to_load[folder_path] = meta_mtime
+
+            if to_load:
+                tags_by_path = self.data_manager.load_tags_batch(list(to_load))
+                for folder_path, meta_mtime in to_load.items():
+                    results[folder_path] = (meta_mtime, tags_by_path.get(folder_path, []))
+            self.signals.loaded.emit(self.generation, results)
+
+
+class FolderTagCache(QObject):
+    """
+    폴더별 태그를 기억하는 캐시.
+    메타 파일(.meta.json) 수정 시간이 바뀐 폴더만 다시 읽고,
+    목록 전체를 백그라운드 스레드에서 묶음으로 처리하여 한꺼번에 전달합니다.
+    """
+    tags_loaded = Signal(dict)  # {folder_path: tags} (현재 요청분만)
+
+    def __init__(self, data_manager, thread_pool=None, parent=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self._tags = {}  # folder_path -> (meta_mtime, tags)
+        self._generation = 0
+
+        self._signals = TagLoadSignals()
+        self._signals.loaded.connect(self._on_loaded)
+
+    def get(self, folder_path):
+        """캐시된 태그 (검증 전 값일 수 있음). 없으면 None."""
+        entry = self._tags.get(folder_path)
+        return entry[1] if entry else None
+
+    def load(self, folder_paths, append=False):
+        """
+        폴더 목록의 태그를 백그라운드에서 읽습니다.
+        append가 False면 새 목록으로 간주하여, 이전 load 요청의 결과는
+        캐시에만 반영되고 tags_loaded로 전달되지 않습니다.
+        append가 True면 현재 목록에 이어지는 폴더들로 취급합니다 (목록을 나누어 읽는 경우).
+        """
+        if not append:
+            self._generation += 1
+        if not folder_paths:
+            return
+        entries = [(path, self._tags.get(path)) for path in folder_paths]
+        self.thread_pool.start(TagLoadJob(self._generation, entries, self.data_manager, self._signals))
+
+    def invalidate(self, folder_path):
+        """폴더의 캐시된 태그를 버림 (다음 load에서 다시 읽음)"""
+        self._tags.pop(folder_path, None)
+
+    def _on_loaded(self, generation, results):
+        self._tags.update(results)
+        if generation == self._generation:
+            self.tags_loaded.emit({path: entry[1] for path, entry in results.items()})
@@ -0,0 +1,214 @@
+import os
+import re
+import heapq
+import operator
+import threading
+from array import array
+from collections import Counter
+
+from text_utils import fold_text
+
+# 단어 시작 표시 (접두어 일치용 n-gram: "\x02a")
+WORD_START = "\x02"
+# 이 비율 이상의 n-gram이 겹치면 후보로 봄 (오타 하나 정도 허용)
+MIN_SIMILARITY = 0.5
+# 검색어에서 사용할 n-gram 최대 수 (포스팅이 짧은 것부터, 긴 검색어는 이것만으로도 충분히 좁혀짐)
+MAX_QUERY_GRAMS = 12
+# 반환할 최대 결과 수
+MAX_RESULTS = 500
+# 지운 문서가 이 비율을 넘으면 포스팅을 다시 만듦
+COMPACT_RATIO = 0.25
+
+_WORDS = re.compile(r"\w+")
+
+
+def text_grams(folded_text):
+    """
+    접힌 문자열의 검색용 n-gram 집합.
+    한국어/일본어 단어는 두 글자인 경우가 많아 2-gram을 쓰고,
+    단어 첫 글자에는 시작 표시를 붙여 한 글자 검색어도 단어 접두어로 찾을 수 있게 합니다.
+    """
+    grams = set()
+    for word in _WORDS.findall(folded_text):
+        grams.add(WORD_START + word[0])
+        grams.update(map(operator.add, word, word[1:]))
+    return grams
+
+
+class FuzzyIndex:
+    """
+    폴더/파일 이름, 태그, Booth 상품 제목/상점 이름에 대한 n-gram 색인 (메모리).
+    파일 카탈로그(FileCatalog)와 메타데이터 저장소(MetadataStore)에서 만들며,
+    refresh()는 바뀐 문서만 다시 색인합니다.
+
+    검색은 겹치는 n-gram 수로 후보를 고르고 (오타/부분 일치 허용),
+    이름 완전 포함 > 접두어 > 태그/제목 포함 > n-gram 유사도 순으로 순위를 매깁니다.
+    포스팅은 문서 번호의 array로 저장하여 10만 개 규모에서도 메모리를 적게 씁니다.
+    """
+    def __init__(self, catalog, store):
+        self.catalog = catalog
+        self.store = store
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._reset()
+
+    def _reset(self):
+        self._postings = {}     # n-gram -> array('I') 문서 번호 (오름차순)
+        self._paths = []        # 문서 번호 -> 절대 경로 (지운 문서는 None)
+        self._is_dir = bytearray()
+        self._names = []        # 문서 번호 -> 접힌 이름
+        self._extras = []       # 문서 번호 -> 접힌 태그/제목/상점 (줄바꿈으로 구분)
+        self._ids = {}          # 절대 경로 -> 문서 번호
+        self._dead = 0
+
+    # --- 검색 ---
+    def search(self, query, limit=MAX_RESULTS):
+        """
+        검색어와 비슷한 이름/태그/제목을 가진 폴더와 파일.
+
+        Returns:
+            list: (절대 경로, 폴더 여부) 튜플 리스트 (관련도순).
+        """
+        folded = fold_text(query).strip()
+        query_grams = text_grams(folded)
+        if not query_grams:
+            return []
+        self.ensure_loaded()
+        with self._lock:
+            postings = sorted((self._postings.get(gram, ()) for gram in query_grams), key=len)
+            postings = postings[:MAX_QUERY_GRAMS]
+            min_count = max(1, round(len(postings) * MIN_SIMILARITY))
+            counts = Counter()
+            for posting in postings:
+                counts.update(posting)
+
+            words = _WORDS.findall(folded)
+            total = len(postings)
+            scored = []
+            for doc_id, count in counts.items():
+                if count < min_count:
+                    continue
+                name = self._names[doc_id]
+                if name is None:
+                    continue
+                score = count / total
+                if folded in name:
+                    score += 2.0 if name.startswith(folded) else 1.5
+                elif all(word in name for word in words):
+                    score += 1.0
+                elif folded in self._extras[doc_id]:
+                    score += 0.75
+                scored.append((score, -len(name), doc_id))
+
+            best = heapq.nlargest(limit, scored)
+            return [(self._paths[doc_id], bool(self._is_dir[doc_id])) for _, _, doc_id in best]
+
+    @property
+    def loaded(self):
+        """색인이 만들어졌는지 (GUI 스레드에서는 만들어진 뒤에만 검색)"""
+        return self._loaded
+
+    # --- 갱신 ---
+    def ensure_loaded(self):
+        """처음 사용할 때 색인을 만듭니다."""
+        with self._lock:
+            if not self._loaded:
+                self.refresh()
+
+    def refresh(self):
+        """
+        카탈로그/저장소와 비교하여 추가/삭제/변경된 문서만 다시 색인합니다 (백그라운드 호출용).
+
+        Returns:
+            int: 다시 색인한 문서 수.
+        """
+        documents = self._collect_documents()
+        with self._lock:
+            changed = 0
+            for path in [path for path in self._ids if path not in documents]:
+                self._remove(path)
+                changed += 1
+            for path, (name, is_dir, extra) in documents.items():
+                doc_id = self._ids.get(path)
+                if doc_id is not None and self._extras[doc_id] == extra:
+                    continue
+                self._remove(path)
+                self._add(path, name, is_dir, extra)
+                changed += 1
+            self._loaded = True
+            self._compact_if_needed()
+            return changed
+
+    def update_item(self, item_path):
+        """한 아이템 폴더의 태그/제목 변경 반영 (태그 저장 직후 호출)"""
+        if not self._loaded:
+            return  # 처음 사용할 때 만들어짐
+        item_path = os.path.normpath(item_path)
+        info = self.store.get_item(item_path) or {}
+        extra = self._extra_text(info.get("tags", []), info.get("title"), info.get("shop"))
+        with self._lock:
+            doc_id = self._ids.get(item_path)
+            if doc_id is None or self._extras[doc_id] == extra:
+                return
+            name, is_dir = self._names[doc_id], self._is_dir[doc_id]
+            self._remove(item_path)
+            self._add(item_path, name, is_dir, extra, folded=True)
+            self._compact_if_needed()
+
+    # --- 내부 ---
+    def _collect_documents(self):
+        """{절대 경로: (이름, 폴더 여부, 접힌 태그/제목/상점)}"""
+        tags_by_path = {}
+        for path, tag in self.store.all_tags():
+            tags_by_path.setdefault(path, []).append(tag)
+        info_by_path = {path: (title, shop) for path, title, shop in self.store.all_items()}
+
+        documents = {}
+        for path, name, is_dir in self.catalog.entries():
+            extra = ""
+            if is_dir:
+                title, shop = info_by_path.get(path, (None, None))
+                extra = self._extra_text(tags_by_path.get(path, ()), title, shop)
+            documents[path] = (name, is_dir, extra)
+        return documents
+
+    def _extra_text(self, tags, title, shop):
+        return "\n".join(fold_text(text) for text in (*sorted(tags), title, shop) if text)
+
+    def _add(self, path, name, is_dir, extra, folded=False):
+        """문서 추가 (잠금을 잡은 상태에서 호출)"""
+        doc_id = len(self._paths)
+        name = name if folded else fold_text(name)
+        self._paths.append(path)
+        self._is_dir.append(1 if is_dir else 0)
+        self._names.append(name)
+        self._extras.append(extra)
+        self._ids[path] = doc_id
+        grams = text_grams(name)
+        if extra:
+            grams |= text_grams(extra)
+        postings = self._postings
+        for gram in grams:
+            posting = postings.get(gram)
+            if posting is None:
+                posting = postings[gram] = array('I')
+            posting.append(doc_id)
+
+    def _remove(self, path):
+        """문서 삭제 표시 (포스팅에서는 압축할 때 빠짐, 잠금을 잡은 상태에서 호출)"""
+        doc_id = self._ids.pop(path, None)
+        if doc_id is None:
+            return
+        self._paths[doc_id] = None
+        self._names[doc_id] = None
+        self._extras[doc_id] = None
+        self._dead += 1
+
+    def _compact_if_needed(self):
+        if self._dead <= len(self._paths) * COMPACT_RATIO:
+            return
+        alive = [(path, self._names[doc_id], self._is_dir[doc_id], self._extras[doc_id])
+                 for path, doc_id in self._ids.items()]
+        self._reset()
+        for path, name, is_dir, extra in alive:
+            self._add(path, name, is_dir, extra, folded=True)
@@ -0,0 +1,582 @@
+import os
+import sys
+import heapq
+import subprocess
+from collections import OrderedDict
+from PySide6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PySide6.QtCore import (Qt, QAbstractListModel, QModelIndex, QSize, QRect, QPoint, QMimeData,
+                            QUrl, QEvent, Signal)
+from PySide6.QtGui import QPixmap, QImage, QPainter, QPainterPath, QColor, QPen, QDrag, QFontMetrics
+
+from widgets import THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT, ITEM_WIDGET_WIDTH, ITEM_WIDGET_HEIGHT, IMAGE_EXTENSIONS
+from data_manager import matches_filter
+
+# 아이템 셀 사이 간격
+ITEM_SPACING = 10
+# 모델이 보관하는 썸네일 픽스맵 수 (밀려난 것은 썸네일 캐시에서 다시 불러옴)
+MAX_THUMBNAIL_PIXMAPS = 400
+# 삭제할 행이 이보다 많은 구간으로 흩어져 있으면 구간별 삭제 대신 모델을 한 번에 갱신
+MAX_REMOVE_RANGES = 32
+
+# 모델 데이터 역할
+PathRole = Qt.UserRole + 1
+IsDirRole = Qt.UserRole + 2
+TagsRole = Qt.UserRole + 3
+IsImageRole = Qt.UserRole + 4
+
+
+def is_image_file(name):
+    """썸네일을 만들 수 있는 이미지 파일인지 확인"""
+    return os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS
+
+
+def make_folder_icon():
+    """커버 이미지가 없는 폴더용 기본 아이콘"""
+    folder_icon = QImage(THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT, QImage.Format_ARGB32)
+    folder_icon.fill(Qt.transparent)
+    painter = QPainter(folder_icon)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(100, 100, 100))
+    painter.drawRoundedRect(10, 10, THUMBNAIL_WIDTH - 20, 30, 5, 5)
+    painter.drawRoundedRect(5, 25, THUMBNAIL_WIDTH - 10, THUMBNAIL_HEIGHT - 30, 5, 5)
+    painter.end()
+    return folder_icon
+
+
+def rounded_pixmap(image):
+    """썸네일 크기에 맞춰 축소하고 모서리를 둥글게 처리한 픽스맵"""
+    pixmap = QPixmap.fromImage(image) if isinstance(image, QImage) else image
+    pixmap = pixmap.scaled(THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    result = QPixmap(pixmap.size())
+    result.fill(Qt.transparent)
+    painter = QPainter(result)
+    painter.setRenderHint(QPainter.Antialiasing)
+    path = QPainterPath()
+    path.addRoundedRect(0, 0, pixmap.width(), pixmap.height(), 10, 10)
+    painter.setClipPath(path)
+    painter.drawPixmap(0, 0, pixmap)
+    painter.end()
+    return result
+
+
+def reveal_in_file_manager(path):
+    """운영체제 기본 탐색기에서 파일 위치 열기/선택"""
+    try:
+        if sys.platform == 'win32':
+            # Windows: explorer /select, "파일경로"
+            subprocess.Popen(['explorer', '/select,', os.path.normpath(path)])
+        elif sys.platform == 'darwin':
+            # macOS: open -R "파일경로"
+            subprocess.Popen(['open', '-R', path])
+        else:
+            # Linux: xdg-open "파일경로"
+            subprocess.Popen(['xdg-open', path])
+    except Exception as e:
+        print(f"탐색기에서 아이템 열기/선택 오류: {e}")
+
+
+class ItemListModel(QAbstractListModel):
+    """
+    콘텐츠 영역의 아이템(폴더/파일) 목록 모델.
+    아이템 정보는 DataManager가 만든 DirectoryItem을 그대로 사용하고,
+    썸네일/커버/태그는 필요할 때(보이는 시점에) 채워집니다.
+    이름 필터는 읽어 둔 전체 목록 중 일부만 행으로 노출하는 방식으로 모델 안에서 처리합니다.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._all_items = []                 # 읽어 둔 전체 아이템 (정렬 순서)
+        self._paths = set()                  # 전체 아이템 경로
+        self._filter = ""                    # 현재 이름 필터 (fold_text 적용)
+        self._items = []                     # 필터를 통과한 아이템 (= 모델의 행)
+        self._rows = {}                      # path -> row
+        self._pixmaps = OrderedDict()        # path -> QPixmap (LRU)
+        self._covers = {}                    # 폴더 path -> 커버 이미지 경로 (None: 커버 없음)
+        self._tags = {}                      # 폴더 path -> 태그 리스트
+
+    # --- QAbstractListModel 구현 ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._items):
+            return None
+        item = self._items[index.row()]
+        path = item.path
+        if role == Qt.DisplayRole:
+            return item.name
+        if role == Qt.DecorationRole:
+            return self._pixmaps.get(path)
+        if role == Qt.ToolTipRole:
+            if item.is_dir:
+                tags = self._tags.get(path)
+                return ", ".join(tags) if tags else None
+            return f"{item.name}\n{path}"
+        if role == PathRole:
+            return path
+        if role == IsDirRole:
+            return item.is_dir
+        if role == TagsRole:
+            return self._tags.get(path)
+        if role == IsImageRole:
+            return not item.is_dir and is_image_file(item.name)
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    def mimeTypes(self):
+        return ["text/uri-list", "text/plain"]
+
+    def mimeData(self, indexes):
+        """드래그 데이터: 로컬 파일 URL (호환성을 위해 텍스트 경로도 설정)"""
+        paths = [self._items[index.row()].path for index in indexes if index.isValid()]
+        mime_data = QMimeData()
+        mime_data.setUrls([QUrl.fromLocalFile(path) for path in paths])
+        mime_data.setText("\n".join(paths))
+        return mime_data
+
+    # --- 아이템 목록 ---
+    def set_items(self, items):
+        """표시할 아이템 목록 교체 (썸네일/커버/태그 상태도 초기화, 현재 필터는 유지)"""
+        self.beginResetModel()
+        self._all_items = list(items)
+        self._paths = {item.path for item in self._all_items}
+        self._items = [item for item in self._all_items if matches_filter(item, self._filter)]
+        self._rows = {item.path: row for row, item in enumerate(self._items)}
+        self._pixmaps.clear()
+        self._covers.clear()
+        self._tags.clear()
+        self.endResetModel()
+
+    def clear(self):
+        self.set_items([])
+
+    def add_items(self, items, key=None, reverse=False):
+        """
+        목록 읽기 중 도착한 아이템 묶음을 추가합니다 (필터에 맞지 않는 아이템은 숨긴 채 보관).
+        key가 있으면 기존 정렬 순서를 유지하도록 병합합니다 (이미 만든 썸네일/태그는 유지).
+        """
+        if not items:
+            return
+        if key is not None:
+            items = sorted(items, key=key, reverse=reverse)
+            self._all_items = list(heapq.merge(self._all_items, items, key=key, reverse=reverse))
+        else:
+            self._all_items.extend(items)
+        self._paths.update(item.path for item in items)
+
+        shown = [item for item in items if matches_filter(item, self._filter)]
+        if not shown:
+            return
+        start = len(self._items)
+        self.beginInsertRows(QModelIndex(), start, start + len(shown) - 1)
+        self._items.extend(shown)
+        for row in range(start, len(self._items)):
+            self._rows[self._items[row].path] = row
+        self.endInsertRows()
+
+        if key is not None:
+            self._reorder(list(heapq.merge(self._items[:start], shown, key=key, reverse=reverse)))
+
+    def sort_items(self, key, reverse=False):
+        """현재 목록을 다시 정렬합니다 (목록을 다시 읽지 않음)."""
+        self._all_items.sort(key=key, reverse=reverse)
+        self._reorder(sorted(self._items, key=key, reverse=reverse))
+
+    def set_filter(self, folded_filter):
+        """
+        읽어 둔 목록에 이름 필터를 적용합니다 (디렉토리를 다시 읽지 않음).
+        새 필터가 이전 필터를 포함하면 (입력을 이어서 친 경우) 현재 결과 안에서만 다시 거릅니다.
+
+        Args:
+            folded_filter (str): fold_text로 접은 필터 문자열 (빈 문자열이면 전체 표시).
+
+        Returns:
+            bool: 표시 목록이 바뀌었는지 여부.
+        """
+        if folded_filter == self._filter:
+            return False
+        source = self._items if self._filter in folded_filter else self._all_items
+        self._filter = folded_filter
+        self.beginResetModel()
+        self._items = [item for item in source if matches_filter(item, folded_filter)]
+        self._rows = {item.path: row for row, item in enumerate(self._items)}
+        self.endResetModel()
+        return True
+
+    def sync_items(self, items, key=None, reverse=False):
+        """
+        다시 읽은 전체 목록과 비교하여 바뀐 부분만 반영합니다 (디렉토리 변경 감시용).
+        새 아이템은 추가하고 사라진 아이템은 삭제하며, 수정 시간/크기가 바뀐 아이템은 교체한 뒤
+        썸네일/커버/태그를 비워 다시 불러오게 합니다. 이름 변경은 삭제 + 추가로 처리됩니다.
+
+        Returns:
+            tuple: (추가된 아이템 리스트, 삭제된 경로 수, 변경된 아이템 리스트)
+        """
+        current = {item.path: item for item in self._all_items}
+        fresh = {item.path: item for item in items}
+        # 폴더 <-> 파일로 바뀐 경로는 삭제 후 추가로 처리
+        removed = {path for path, item in current.items()
+                   if path not in fresh or fresh[path].is_dir != item.is_dir}
+        added = [item for item in items if item.path not in current or item.path in removed]
+        updated = {path: item for path, item in fresh.items()
+                   if path in current and path not in removed
+                   and (item.mtime != current[path].mtime or item.size != current[path].size)}
+
+        if removed:
+            self._remove_paths(removed)
+        if updated:
+            self._replace_items(updated, key, reverse)
+        if added:
+            self.add_items(added, key, reverse)
+        return added, len(removed), list(updated.values())
+
+    def _forget(self, path):
+        self._pixmaps.pop(path, None)
+        self._covers.pop(path, None)
+        self._tags.pop(path, None)
+
+    def _remove_paths(self, paths):
+        """경로 집합에 해당하는 아이템 삭제 (연속된 행은 한 번에)"""
+        self._all_items = [item for item in self._all_items if item.path not in paths]
+        self._paths -= paths
+        for path in paths:
+            self._forget(path)
+
+        # 뒤쪽 구간부터 지워야 앞쪽 행 번호가 바뀌지 않음
+        rows = sorted((self._rows[path] for path in paths if path in self._rows), reverse=True)
+        ranges = []
+        for row in rows:
+            if ranges and ranges[-1][0] == row + 1:
+                ranges[-1][0] = row
+            else:
+                ranges.append([row, row])
+
+        if len(ranges) > MAX_REMOVE_RANGES:
+            self.beginResetModel()
+            self._items = [item for item in self._items if item.path not in paths]
+            self._rows = {item.path: row for row, item in enumerate(self._items)}
+            self.endResetModel()
+            return
+        for first, last in ranges:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._items[first:last + 1]
+            self.endRemoveRows()
+        self._rows = {item.path: row for row, item in enumerate(self._items)}
+
+    def _replace_items(self, updated, key=None, reverse=False):
+        """같은 경로의 아이템 정보를 새 것으로 교체하고 (정렬 기준이 바뀔 수 있으므로) 다시 정렬"""
+        self._all_items = [updated.get(item.path, item) for item in self._all_items]
+        for path, new_item in updated.items():
+            self._forget(path)
+            row = self._rows.get(path)
+            if row is not None:
+                self._items[row] = new_item
+                self._emit_changed(path)
+        if key is not None:
+            self.sort_items(key, reverse)
+
+    def _reorder(self, new_items):
+        """같은 아이템의 순서만 바꿉니다 (선택 등 영구 인덱스 유지)."""
+        self.layoutAboutToBeChanged.emit()
+        old_items = self._items
+        self._items = new_items
+        self._rows = {item.path: row for row, item in enumerate(self._items)}
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(self._rows[old_items[index.row()].path]) for index in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def item(self, row):
+        return self._items[row]
+
+    def items(self):
+        """표시 중인 (필터를 통과한) 아이템 목록"""
+        return self._items
+
+    def all_items(self):
+        """필터와 관계없이 읽어 둔 전체 아이템 목록"""
+        return self._all_items
+
+    def row_of(self, path):
+        return self._rows.get(path, -1)
+
+    def _emit_changed(self, path):
+        row = self._rows.get(path)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    # --- 썸네일 ---
+    def has_thumbnail(self, path):
+        return path in self._pixmaps
+
+    def set_thumbnail(self, path, image):
+        """썸네일 설정 (현재 목록에 없는 경로는 무시)"""
+        if path not in self._paths:
+            return
+        self._pixmaps[path] = rounded_pixmap(image)
+        self._pixmaps.move_to_end(path)
+        while len(self._pixmaps) > MAX_THUMBNAIL_PIXMAPS:
+            self._pixmaps.popitem(last=False)
+        self._emit_changed(path)
+
+    def thumbnail(self, path):
+        return self._pixmaps.get(path)
+
+    # --- 폴더 커버 ---
+    def is_cover_resolved(self, path):
+        return path in self._covers
+
+    def cover(self, path):
+        return self._covers.get(path)
+
+    def set_cover(self, path, cover_path):
+        """폴더 커버 경로 설정 (바뀌면 썸네일을 다시 불러오도록 비움)"""
+        if path not in self._paths:
+            return
+        if path in self._covers and self._covers[path] == cover_path:
+            return
+        self._covers[path] = cover_path
+        if self._pixmaps.pop(path, None) is not None:
+            self._emit_changed(path)
+
+    # --- 태그 ---
+    def has_tags(self, path):
+        return path in self._tags
+
+    def set_tags(self, path, tags):
+        if path not in self._paths:
+            return
+        self._tags[path] = tags
+        self._emit_changed(path)
+
+    def set_tags_batch(self, tags_by_path):
+        """여러 폴더의 태그를 한 번에 설정 (바뀐 행 범위에 dataChanged 한 번)"""
+        rows = []
+        for path, tags in tags_by_path.items():
+            if path not in self._paths:
+                continue
+            self._tags[path] = tags
+            row = self._rows.get(path)
+            if row is not None:
+                rows.append(row)
+        if rows:
+            self.dataChanged.emit(self.index(min(rows)), self.index(max(rows)))
+
+
+class ItemDelegate(QStyledItemDelegate):
+    """
+    아이템 셀을 직접 그리는 델리게이트 (보이는 셀만 그려짐).
+    썸네일, 이름, 폴더의 태그 버튼/태그 목록을 표시합니다.
+    """
+    tag_edit_requested = Signal(QModelIndex)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.bg_color = QColor("#FFFFFF")
+        self.text_color = QColor("#000000")
+
+    def set_colors(self, bg_color, text_color):
+        self.bg_color = QColor(bg_color)
+        self.text_color = QColor(text_color)
+
+    def sizeHint(self, option, index):
+        return QSize(ITEM_WIDGET_WIDTH, ITEM_WIDGET_HEIGHT)
+
+    def _card_rect(self, option):
+        """셀 안의 카드 영역 (셀 크기가 격자보다 커도 아이템 크기로 고정)"""
+        return QRect(option.rect.topLeft(), QSize(ITEM_WIDGET_WIDTH, ITEM_WIDGET_HEIGHT))
+
+    def _thumbnail_rect(self, card):
+        return QRect(card.left() + (card.width() - THUMBNAIL_WIDTH) // 2, card.top() + 5,
+                     THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT)
+
+    def _tag_button_rect(self, card):
+        return QRect(card.left() + 8, card.bottom() - 28, 40, 22)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        card = self._card_rect(option)
+
+        # 카드 배경 (선택/호버 시 테두리 강조)
+        border = QColor(self.text_color) if option.state & QStyle.State_Selected else QColor("lightgray")
+        if option.state & QStyle.State_MouseOver and not option.state & QStyle.State_Selected:
+            border = QColor(self.text_color).lighter(160)
+        painter.setPen(QPen(border, 1))
+        painter.setBrush(self.bg_color)
+        painter.drawRoundedRect(card.adjusted(0, 0, -1, -1), 10, 10)
+
+        # 썸네일 (준비되지 않았으면 기본 배경)
+        thumb_rect = self._thumbnail_rect(card)
+        pixmap = index.data(Qt.DecorationRole)
+        if pixmap is not None and not pixmap.isNull():
+            x = thumb_rect.left() + (thumb_rect.width() - pixmap.width()) // 2
+            y = thumb_rect.top() + (thumb_rect.height() - pixmap.height()) // 2
+            painter.drawPixmap(x, y, pixmap)
+        else:
+            painter.setPen(QPen(QColor("lightgray"), 1))
+            painter.setBrush(QColor("#f0f0f0"))
+            painter.drawRoundedRect(thumb_rect, 10, 10)
+            is_dir = index.data(IsDirRole)
+            if not is_dir and not index.data(IsImageRole):
+                # 이미지가 아닌 파일: 확장자와 파일명 표시
+                name = index.data(Qt.DisplayRole)
+                file_ext = os.path.splitext(name)[1].lower()
+                display_text = f"파일 ({file_ext})\n{name[:20]}{'...' if len(name) > 20 else ''}"
+                painter.setPen(QColor("#000000"))
+                painter.drawText(thumb_rect.adjusted(4, 4, -4, -4),
+                                 Qt.AlignCenter | Qt.TextWordWrap, display_text)
+
+        # 이름 (최대 두 줄)
+        painter.setPen(self.text_color)
+        name_rect = QRect(card.left() + 5, thumb_rect.bottom() + 5, card.width() - 10,
+                          2 * option.fontMetrics.height())
+        name = index.data(Qt.DisplayRole)
+        metrics = QFontMetrics(option.font)
+        if metrics.horizontalAdvance(name) > name_rect.width() * 2:
+            name = metrics.elidedText(name, Qt.ElideRight, name_rect.width() * 2 - metrics.averageCharWidth() * 2)
+        painter.drawText(name_rect, Qt.AlignHCenter | Qt.AlignTop | Qt.TextWrapAnywhere, name)
+
+        # 폴더: 태그 버튼과 태그 목록
+        if index.data(IsDirRole):
+            button_rect = self._tag_button_rect(card)
+            painter.setPen(QPen(self.text_color, 1))
+            painter.setBrush(self.bg_color)
+            painter.drawRoundedRect(button_rect, 3, 3)
+            painter.drawText(button_rect, Qt.AlignCenter, "태그")
+
+            tags = index.data(TagsRole)
+            tags_text = ", ".join(tags) if tags else "없음"
+            tags_rect = QRect(button_rect.right() + 5, button_rect.top(),
+                              card.right() - button_rect.right() - 10, button_rect.height())
+            painter.drawText(tags_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                             metrics.elidedText(tags_text, Qt.ElideRight, tags_rect.width()))
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        """태그 버튼 클릭 처리"""
+        if (event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton
+                and index.data(IsDirRole)):
+            if self._tag_button_rect(self._card_rect(option)).contains(event.position().toPoint()):
+                self.tag_edit_requested.emit(index)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class ItemGridView(QListView):
+    """
+    아이템을 격자 형태로 표시하는 가상화된 뷰.
+    QListView의 IconMode를 사용하여 화면에 보이는 셀만 그립니다.
+    """
+    item_activated = Signal(str)        # 더블 클릭한 아이템 경로
+    resized = Signal()                  # 뷰 크기 변경 (창 크기 조절, 스플리터 이동)
+    tag_edit_requested = Signal(str)    # 태그 편집을 요청한 폴더 경로
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setViewMode(QListView.IconMode)
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.Adjust)
+        self.setMovement(QListView.Static)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(200)
+        self.setSpacing(0)
+        self.setGridSize(QSize(ITEM_WIDGET_WIDTH + ITEM_SPACING, ITEM_WIDGET_HEIGHT + ITEM_SPACING))
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setDragEnabled(True)
+        self.setDragDropMode(QAbstractItemView.DragOnly)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep(20)
+        self.setMouseTracking(True)
+
+        # 스크롤 방향 (1: 아래, -1: 위) - 미리 불러오기 방향
+        self.scroll_direction = 1
+        self._last_scroll_value = 0
+        self.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+
+        self.item_delegate = ItemDelegate(self)
+        self.item_delegate.tag_edit_requested.connect(
+            lambda index: self.tag_edit_requested.emit(index.data(PathRole)))
+        self.setItemDelegate(self.item_delegate)
+
+        self.doubleClicked.connect(lambda index: self.item_activated.emit(index.data(PathRole)))
+
+        # 아이템이 없을 때 표시할 안내 문구 ("검색 결과 없음", 경로 오류 등)
+        self.empty_text = ""
+        self.empty_text_color = QColor("gray")
+
+    def set_empty_text(self, text, color="gray"):
+        self.empty_text = text
+        self.empty_text_color = QColor(color)
+        self.viewport().update()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.empty_text and (self.model() is None or self.model().rowCount() == 0):
+            painter = QPainter(self.viewport())
+            painter.setPen(self.empty_text_color)
+            painter.drawText(self.viewport().rect().adjusted(20, 20, -20, -20),
+                             Qt.AlignHCenter | Qt.AlignTop | Qt.TextWordWrap, self.empty_text)
+            painter.end()
+
+    def _on_scrolled(self, value):
+        """마지막 스크롤 방향 기록 (미리 불러오기 방향 결정)"""
+        if value != self._last_scroll_value:
+            self.scroll_direction = 1 if value > self._last_scroll_value else -1
+            self._last_scroll_value = value
+
+    def visible_rows(self, extra_screens=0):
+        """
+        뷰포트에 걸친 행 범위와, 스크롤 방향으로 extra_screens 화면만큼 미리 불러올 행 범위를 반환합니다.
+        균일한 격자이므로 스크롤 위치/격자 크기/열 개수로 계산합니다 (아이템 수와 무관하게 O(1)).
+
+        Returns:
+            tuple: (보이는 행 range, 미리 불러올 행 range (보이는 영역에 가까운 행부터))
+        """
+        count = self.model().rowCount() if self.model() else 0
+        grid = self.gridSize()
+        viewport = self.viewport().rect()
+        columns = max(1, viewport.width() // grid.width())
+        top = self.verticalScrollBar().value()
+
+        first = min((top // grid.height()) * columns, count)
+        last = min(((top + viewport.height()) // grid.height() + 1) * columns, count)
+        prefetch_count = extra_screens * (viewport.height() // grid.height() + 1) * columns
+        visible = range(first, last)
+        if self.scroll_direction < 0 and first > 0:
+            # 위로 스크롤 중이면 위쪽 화면을 가까운 행부터 미리 불러옴 (맨 위에서는 아래쪽)
+            prefetch = range(first - 1, max(first - prefetch_count, 0) - 1, -1)
+        else:
+            prefetch = range(last, min(last + prefetch_count, count))
+        return visible, prefetch
+
+    def resizeEvent(self, event):
+        """크기가 바뀌면 격자만 다시 배치 (ResizeMode.Adjust) 하고 알림"""
+        super().resizeEvent(event)
+        self.resized.emit()
+
+    def startDrag(self, supported_actions):
+        """썸네일을 드래그 아이콘으로 사용하여 드래그 시작"""
+        index = self.currentIndex()
+        if not index.isValid():
+            return
+        drag = QDrag(self)
+        drag.setMimeData(self.model().mimeData([index]))
+
+        pixmap = index.data(Qt.DecorationRole)
+        if pixmap is not None and not pixmap.isNull():
+            # 드래그 아이콘의 핫스팟(마우스 포인터 위치)을 중앙으로 설정
+            drag_pixmap = pixmap.scaled(QSize(80, 80), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            drag.setPixmap(drag_pixmap)
+            drag.setHotSpot(QPoint(drag_pixmap.width() // 2, drag_pixmap.height() // 2))
+
+        drag.exec(Qt.CopyAction | Qt.MoveAction)
@@ -2,20 +2,28 @@ import sys
 import os
 # import json # 더 이상 필요 없음 (No longer needed)
 # import time # 더 이상 필요 없음 (No longer needed)
-import subprocess # 더블 클릭 동작에 필요 (Still needed for double-click action)
 import multiprocessing
-from PySide6.QtCore import Qt, QDir, QModelIndex, QTimer, QRect, QThreadPool, QSize
+from PySide6.QtCore import Qt, QDir, QModelIndex, QTimer, QThreadPool, QSize, QThread
 from PySide6.QtGui import QColor, QPalette, QFont, QFontDatabase
 # BoothManager에 필요한 Qt Widgets 컴포넌트 (Qt Widgets components needed by BoothManager)
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QLabel, QSplitter, QTreeView, QFileSystemModel, QComboBox,
-                             QScrollArea, QGridLayout, QPushButton, QLineEdit, QMessageBox,
+                             QPushButton, QLineEdit, QMessageBox,
                              QTabWidget, QProgressBar, QStyleFactory) # QTabWidget 추가 (Added QTabWidget)
 
 # 새로운 모듈에서 위젯 및 상수 가져오기 (Import widgets and constants from the new module)
-from widgets import FolderItemWidget, FileItemWidget, ITEM_WIDGET_WIDTH, HIDDEN_FILES
+from widgets import TagEditDialog
+from advanced_search import AdvancedSearchDialog
+from search_manager import SearchManager, SEARCH_TYPE_TAG, SEARCH_TYPE_ADVANCED
+from search_save_dialog import SearchSaveDialog
+from search_history_dialog import SearchHistoryDialog
+from tag_cloud_dialog import TagCloudDialog
+from tag_completer import TagCompleter
+from tag_query import QueryError, quote_tag
+from item_view import make_folder_icon, is_image_file, reveal_in_file_manager
 # 새로운 DataManager 가져오기 (Import the new DataManager)
-from data_manager import DataManager
+from data_manager import DataManager, DirectoryItem, SORT_OPTIONS, sort_key
+from text_utils import fold_text
 
 # DownloaderWidget 가져오기 (Import the DownloaderWidget)
 from downloader_widget import DownloaderWidget
@@ -23,13 +31,27 @@ from downloader_widget import DownloaderWidget
 # No longer needed: inline logging config, decorator, and ThumbnailCache class
 from logger_config import handle_exceptions, logger
 from thumbnail_cache import ThumbnailCache
+from thumbnail_scheduler import ThumbnailScheduler, PRIORITY_VISIBLE, PRIORITY_PREFETCH
+from thumbnail_prewarmer import ThumbnailPrewarmer
+from folder_cover_cache import FolderCoverCache
+from folder_tag_cache import FolderTagCache
+from directory_lister import DirectoryLister
+from catalog_search import CatalogSearch
+from directory_watcher import DirectoryWatcher
+from navigation_history import NavigationHistory, ViewState, ListingCache, ListingEntry
 from ui_builder import UIBuilder
 from constants import (FONT_FAMILY, FONT_SIZE, THEME_COLORS, COMMON_STYLES, 
-                      PROGRESS_BAR_STYLE, BORDER_WIDTH) # BORDER_WIDTH 임포트 추가
+                      PROGRESS_BAR_STYLE, BORDER_WIDTH, THUMBNAIL_BACKEND) # BORDER_WIDTH 임포트 추가
 
 import platform
 from PySide6.QtGui import QFont
 
+# 검색 방식 (검색 방식 콤보박스 순서와 같음)
+SEARCH_MODE_TAGS = 0
+SEARCH_MODE_FUZZY = 1
+# 이름/태그 검색 색인을 만드는 중일 때 다시 검색하기까지 대기 시간 (ms)
+FUZZY_INDEX_RETRY_INTERVAL = 500
+
 def get_scaled_font_size(base_size=24):  # constants.py의 FONT_SIZE를 기본값으로 사용
     if platform.system() == 'Windows':
         # Windows의 경우 DPI 설정에 따라 폰트 크기 조정
@@ -119,20 +141,12 @@ class BoothManager(QMainWindow):
         except Exception as e:
             logger.error(f"폰트 로드 중 오류 발생: {str(e)}")
 
-        # 정렬 옵션 정의
-        self.sort_options = {
-            0: ("이름 (오름차순)", lambda x: x["name"].lower()),
-            1: ("이름 (내림차순)", lambda x: x["name"].lower(), True),
-            2: ("날짜 (최신순)", lambda x: x["modified_time"], True),
-            3: ("날짜 (오래된순)", lambda x: x["modified_time"]),
-            4: ("크기 (큰순)", lambda x: x["size"], True),
-            5: ("크기 (작은순)", lambda x: x["size"]),
-            6: ("유형 (폴더 우선)", lambda x: (not x["is_dir"], x["name"].lower())),
-            7: ("유형 (파일 우선)", lambda x: (x["is_dir"], x["name"].lower()))
-        }
+        # 정렬 옵션 정의 (DataManager와 같은 번호 체계 사용)
+        self.sort_options = SORT_OPTIONS
 
         # 테마 색상 정의
         self.theme_colors = THEME_COLORS
+        self._theme_stylesheets = {}  # 테마 이름 -> 스타일시트 (한 번만 생성)
 
         # 스레드 풀 초기화 (CPU 코어 수 - 1)
         thread_pool = QThreadPool.globalInstance()
@@ -164,11 +178,10 @@ class BoothManager(QMainWindow):
 
         # DataManager 초기화
         self.data_manager = DataManager(self.base_path)
+        self.search_manager = SearchManager(self.base_path, parent=self)
+        self._current_search = None        # (검색 종류, 조건): 저장할 수 있는 현재 검색 결과
+        self._pending_result_cache = None  # (저장된 검색 이름, 색인 버전): 고급 검색이 끝나면 결과 캐시
         
-        # 단일 콘텐츠 위젯 설정
-        self.content_widget = QWidget()
-        self.content_widget.setStyleSheet("background-color: transparent;")
-
         # 타이머 초기화
         self._resize_timer = QTimer(self)
         self._resize_timer.setSingleShot(True)
@@ -180,8 +193,66 @@ class BoothManager(QMainWindow):
         self._lazy_load_timer.setInterval(100)
         self._lazy_load_timer.timeout.connect(self._lazy_load_thumbnails)
 
-        # 썸네일 캐시 초기화
+        # 필터 입력 디바운스 (입력이 잠시 멈춘 뒤 한 번만 적용)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(120)
+        self._filter_timer.timeout.connect(self.apply_filter)
+
+        # 이름/태그 검색 디바운스 (입력하는 대로 검색하되 빠른 연속 입력은 합침)
+        self._fuzzy_search_timer = QTimer(self)
+        self._fuzzy_search_timer.setSingleShot(True)
+        self._fuzzy_search_timer.setInterval(80)
+        self._fuzzy_search_timer.timeout.connect(self.fuzzy_search)
+        # 색인이 아직 없으면 만들어질 때까지 잠시 뒤 다시 검색
+        self._fuzzy_retry_timer = QTimer(self)
+        self._fuzzy_retry_timer.setSingleShot(True)
+        self._fuzzy_retry_timer.setInterval(FUZZY_INDEX_RETRY_INTERVAL)
+        self._fuzzy_retry_timer.timeout.connect(self.schedule_fuzzy_search)
+
+        # 썸네일 캐시 및 스케줄러 초기화
         self.thumbnail_cache = ThumbnailCache()
+        self.thumbnail_scheduler = ThumbnailScheduler(self.thumbnail_cache, backend=THUMBNAIL_BACKEND, parent=self)
+
+        # 폴더 커버 이미지 캐시 (목록 단위로 백그라운드에서 검색)
+        self.folder_cover_cache = FolderCoverCache(parent=self)
+        self.folder_cover_cache.covers_resolved.connect(self._on_folder_covers_resolved)
+        self._folder_icon = make_folder_icon()  # 커버 이미지가 없는 폴더용
+
+        # 폴더 태그 캐시 (목록 단위로 백그라운드에서 한 번에 읽어 모델에 일괄 반영)
+        self.folder_tag_cache = FolderTagCache(self.data_manager, parent=self)
+        self.folder_tag_cache.tags_loaded.connect(self._on_folder_tags_loaded)
+
+        # 백그라운드 디렉토리 목록 읽기 (묶음 단위로 점진적으로 표시)
+        self.directory_lister = DirectoryLister(self.data_manager, parent=self)
+        self.directory_lister.batch_ready.connect(self._on_listing_batch)
+        self.directory_lister.finished.connect(self._on_listing_finished)
+        self.directory_lister.rescanned.connect(self._on_directory_rescanned)
+        self._listing_path = self.current_dir_path
+        self._listing_active = False   # 목록 읽기(또는 다시 읽기) 진행 중
+        self._rescan_pending = False   # 읽는 도중 디렉토리가 바뀌어 끝난 뒤 다시 읽어야 함
+
+        self._listing_mtime = None     # 표시 중인 목록을 읽을 때의 디렉토리 수정 시간
+
+        # 고급 검색 (파일 카탈로그 색인 질의, 결과를 묶음 단위로 표시)
+        self.catalog_search = CatalogSearch(self.data_manager.file_catalog, parent=self)
+        self.catalog_search.batch_ready.connect(self._on_catalog_search_batch)
+        self.catalog_search.finished.connect(self._on_catalog_search_finished)
+
+        # 뒤로/앞으로 이동 기록과 최근 디렉토리 목록 캐시 (돌아온 폴더는 다시 읽지 않고 바로 표시)
+        self.navigation_history = NavigationHistory()
+        self.listing_cache = ListingCache()
+        self._pending_scroll = None    # 목록을 다 읽은 뒤 복원할 스크롤 위치 (뒤로/앞으로 이동)
+
+        # 표시 중인 디렉토리 변경 감시 (다운로드/이름 변경 등을 전체 새로고침 없이 반영)
+        self.directory_watcher = DirectoryWatcher(parent=self)
+        self.directory_watcher.changed.connect(self._on_directory_changed)
+        self.directory_watcher.sidecars_changed.connect(self._on_sidecars_changed)
+
+        # 유휴 시간 썸네일 사전 생성기 (사용자 조작/다운로드 중에는 일시정지)
+        self.thumbnail_prewarmer = ThumbnailPrewarmer(self.base_path, self.thumbnail_cache, parent=self)
+        self.thumbnail_prewarmer.progress.connect(self._on_prewarm_progress)
+        self.thumbnail_prewarmer.completed.connect(self._on_prewarm_completed)
 
         # 진행 상태 표시를 위한 변수들
         self.progress_bar = QProgressBar()
@@ -194,29 +265,71 @@ class BoothManager(QMainWindow):
         ui_builder = UIBuilder(self)
         ui_builder.build_main_ui()
 
+        # 검색창 자동 완성 (입력 중인 태그 + 최근 검색어, 최근 검색어를 고르면 바로 검색)
+        self.search_completer = TagCompleter(self.data_manager.tag_stats, self.search_input,
+                                             query_mode=True, history=self.search_manager.history_queries)
+        self.search_completer.query_selected.connect(lambda _: self.perform_search())
+
+        # 스크롤 시 보이는 영역의 썸네일 로드
+        self.item_view.verticalScrollBar().valueChanged.connect(lambda _: self._lazy_load_timer.start())
+        self.item_view.verticalScrollBar().valueChanged.connect(
+            lambda _: self.thumbnail_prewarmer.notify_user_activity())
+        # 뷰 크기가 바뀌면 (창 크기 조절, 스플리터 이동) 재배치 후 보이는 썸네일 로드
+        self.item_view.resized.connect(self._resize_timer.start)
+
+        # 썸네일 사전 생성 진행 상태 표시
+        self.prewarm_label = QLabel()
+        self.statusBar().addPermanentWidget(self.prewarm_label)
+        self.statusBar().setVisible(False)
+
+        # 다운로드 중에는 사전 생성 일시정지
+        self.downloader_widget.download_started.connect(
+            lambda: self.thumbnail_prewarmer.pause(ThumbnailPrewarmer.REASON_DOWNLOAD))
+        self.downloader_widget.download_stopped.connect(
+            lambda: self.thumbnail_prewarmer.resume(ThumbnailPrewarmer.REASON_DOWNLOAD))
+        # 다운로드한 아이템 폴더와 상품 제목/상점을 카탈로그와 검색 색인에 반영 (바뀐 것만 읽음)
+        self.downloader_widget.download_stopped.connect(
+            lambda: QThreadPool.globalInstance().start(self.data_manager.refresh_indexes))
+
         # 초기 테마 설정
         self.change_theme("white")
 
-        # 스크롤 영역에 content_widget을 설정하는 setup_ui 이후 초기 콘텐츠 표시
+        # 아이템 뷰를 만드는 setup_ui 이후 초기 콘텐츠 표시
         self.display_content(self.current_dir_path)
 
+        # 파일 카탈로그와 검색 색인을 백그라운드에서 디스크와 맞춤
+        # (바뀐 폴더/메타 파일만 읽음, 첫 검색 대기 시간 제거)
+        QThreadPool.globalInstance().start(self.data_manager.refresh_indexes)
+
+        # 초기 화면이 안정된 뒤(유휴 상태) 사전 생성 시작
+        self.thumbnail_prewarmer.notify_user_activity()
+        self.thumbnail_prewarmer.start(QThread.LowestPriority)
+
         # 새로운 초기화 부분에 추가
         if hasattr(Qt, 'AA_EnableHighDpiScaling'):
             QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
         if hasattr(Qt, 'AA_UseHighDpiPixmaps'):
             QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
 
+    def closeEvent(self, event):
+        """창 종료 시 썸네일 워커 프로세스 정리 (Shut down thumbnail worker processes on close)"""
+        self.thumbnail_prewarmer.stop()
+        self.thumbnail_scheduler.shutdown()
+        self.search_manager.flush_history(wait=True)
+        super().closeEvent(event)
+
     def resizeEvent(self, event):
         """창 크기 조절 이벤트 처리 (Handle window resize event)"""
         # 타이머를 다시 시작하여 디바운싱 (Restart the timer for debouncing)
         self._resize_timer.start()
+        self.thumbnail_prewarmer.notify_user_activity()
         super().resizeEvent(event) # 기본 이벤트 처리 호출 (Call base event handler)
 
     def handle_resize_finished(self):
         """창 크기 조절 완료 후 처리 (Handle after resize is finished)"""
-        logger.info("Resize finished, updating content layout.")
-        # 현재 경로의 콘텐츠를 다시 표시하여 레이아웃 업데이트 (Re-display content for the current path to update layout)
-        self.display_content(self.current_dir_path)
+        # 격자 재배치는 아이템 뷰가 직접 처리 (열 개수만 다시 계산, 파일 시스템 접근 없음)
+        # 새로 보이게 된 셀의 썸네일만 불러옴 (Only load thumbnails of newly visible cells)
+        self._lazy_load_thumbnails()
 
     def _setup_timers(self):
         """Setup timers for resize and lazy loading"""
@@ -231,31 +344,42 @@ class BoothManager(QMainWindow):
         self._lazy_load_timer.timeout.connect(self._lazy_load_thumbnails)
 
     def _lazy_load_thumbnails(self):
-        """현재 보이는 영역의 썸네일만 로드"""
-        if not hasattr(self, 'content_widget') or not self.content_widget.layout():
+        """현재 보이는 영역의 썸네일/태그를 우선 로드하고, 스크롤 방향의 다음 화면은 미리 불러오기"""
+        if not hasattr(self, 'item_view'):
             return
 
-        viewport_rect = self.scroll_area.viewport().rect()
-        viewport_rect.translate(0, self.scroll_area.verticalScrollBar().value())
-        
-        layout = self.content_widget.layout()
-        for i in range(layout.count()):
-            item = layout.itemAt(i)
-            if not item:
-                continue
-                
-            widget = item.widget()
-            if not widget:
-                continue
+        visible_rows, prefetch_rows = self.item_view.visible_rows(extra_screens=1)
+
+        # 화면에서 벗어난 아이템의 대기 작업은 취소
+        items = self.item_model.items()
+        self.thumbnail_scheduler.retain([items[row].path for row in visible_rows]
+                                        + [items[row].path for row in prefetch_rows])
+        for row in visible_rows:
+            self._load_item(items[row], PRIORITY_VISIBLE)
+        for row in prefetch_rows:
+            self._load_item(items[row], PRIORITY_PREFETCH)
+
+    def _load_item(self, item, priority):
+        """아이템 하나의 썸네일을 준비 (이미 준비된 것은 건너뜀, 태그는 목록 단위로 따로 로드)"""
+        path = item.path
+        if self.item_model.has_thumbnail(path):
+            return
+        if item.is_dir:
+            if not self.item_model.is_cover_resolved(path):
+                return  # 커버를 찾는 중 (완료되면 다시 로드됨)
+            source_path = self.item_model.cover(path)
+            if not source_path:
+                self.item_model.set_thumbnail(path, self._folder_icon)
+                return
+        elif is_image_file(item.name):
+            source_path = path
+        else:
+            return  # 이미지가 아닌 파일은 텍스트 미리보기
 
-            # 위젯의 위치와 크기 계산
-            widget_rect = QRect(widget.pos(), widget.size())
-            widget_rect.translate(self.content_widget.pos())
-            
-            # 위젯이 뷰포트와 겹치는지 확인
-            if viewport_rect.intersects(widget_rect):
-                if isinstance(widget, (FolderItemWidget, FileItemWidget)):
-                    widget.load_thumbnail(self.thumbnail_cache)
+        self.thumbnail_scheduler.request(
+            path, source_path,
+            lambda image, p=path: self.item_model.set_thumbnail(p, image),
+            priority)
 
     def adjust_brightness(self, hex_color, factor):
         """헥스 코드 색상의 밝기를 조정합니다. (Adjust brightness of a hex color.)"""
@@ -302,203 +426,208 @@ class BoothManager(QMainWindow):
         return theme_container
 
     def change_theme(self, theme_name):
-        """테마 변경"""
-        theme = self.theme_colors.get(theme_name.lower())
-        if theme:
-            border_color_for_widgets = theme['handle'] # 테두리 색상을 핸들 색상으로 통일
-            current_border_width = BORDER_WIDTH # constants.py에서 가져온 BORDER_WIDTH 사용
-
-            self.setStyleSheet(f"""
-                QMainWindow {{
-                    background-color: {theme['bg']};
-                    color: {theme['text']};
-                    border: none; /* QMainWindow 자체의 테두리 제거 */
-                }}
-                QWidget {{
-                    background-color: {theme['bg']};
-                    color: {theme['text']};
-                    border: none; /* 일반 QWidget의 테두리도 기본적으로 제거 */
-                }}
-                QTreeView {{
-                    background-color: {theme['bg']};
-                    color: {theme['text']};
-                    border: {current_border_width}px solid {border_color_for_widgets}; /* 핸들 색상 테두리, 지정된 두께 */
-                    {COMMON_STYLES['border_radius']} /* constants.py의 BORDER_RADIUS 반영 (0) */
-                    {COMMON_STYLES['font']}
-                }}
-                QTreeView::branch {{
-                    background-color: {theme['bg']};
-                }}
-                QTreeView::item {{
-                    background-color: {theme['bg']};
-                    color: {theme['text']};
-                    {COMMON_STYLES['padding_small']}
-                    {COMMON_STYLES['font']}
-                }}
-                QTreeView::item:selected {{
-                    background-color: {border_color_for_widgets};
-                    color: {theme['text']};
-                }}
-                QTreeView::item:hover {{
-                    background-color: {theme['bg']};
-                    color: {theme['text']};
-                }}
-                QListView {{
-                    background-color: {theme['bg']};
-                    color: {theme['text']};
-                    border: {current_border_width}px solid {border_color_for_widgets};
-                    {COMMON_STYLES['border_radius']}
-                    {COMMON_STYLES['font']}
-                }}
-                QLineEdit {{
-                    background-color: {theme['bg']};
-                    color: {theme['text']};
-                    border: {current_border_width}px solid {border_color_for_widgets};
-                    {COMMON_STYLES['border_radius']}
-                    {COMMON_STYLES['padding_small']}
-                    {COMMON_STYLES['font']}
-                }}
-                QComboBox {{
-                    background-color: {theme['bg']};
-                    color: {theme['text']};
-                    border: {current_border_width}px solid {border_color_for_widgets};
-                    {COMMON_STYLES['border_radius']}
-                    {COMMON_STYLES['padding_small']}
-                    {COMMON_STYLES['font']}
-                }}
-                QPushButton {{
-                    background-color: {theme['bg']};
-                    color: {theme['text']};
-                    border: {current_border_width}px solid {border_color_for_widgets};
-                    {COMMON_STYLES['border_radius']}
-                    {COMMON_STYLES['padding_small']}
-                    {COMMON_STYLES['font']}
-                }}
-                QLabel {{
-                    background-color: {theme['bg']};
-                    color: {theme['text']};
-                    {COMMON_STYLES['font']}
-                }}
-                QTabWidget {{ /* QTabWidget 자체에 대한 스타일 추가 */
-                    border: none; /* QTabWidget 자체의 테두리 제거 */
-                }}
-                QTabWidget::pane {{
-                    border: {current_border_width}px solid {border_color_for_widgets}; /* 핸들 색상 테두리, 지정된 두께 */
-                    {COMMON_STYLES['border_radius']} /* constants.py의 BORDER_RADIUS 반영 (0) */
-                    background-color: {theme['bg']};
-                    color: {theme['text']};
-                    {COMMON_STYLES['font']}
-                }}
-                QTabBar::tab {{
-                    background-color: {theme['bg']};
-                    color: {theme['text']};
-                    border: {current_border_width}px solid {border_color_for_widgets};
-                    border-bottom-color: transparent; /* 선택되지 않은 탭의 아래쪽 테두리는 투명하게 하여 pane과 연결되도록 */
-                    /* border-radius: 5px 5px 0 0; */ /* 라운딩 제거, constants.py의 BORDER_RADIUS가 0이므로 COMMON_STYLES 사용 시 자동 적용 */
-                    {COMMON_STYLES['border_radius']} /* 상단 좌우만 라운딩이 필요한 경우 별도 지정 필요하나, 여기서는 전체 0 */
-                    {COMMON_STYLES['padding_medium']}
-                    {COMMON_STYLES['margin_small']}
-                    {COMMON_STYLES['font']}
-                }}
-                QTabBar::tab:selected {{
-                    background-color: {border_color_for_widgets}; /* 선택된 탭 배경은 핸들 색상 */
-                    color: {theme['bg']}; /* 선택된 탭 텍스트는 배경색과 대비되도록 */
-                    border-bottom-color: {border_color_for_widgets}; /* 선택된 탭은 아래쪽 테두리도 핸들 색상 */
-                }}
-                QScrollArea {{
-                    background-color: {theme['bg']};
-                    border: none; /* 스크롤 영역 자체는 테두리 없음. 내용(pane)이 테두리를 가짐 */
-                    {COMMON_STYLES['font']}
-                }}
-                QScrollBar:vertical, QScrollBar:horizontal {{
-                    background-color: {theme['bg']};
-                    border: none;
-                    {COMMON_STYLES['font']}
-                }}
-                QScrollBar::handle:vertical, QScrollBar::handle:horizontal {{
-                    background-color: {border_color_for_widgets};
-                    /* border-radius: 3px; */ /* 라운딩 제거, COMMON_STYLES 사용 시 자동 적용 또는 직접 0px */
-                    {COMMON_STYLES['border_radius']}
-                    min-height: 20px;
-                }}
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical,
-                QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-                    border: none;
-                    background: none;
-                }}
-                QSplitter {{
-                    background-color: transparent; /* 스플리터 자체 배경을 투명하게 */
-                    border: none;
-                }}
-                QSplitter::handle {{
-                    background: {theme['handle']};
-                    background-color: {theme['handle']};
-                    width: {current_border_width}px; /* 핸들 너비를 BORDER_WIDTH와 동일하게 */
-                    /* height: {current_border_width}px; */ /* 핸들이 수평일 경우 높이도 동일하게 설정 가능 */
-                }}
-                QDialog {{
-                    background-color: {theme['bg']};
-                    color: {theme['text']};
-                    {COMMON_STYLES['font']}
-                }}
-                QDialog QLineEdit {{
-                    background-color: {theme['bg']};
-                    color: {theme['text']};
-                    border: {current_border_width}px solid {border_color_for_widgets};
-                    {COMMON_STYLES['border_radius']}
-                    {COMMON_STYLES['padding_small']}
-                    {COMMON_STYLES['font']}
-                }}
-                QDialog QPushButton {{
-                    background-color: {theme['bg']};
-                    color: {theme['text']};
-                    border: {current_border_width}px solid {border_color_for_widgets};
-                    {COMMON_STYLES['border_radius']}
-                    {COMMON_STYLES['padding_small']}
-                    {COMMON_STYLES['font']}
-                }}
-            """)
-            self.content_widget.setObjectName("content_widget")
-            if hasattr(self, 'scroll_area'):
-                self.scroll_area.setStyleSheet(f"""
-                    QScrollArea {{ 
-                        background-color: {theme['bg']};
-                        border: none;
-                    }}
-                """)
-            if hasattr(self, 'splitter') and self.splitter is not None:
-                self.splitter.setStyleSheet(f"""
-                    QSplitter {{
-                        background-color: transparent;
-                        border: none;
-                    }}
-                    QSplitter::handle {{
-                        background: {theme['handle']};
-                        background-color: {theme['handle']};
-                        width: {current_border_width}px;
-                        /* height: {current_border_width}px; */
-                    }}
-                """)
-            # 모든 썸네일/파일/폴더 위젯에 테마 적용
-            self.apply_theme_to_all_content_widgets(theme['bg'], theme['text'])
+        """
+        테마 변경.
+        스타일시트는 테마별로 한 번만 만들어 창에 한 번 설정하고 (하위 위젯은 Qt가 한 번에 다시 적용),
+        아이템 셀은 델리게이트 색상만 바꿔 다시 그리므로 아이템 수와 관계없이 비용이 일정합니다.
+        """
+        theme_name = theme_name.lower()
+        theme = self.theme_colors.get(theme_name)
+        if not theme:
+            return
+        for name, btn in getattr(self, 'theme_buttons', {}).items():
+            btn.setChecked(name == theme_name)
+        if theme_name == getattr(self, 'theme_name', None):
+            return  # 같은 테마는 다시 적용하지 않음
+        self.theme_name = theme_name
+
+        stylesheet = self._theme_stylesheets.get(theme_name)
+        if stylesheet is None:
+            stylesheet = self._theme_stylesheets[theme_name] = self._build_theme_stylesheet(theme)
+        self.setStyleSheet(stylesheet)
+
+        # 아이템 뷰에 테마 적용
+        self.apply_theme_to_all_content_widgets(theme['bg'], theme['text'])
+
+    def _build_theme_stylesheet(self, theme):
+        """테마 색상으로 창 전체 스타일시트 생성 (스플리터 핸들 등 모든 위젯 규칙 포함)"""
+        border_color_for_widgets = theme['handle'] # 테두리 색상을 핸들 색상으로 통일
+        current_border_width = BORDER_WIDTH # constants.py에서 가져온 BORDER_WIDTH 사용
+
+        return f"""
+            QMainWindow {{
+                background-color: {theme['bg']};
+                color: {theme['text']};
+                border: none; /* QMainWindow 자체의 테두리 제거 */
+            }}
+            QWidget {{
+                background-color: {theme['bg']};
+                color: {theme['text']};
+                border: none; /* 일반 QWidget의 테두리도 기본적으로 제거 */
+            }}
+            QTreeView {{
+                background-color: {theme['bg']};
+                color: {theme['text']};
+                border: {current_border_width}px solid {border_color_for_widgets}; /* 핸들 색상 테두리, 지정된 두께 */
+                {COMMON_STYLES['border_radius']} /* constants.py의 BORDER_RADIUS 반영 (0) */
+                {COMMON_STYLES['font']}
+            }}
+            QTreeView::branch {{
+                background-color: {theme['bg']};
+            }}
+            QTreeView::item {{
+                background-color: {theme['bg']};
+                color: {theme['text']};
+                {COMMON_STYLES['padding_small']}
+                {COMMON_STYLES['font']}
+            }}
+            QTreeView::item:selected {{
+                background-color: {border_color_for_widgets};
+                color: {theme['text']};
+            }}
+            QTreeView::item:hover {{
+                background-color: {theme['bg']};
+                color: {theme['text']};
+            }}
+            QListView {{
+                background-color: {theme['bg']};
+                color: {theme['text']};
+                border: {current_border_width}px solid {border_color_for_widgets};
+                {COMMON_STYLES['border_radius']}
+                {COMMON_STYLES['font']}
+            }}
+            QLineEdit {{
+                background-color: {theme['bg']};
+                color: {theme['text']};
+                border: {current_border_width}px solid {border_color_for_widgets};
+                {COMMON_STYLES['border_radius']}
+                {COMMON_STYLES['padding_small']}
+                {COMMON_STYLES['font']}
+            }}
+            QComboBox {{
+                background-color: {theme['bg']};
+                color: {theme['text']};
+                border: {current_border_width}px solid {border_color_for_widgets};
+                {COMMON_STYLES['border_radius']}
+                {COMMON_STYLES['padding_small']}
+                {COMMON_STYLES['font']}
+            }}
+            QPushButton {{
+                background-color: {theme['bg']};
+                color: {theme['text']};
+                border: {current_border_width}px solid {border_color_for_widgets};
+                {COMMON_STYLES['border_radius']}
+                {COMMON_STYLES['padding_small']}
+                {COMMON_STYLES['font']}
+            }}
+            QLabel {{
+                background-color: {theme['bg']};
+                color: {theme['text']};
+                {COMMON_STYLES['font']}
+            }}
+            QTabWidget {{ /* QTabWidget 자체에 대한 스타일 추가 */
+                border: none; /* QTabWidget 자체의 테두리 제거 */
+            }}
+            QTabWidget::pane {{
+                border: {current_border_width}px solid {border_color_for_widgets}; /* 핸들 색상 테두리, 지정된 두께 */
+                {COMMON_STYLES['border_radius']} /* constants.py의 BORDER_RADIUS 반영 (0) */
+                background-color: {theme['bg']};
+                color: {theme['text']};
+                {COMMON_STYLES['font']}
+            }}
+            QTabBar::tab {{
+                background-color: {theme['bg']};
+                color: {theme['text']};
+                border: {current_border_width}px solid {border_color_for_widgets};
+                border-bottom-color: transparent; /* 선택되지 않은 탭의 아래쪽 테두리는 투명하게 하여 pane과 연결되도록 */
+                /* border-radius: 5px 5px 0 0; */ /* 라운딩 제거, constants.py의 BORDER_RADIUS가 0이므로 COMMON_STYLES 사용 시 자동 적용 */
+                {COMMON_STYLES['border_radius']} /* 상단 좌우만 라운딩이 필요한 경우 별도 지정 필요하나, 여기서는 전체 0 */
+                {COMMON_STYLES['padding_medium']}
+                {COMMON_STYLES['margin_small']}
+                {COMMON_STYLES['font']}
+            }}
+            QTabBar::tab:selected {{
+                background-color: {border_color_for_widgets}; /* 선택된 탭 배경은 핸들 색상 */
+                color: {theme['bg']}; /* 선택된 탭 텍스트는 배경색과 대비되도록 */
+                border-bottom-color: {border_color_for_widgets}; /* 선택된 탭은 아래쪽 테두리도 핸들 색상 */
+            }}
+            QScrollArea {{
+                background-color: {theme['bg']};
+                border: none; /* 스크롤 영역 자체는 테두리 없음. 내용(pane)이 테두리를 가짐 */
+                {COMMON_STYLES['font']}
+            }}
+            QScrollBar:vertical, QScrollBar:horizontal {{
+                background-color: {theme['bg']};
+                border: none;
+                {COMMON_STYLES['font']}
+            }}
+            QScrollBar::handle:vertical, QScrollBar::handle:horizontal {{
+                background-color: {border_color_for_widgets};
+                /* border-radius: 3px; */ /* 라운딩 제거, COMMON_STYLES 사용 시 자동 적용 또는 직접 0px */
+                {COMMON_STYLES['border_radius']}
+                min-height: 20px;
+            }}
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical,
+            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
+                border: none;
+                background: none;
+            }}
+            QSplitter {{
+                background-color: transparent; /* 스플리터 자체 배경을 투명하게 */
+                border: none;
+            }}
+            QSplitter::handle {{
+                background: {theme['handle']};
+                background-color: {theme['handle']};
+                width: {current_border_width}px; /* 핸들 너비를 BORDER_WIDTH와 동일하게 */
+                /* height: {current_border_width}px; */ /* 핸들이 수평일 경우 높이도 동일하게 설정 가능 */
+            }}
+            QDialog {{
+                background-color: {theme['bg']};
+                color: {theme['text']};
+                {COMMON_STYLES['font']}
+            }}
+            QDialog QLineEdit {{
+                background-color: {theme['bg']};
+                color: {theme['text']};
+                border: {current_border_width}px solid {border_color_for_widgets};
+                {COMMON_STYLES['border_radius']}
+                {COMMON_STYLES['padding_small']}
+                {COMMON_STYLES['font']}
+            }}
+            QDialog QPushButton {{
+                background-color: {theme['bg']};
+                color: {theme['text']};
+                border: {current_border_width}px solid {border_color_for_widgets};
+                {COMMON_STYLES['border_radius']}
+                {COMMON_STYLES['padding_small']}
+                {COMMON_STYLES['font']}
+            }}
+        """
 
     def apply_theme_to_all_content_widgets(self, bg_color, text_color):
-        if not hasattr(self, 'content_widget') or not self.content_widget.layout():
+        """아이템 뷰의 셀 색상을 테마에 맞춤 (델리게이트가 다시 그림)"""
+        if not hasattr(self, 'item_view'):
             return
-        layout = self.content_widget.layout()
-        for i in range(layout.count()):
-            item = layout.itemAt(i)
-            if not item:
-                continue
-            widget = item.widget()
-            if widget and hasattr(widget, 'apply_theme'):
-                widget.apply_theme(bg_color, text_color)
-
-    def apply_filter_sort(self):
-        """필터 및 정렬 변경 시 현재 디렉토리 콘텐츠 다시 표시 (Re-display current directory content when filter and sort are changed)"""
-        self.current_filter_text = self.filter_input.text().strip().lower()
+        self.item_view.item_delegate.set_colors(bg_color, text_color)
+        self.item_view.viewport().update()
+
+    def schedule_filter(self):
+        """필터 입력이 바뀔 때마다 디바운스 타이머 재시작 (Restart the debounce timer on filter input)"""
+        self._filter_timer.start()
+
+    def apply_filter(self):
+        """읽어 둔 목록에 필터 적용 (디렉토리를 다시 읽지 않음)"""
+        self.current_filter_text = self.filter_input.text().strip()
+        if self.item_model.set_filter(fold_text(self.current_filter_text)):
+            self._lazy_load_thumbnails()
+
+    def apply_sort(self):
+        """정렬 변경 시 디렉토리를 다시 읽지 않고 현재 목록의 순서만 바꿈"""
         self.current_sort_criteria = self.sort_combo.currentIndex()
-        self.display_content(self.current_dir_path) # 현재 경로 기준으로 다시 그림 (Re-draw based on current path)
+        key, reverse = sort_key(self.current_sort_criteria)
+        self.item_model.sort_items(key, reverse)
+        self._lazy_load_timer.start()
 
     @handle_exceptions
     def on_directory_clicked(self, index: QModelIndex):
@@ -519,142 +648,212 @@ class BoothManager(QMainWindow):
              self.tree_view.expand(index)
 
     @handle_exceptions
-    def display_content(self, dir_path):
-        """디렉토리 내용을 필터링, 정렬 및 자동 줄 바꿈하여 표시"""
-        self.show_progress()  # 진행 상태 표시 시작
+    def display_content(self, dir_path, from_history=False):
+        """
+        디렉토리 내용을 백그라운드에서 읽어 아이템 뷰에 표시합니다.
+        읽는 도중 도착한 묶음부터 바로 표시하며, 다른 폴더로 이동하면 이전 목록 읽기는 취소됩니다.
+        최근에 본 폴더는 (수정 시간이 같으면) 캐시된 목록과 스크롤 위치로 바로 표시합니다.
+
+        Args:
+            dir_path (str): 표시할 디렉토리 경로.
+            from_history (bool): 뒤로/앞으로 이동인지 여부 (기록을 남기지 않고 정렬/필터도 복원).
+        """
+        self._save_view_state()
+        if not from_history:
+            self.navigation_history.visit(dir_path)
+        self._update_navigation_buttons()
+
+        self.show_progress()  # 진행 상태 표시 시작 (목록 읽기 완료 시 종료)
+        self.thumbnail_prewarmer.notify_user_activity()
+        logger.info(f"Displaying content for: {dir_path} with filter '{self.current_filter_text}' and sort '{self.current_sort_criteria}'")
+
+        # 이전 목록의 대기 중인 썸네일 작업 취소 후 빈 목록에서 시작
+        self.thumbnail_scheduler.cancel_all()
+        self.item_view.set_empty_text("")
+        self.item_model.clear()
+        self.item_view.scrollToTop()
+        self.folder_cover_cache.resolve([])  # 이전 목록의 커버/태그 결과 무시
+        self.folder_tag_cache.load([])
+
+        # 뒤로/앞으로 이동 시에는 떠날 때의 정렬/필터 복원 (모델이 비어 있으므로 비용 없음)
+        view_state = self.navigation_history.state if from_history else None
+        if view_state is not None:
+            self._restore_view_controls(view_state)
+
+        self.catalog_search.cancel()
+        self._current_search = None
+        self._pending_result_cache = None
+        self._pending_scroll = None
+        self._listing_path = dir_path
+        self._rescan_pending = False
+        self.directory_watcher.watch(dir_path)
+
+        cached = self.listing_cache.get(dir_path)
+        if cached is not None:
+            self._show_cached_listing(cached, view_state.scroll if view_state else cached.scroll)
+            return
+
+        # 캐시에 없으면 다시 읽은 뒤 스크롤 위치 복원
+        if view_state is not None:
+            self._pending_scroll = view_state.scroll
+        self._listing_active = True
+        self._listing_mtime = self._directory_mtime(dir_path)
+        # 필터는 모델에서 적용하므로 전체 목록을 읽음 (필터를 바꿔도 다시 읽지 않음)
+        self.directory_lister.list_directory(dir_path)
+
+    def _directory_mtime(self, dir_path):
         try:
-            logger.info(f"Displaying content for: {dir_path} with filter '{self.current_filter_text}' and sort '{self.current_sort_criteria}'")
-            row, col = 0, 0
-
-            # --- 레이아웃 가져오기 또는 생성 --- (Get or create the layout)
-            target_layout = self.content_widget.layout()
-            if not target_layout:
-                logger.info("content_widget에 새 레이아웃 생성 (Creating new layout for content_widget)")
-                target_layout = QGridLayout()
-                self.content_widget.setLayout(target_layout)
-                target_layout.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-            # 레이아웃이 존재하는지 확인 (Ensure layout exists)
-            if not isinstance(target_layout, QGridLayout):
-                 logger.error(f"오류: 레이아웃이 QGridLayout이 아님 ({type(target_layout)}). 다시 생성합니다. (Error: Layout is not a QGridLayout ({type(target_layout)}). Recreating.)")
-                 if target_layout: del target_layout # 기존 레이아웃 객체 먼저 제거 (Remove old layout object first)
-                 target_layout = QGridLayout()
-                 self.content_widget.setLayout(target_layout)
-                 target_layout.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-
-            # DataManager를 사용하여 아이템 가져오기 (Use DataManager to get items)
-            items_to_display = self.data_manager.get_items_in_directory(
-                dir_path,
-                self.current_sort_criteria,
-                self.current_filter_text
-            )
-
-            if items_to_display is None: # DataManager에서 잘못된 경로 또는 오류 처리 (Handle invalid path or error from DataManager)
-                 logger.error(f"DataManager에서 오류 또는 잘못된 경로: {dir_path}")
-                 # 기존 레이아웃을 지우고 오류 라벨을 레이아웃에 추가 (Clear the existing layout and add an error label TO THE LAYOUT)
-                 while target_layout.count():
-                     item = target_layout.takeAt(0)
-                     widget = item.widget()
-                     if widget:
-                         widget.deleteLater()
-                 error_label = QLabel(f"잘못된 경로이거나 데이터를 불러올 수 없습니다:\n{dir_path}")
-                 error_label.setAlignment(Qt.AlignCenter)
-                 error_label.setStyleSheet("padding: 20px; color: red;")
-                 error_label.setWordWrap(True)
-                 target_layout.addWidget(error_label, 0, 0)
-                 return
-
-            # 정렬 옵션 적용
-            sort_func = self.sort_options[self.current_sort_criteria][1]
-            reverse = len(self.sort_options[self.current_sort_criteria]) > 2 and self.sort_options[self.current_sort_criteria][2]
-            items_to_display.sort(key=sort_func, reverse=reverse)
-
-            # 4. 너비에 따라 열 개수 계산 (Calculate Columns based on Width)
-            if self.scroll_area.widget() != self.content_widget:
-                 logger.warning("경고: content_widget이 scroll_area에 설정되지 않았습니다. 지금 설정합니다. (Warning: content_widget not set in scroll_area, setting it now.)")
-                 self.scroll_area.setWidget(self.content_widget)
-
-            viewport_width = self.scroll_area.viewport().width()
-            item_width = ITEM_WIDGET_WIDTH # 임포트된 상수 사용 (Use imported constant)
-            spacing = target_layout.spacing() if target_layout else 10 # 레이아웃 간격 또는 기본값 사용 (Use layout spacing or default)
-            col_count = max(1, int(viewport_width / (item_width + spacing)))
-            logger.info(f"Viewport width: {viewport_width}, Item width: {item_width}, Spacing: {spacing}, Calculated columns: {col_count}")
-
-            # 5. 새 위젯 먼저 생성 (임포트된 위젯 클래스 사용) (Create new widgets first (Using imported widget classes))
-            new_widgets = []
-            for item_info in items_to_display:
-                try:
-                    # 부모는 항상 단일 content_widget (Parent is always the single content_widget)
-                    parent_widget = self.content_widget
-                    item_widget = None
-                    if item_info["is_dir"]:
-                        item_widget = FolderItemWidget(item_info["path"], item_info["name"], parent=parent_widget)
-                        item_widget.item_double_clicked.connect(self.select_tree_item) # 폴더 더블클릭 연결 (Connect folder double-click)
-                    else:
-                        item_widget = FileItemWidget(item_info["path"], item_info["name"], parent=parent_widget)
-                        # 파일 더블클릭은 BaseItemWidget에서 처리 (파인더 열기) (File double-click is handled in BaseItemWidget (open in Finder))
-
-                    if item_widget:
-                        new_widgets.append(item_widget) # 임시 리스트에 추가 (Add to temporary list)
-                except Exception as widget_e:
-                     logger.error(f"{item_info.get('path', 'N/A')}에 대한 위젯 생성 오류: {widget_e}")
-                     # 선택적으로 실패한 위젯마다 메시지 박스 표시 또는 오류 수집 (Optionally show a message box per failed widget, or collect errors)
-                     QMessageBox.warning(self, "위젯 생성 오류", f"항목 위젯 생성 중 오류 발생:\n{item_info.get('name', 'N/A')}\n{widget_e}")
-
-            # 6. 새 위젯 생성 후 기존 레이아웃 비우기 (Clear existing layout AFTER creating new widgets)
-            # 새 항목을 추가하기 전에 깨끗한 상태를 보장합니다. (This ensures a clean slate before adding the new items.)
-            # deleteLater()를 사용하는 것이 안전한 위젯 제거에 중요합니다. (Using deleteLater() is important for safe widget removal.)
-            if target_layout:
-                while target_layout.count():
-                    layout_item = target_layout.takeAt(0)
-                    widget = layout_item.widget()
-                    if widget:
-                        widget.setParent(None) # 삭제 전에 명시적으로 부모 제거 (Explicitly remove parent before deleting)
-                        widget.deleteLater()
-            else:
-                 # 이 경우는 위의 검사로 인해 발생하지 않아야 하지만, 발생하면 기록합니다. (This case should ideally not happen due to checks above, but log if it does.)
-                 logger.error("오류: 새 위젯을 추가하기 전에 target_layout이 유효하지 않게 되었습니다. (Error: target_layout became invalid before adding new widgets.)")
-
-            # 7. 이제 비어 있는 레이아웃에 새 위젯 추가 (Add new widgets to the now empty layout)
-            row, col = 0, 0 # 행/열 초기화 (Reset row/col)
-            for item_widget in new_widgets:
-                 # 계산된 열 개수를 기반으로 줄 바꿈하여 그리드 레이아웃에 위젯 추가 (Add widget to the grid layout, wrapping based on calculated col_count)
-                 target_layout.addWidget(item_widget, row, col)
-                 col += 1
-                 if col >= col_count:
-                     col = 0
-                     row += 1
-
-            # 레이아웃이 지원하는 경우 항목을 왼쪽 상단으로 밀어 넣기 위해 끝에 늘이기 추가 (Add stretch at the end to push items to the top-left if layout supports it)
-            # QGridLayout은 QVBoxLayout/QHBoxLayout처럼 늘이기를 사용하지 않음 (QGridLayout doesn't really use stretch like QVBoxLayout/QHBoxLayout)
-            # target_layout.setRowStretch(row + 1, 1)
-            # target_layout.setColumnStretch(col_count, 1)
-
-            # 초기 지연 로딩 시작
+            return os.stat(dir_path).st_mtime
+        except OSError:
+            return None
+
+    def _save_view_state(self):
+        """
+        떠나는 디렉토리의 보기 상태(스크롤/정렬/필터)를 이동 기록 항목에,
+        목록은 목록 캐시에 저장합니다.
+        """
+        if not self._listing_path:
+            return  # 검색 결과는 저장하지 않음
+        scroll = self.item_view.verticalScrollBar().value()
+        if self._listing_path == self.navigation_history.current:
+            self.navigation_history.save_state(
+                ViewState(scroll, self.current_sort_criteria, self.filter_input.text()))
+        if self._listing_active or self._listing_mtime is None:
+            return  # 읽는 중이거나 읽기에 실패한 목록은 캐시하지 않음
+        self.listing_cache.put(self._listing_path, ListingEntry(
+            self._listing_mtime, list(self.item_model.all_items()), scroll, self.current_sort_criteria))
+
+    def _restore_view_controls(self, view_state):
+        """기록된 정렬/필터를 컨트롤에 복원"""
+        self.sort_combo.setCurrentIndex(view_state.sort_criteria)
+        self.filter_input.setText(view_state.filter_text)
+        self._filter_timer.stop()
+        self.apply_filter()
+
+    def _show_cached_listing(self, entry, scroll):
+        """캐시된 목록을 디렉토리를 읽지 않고 표시"""
+
+        items = entry.items
+        if entry.sort_criteria != self.current_sort_criteria:
+            sort_func, reverse = sort_key(self.current_sort_criteria)
+            items = sorted(items, key=sort_func, reverse=reverse)
+        self.item_model.set_items(items)
+        self._listing_mtime = entry.mtime
+        self.hide_progress()
+        logger.info(f"{self._listing_path}: 캐시된 목록으로 아이템 {self.item_model.rowCount()}개 표시")
+
+        # 격자 배치를 바로 끝내야 이전 스크롤 위치로 돌아갈 수 있음
+        self.item_view.doItemsLayout()
+        self.item_view.verticalScrollBar().setValue(scroll)
+        self._resolve_folder_covers(items)
+        self._lazy_load_thumbnails()
+        self._watch_item_sidecars()
+
+    def _update_navigation_buttons(self):
+        self.back_button.setEnabled(self.navigation_history.can_go_back())
+        self.forward_button.setEnabled(self.navigation_history.can_go_forward())
+
+    def navigate_back(self):
+        """이전에 보던 디렉토리로 이동"""
+        self._save_view_state()  # 기록의 현재 항목이 바뀌기 전에 보기 상태 저장
+        path = self.navigation_history.back()
+        if path:
+            self._navigate_to_history(path)
+
+    def navigate_forward(self):
+        """뒤로 이동하기 전의 디렉토리로 이동"""
+        self._save_view_state()
+        path = self.navigation_history.forward()
+        if path:
+            self._navigate_to_history(path)
+
+    def _navigate_to_history(self, path):
+        """기록에 있는 디렉토리를 트리에서 선택하고 표시 (기록은 남기지 않음)"""
+        self.current_dir_path = path
+        index = self.file_system_model.index(path)
+        if index.isValid():
+            self.tree_view.scrollTo(index)
+            self.tree_view.setCurrentIndex(index)
+        self.display_content(path, from_history=True)
+
+    @handle_exceptions
+    def _on_listing_batch(self, generation, items):
+        """목록 읽기 중 도착한 아이템 묶음을 정렬 순서에 맞춰 추가"""
+        first_batch = self.item_model.rowCount() == 0
+        sort_func, reverse = sort_key(self.current_sort_criteria)
+        self.item_model.add_items(items, key=sort_func, reverse=reverse)
+
+        # 폴더 커버를 백그라운드에서 일괄 검색
+        self._resolve_folder_covers(items, append=True)
+
+        # 보이는 영역 썸네일 로드 (첫 묶음은 바로, 이후는 디바운스)
+        if first_batch:
+            self._lazy_load_thumbnails()
+        else:
             self._lazy_load_timer.start()
 
-        except Exception as e:
-            logger.error(f"{dir_path}에 대한 콘텐츠 표시 오류: {e}")
-            # 오류 처리: QMessageBox를 기본 방법으로 사용하고 scroll_area 위젯은 건드리지 않음 (Error handling: Use QMessageBox as the primary method, avoid touching scroll_area widget)
-            try:
-                QMessageBox.critical(self, "콘텐츠 표시 오류", f"콘텐츠 표시 중 오류 발생:\n{e}\n경로: {dir_path}")
-            except Exception as msg_e:
-                 logger.error(f"심각한 오류 메시지 상자 표시 실패: {msg_e}")
-            # 선택적으로, 주 프로세스 중 오류가 발생한 경우 레이아웃을 다시 비우기 시도 (Optionally, clear the layout again defensively here if needed)
-            # 예외 발생 전 부분적으로 렌더링된 콘텐츠가 UI에 표시되지 않도록 함 (This ensures the UI doesn't show partially rendered content from before the exception)
-            try:
-                target_layout = self.content_widget.layout() # 레이아웃 다시 가져오기 (Get the layout again)
-                if target_layout:
-                     logger.info("예외 처리 중 레이아웃 비우기. (Clearing layout due to exception during display_content.)")
-                     while target_layout.count():
-                        layout_item = target_layout.takeAt(0)
-                        widget = layout_item.widget()
-                        if widget:
-                            # widget.setParent(None) # deleteLater와 함께 사용하면 엄밀히 불필요 (Not strictly necessary with deleteLater)
-                            widget.deleteLater() # 삭제 예약 (Schedule deletion)
-            except Exception as clear_err:
-                logger.error(f"예외 처리 중 레이아웃 비우기 오류: {clear_err}")
-        finally:
-            self.hide_progress()  # 진행 상태 표시 종료
+    def _on_listing_finished(self, generation, error):
+        """목록 읽기 완료 (또는 실패)"""
+        self.hide_progress()  # 진행 상태 표시 종료
+        self._listing_active = False
+        if error:
+            self._listing_mtime = None
+            logger.error(f"DataManager에서 오류 또는 잘못된 경로: {self._listing_path} ({error})")
+            self.item_model.clear()
+            self.item_view.set_empty_text(
+                f"잘못된 경로이거나 데이터를 불러올 수 없습니다:\n{self._listing_path}", "red")
+            return
+        logger.info(f"{self._listing_path}: 아이템 {self.item_model.rowCount()}개 표시")
+        if self._pending_scroll is not None:
+            # 뒤로/앞으로 이동한 폴더를 다시 읽었으면 떠날 때의 스크롤 위치로
+            self.item_view.doItemsLayout()
+            self.item_view.verticalScrollBar().setValue(self._pending_scroll)
+            self._pending_scroll = None
+        self._watch_item_sidecars()
+        if self._rescan_pending:
+            self._on_directory_changed(self._listing_path)
+
+    def _watch_item_sidecars(self):
+        """표시 중인 아이템 폴더들의 .meta.json 변경 감시 (목록을 다 읽거나 다시 읽은 뒤)"""
+        self.directory_watcher.watch_items([item.path for item in self.item_model.all_items() if item.is_dir])
+
+    def _on_sidecars_changed(self, item_paths):
+        """
+        밖에서 .meta.json이 바뀐 아이템 폴더만 태그를 다시 읽음 (백그라운드).
+        읽으면서 사이드카를 저장소로 가져오고 태그/이름 검색 색인도 그 폴더만 갱신합니다.
+        """
+        if self._listing_path is None:
+            return
+        logger.info(f"{self._listing_path}: 사이드카 변경 {len(item_paths)}개 반영")
+        for path in item_paths:
+            self.folder_tag_cache.invalidate(path)
+        self.folder_tag_cache.load(item_paths, append=True)
+
+    def _on_directory_changed(self, dir_path):
+        """표시 중인 디렉토리가 바뀌면 (변경이 잠잠해진 뒤) 백그라운드에서 다시 읽기"""
+        if dir_path != self._listing_path:
+            return
+        if self._listing_active:
+            self._rescan_pending = True  # 진행 중인 읽기가 끝나면 다시 읽음
+            return
+        self._listing_active = True
+        self._rescan_pending = False
+        self._listing_mtime = self._directory_mtime(dir_path)
+        self.directory_lister.rescan(dir_path)
+
+    @handle_exceptions
+    def _on_directory_rescanned(self, generation, items):
+        """다시 읽은 목록과 비교하여 추가/삭제/변경된 아이템만 모델에 반영"""
+        sort_func, reverse = sort_key(self.current_sort_criteria)
+        added, removed_count, updated = self.item_model.sync_items(items, key=sort_func, reverse=reverse)
+        if not added and not removed_count and not updated:
+            return
+        logger.info(f"{self._listing_path} 변경 반영: 추가 {len(added)}, 삭제 {removed_count}, 변경 {len(updated)}")
+        self._resolve_folder_covers(added + updated, append=True)
+        self._lazy_load_timer.start()
+        if added or removed_count:
+            # 항목이 추가/삭제됐으면 카탈로그와 검색 색인에도 반영 (바뀐 폴더만 다시 읽음)
+            QThreadPool.globalInstance().start(self.data_manager.refresh_indexes)
 
     @handle_exceptions
     def select_tree_item(self, item_path): # item_path는 폴더 또는 파일 경로일 수 있음 (item_path can be a folder or file path)
@@ -682,97 +881,296 @@ class BoothManager(QMainWindow):
         else:
             logger.warning(f"{item_path}에 대한 유효한 인덱스를 찾을 수 없습니다. (Could not find a valid index for: {item_path})")
 
+    def change_search_mode(self, mode):
+        """검색 방식 변경 (이름/태그 검색은 입력하는 대로 결과 표시)"""
+        self._update_search_placeholder()
+        if self.search_input.text().strip():
+            self.perform_search()
+
+    def _update_search_placeholder(self):
+        if self.search_mode_combo.currentIndex() == SEARCH_MODE_FUZZY:
+            self.search_input.setPlaceholderText("이름, 태그, 상품 제목/상점 입력 (입력하는 대로 검색)")
+        else:
+            self.search_input.setPlaceholderText("태그 검색 (예: 헤어 AND -유료, ext:unitypackage size:>100MB)")
+
+    def perform_search(self):
+        """선택한 검색 방식으로 검색 (Enter/검색 버튼)"""
+        if self.search_mode_combo.currentIndex() == SEARCH_MODE_FUZZY:
+            self._fuzzy_search_timer.stop()
+            self.fuzzy_search()
+        else:
+            self.search_by_tags()
+
+    def schedule_fuzzy_search(self):
+        """이름/태그 검색 방식이면 입력이 잠시 멈춘 뒤 검색"""
+        if self.search_mode_combo.currentIndex() == SEARCH_MODE_FUZZY:
+            self._fuzzy_search_timer.start()
+
+    @handle_exceptions
+    def fuzzy_search(self):
+        """이름/태그/상품 제목에서 유사 검색 (관련도순 표시)"""
+        query = self.search_input.text().strip()
+        if not query:
+            if self._listing_path is None:
+                # 검색 결과를 보던 중 검색어를 지우면 현재 디렉토리로 돌아감
+                self.display_content(self.current_dir_path)
+            return
+        items = self.data_manager.fuzzy_search(query)
+        if items is None:
+            # 시작 시 백그라운드 색인이 끝나지 않음 (GUI 스레드에서 색인을 만들지 않고 기다림)
+            self._show_search_items([])
+            self.item_view.set_empty_text("검색 색인을 만드는 중입니다...")
+            self._fuzzy_retry_timer.start()
+            return
+        logger.info(f"이름/태그 검색: '{query}' -> {len(items)}개")
+        self._show_search_items(items)
+
     @handle_exceptions
     def search_by_tags(self):
         """태그로 검색 (Search by tags)"""
         search_text = self.search_input.text().strip()
         if not search_text:
             # 검색어가 없으면 현재 선택된 트리 아이템 또는 루트의 내용을 다시 표시 (If there is no search term, re-display the contents of the currently selected tree item or root)
-            self.apply_filter_sort() # 필터/정렬 적용하여 현재 디렉토리 다시 로드 (Apply filter/sort and reload current directory)
+            self.display_content(self.current_dir_path) # 현재 디렉토리 다시 표시 (필터/정렬은 유지) (Re-display current directory, keeping filter/sort)
             return
-
-        search_tags = {tag.strip().lower() for tag in search_text.split(',') if search_text.strip()}
-        logger.info(f"태그 검색: {search_tags}")
-
-        # DataManager를 사용하여 태그로 아이템 찾기 (Use DataManager to find items by tags)
-        matching_item_paths = self.data_manager.find_items_by_tags(search_tags)
+        self._run_tag_query(search_text)
+
+    def _run_tag_query(self, search_text, saved_name=None):
+        """태그 질의를 실행해 표시 (저장된 검색이면 색인이 그대로일 때 캐시된 결과를 재사용)"""
+        logger.info(f"태그 검색: {search_text}")
+
+        matching_item_paths = None
+        if saved_name:
+            index_version = self.data_manager.index_version()
+            matching_item_paths = self.search_manager.cached_results(saved_name, index_version)
+        if matching_item_paths is None:
+            # DataManager를 사용하여 태그 질의로 아이템 찾기 (Use DataManager to find items by a tag query)
+            try:
+                matching_item_paths = self.data_manager.query_items(search_text)
+            except QueryError as e:
+                QMessageBox.warning(self, "검색 오류", str(e))
+                return
+            if saved_name:
+                self.search_manager.cache_results(saved_name, index_version, matching_item_paths)
         logger.info(f"태그와 일치하는 {len(matching_item_paths)}개의 아이템 찾음. (Found {len(matching_item_paths)} items matching tags.)")
 
         self.display_search_results(matching_item_paths) # 검색 결과 표시 (별도 함수) (Display search results (separate function))
+        self._current_search = (SEARCH_TYPE_TAG, search_text)
+        self.search_manager.add_to_history(SEARCH_TYPE_TAG, search_text, matching_item_paths)
 
     # Removed find_items_by_tags method from BoothManager as it's now in DataManager
 
     @handle_exceptions
     def display_search_results(self, item_paths):
-        """검색 결과(폴더 경로 리스트)를 썸네일 뷰에 표시 (Display search results (list of folder paths) in the thumbnail view)"""
+        """검색 결과(폴더 경로 리스트)를 아이템 뷰에 표시 (Display search results (list of folder paths) in the item view)"""
         logger.info(f"아이템 {len(item_paths)}개에 대한 검색 결과 표시. (Displaying search results for {len(item_paths)} items.)")
 
-        # 단일 content_widget 사용 (Use the single content_widget)
-        target_widget = self.content_widget
-
-        # content_widget이 스크롤 영역에 설정되었는지 확인 (Ensure the content_widget is set in the scroll_area)
-        if self.scroll_area.widget() != target_widget:
-             logger.warning("경고: 검색 결과에 대해 content_widget이 scroll_area에 설정되지 않았습니다. 지금 설정합니다. (Warning: content_widget not set in scroll_area for search results, setting it now.)")
-             self.scroll_area.setWidget(target_widget)
-
-        # --- 레이아웃 가져오기 또는 생성 --- (Get or create the layout)
-        target_layout = target_widget.layout()
-        if not target_layout:
-            logger.info("검색 결과에서 content_widget에 대한 새 레이아웃 생성 (Creating new layout for content_widget in search results)")
-            target_layout = QGridLayout()
-            target_widget.setLayout(target_layout)
-            target_layout.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        if not isinstance(target_layout, QGridLayout):
-             logger.error(f"오류: 검색 결과에서 레이아웃이 QGridLayout이 아님 ({type(target_layout)}). 다시 생성합니다. (Error: Layout is not a QGridLayout ({type(target_layout)}) in search results. Recreating.)")
-             if target_layout: del target_layout
-             target_layout = QGridLayout()
-             target_widget.setLayout(target_layout)
-             target_layout.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        # ---
-
-        # 새 위젯 먼저 생성 (Create new widgets first)
-        new_search_widgets = []
-        for item_path in item_paths: # item_paths는 폴더 경로 리스트 (item_paths is a list of folder paths)
-            try:
-                item_folder_name = os.path.basename(item_path)
-                # 부모는 단일 content_widget (Parent is the single content_widget)
-                item_widget = FolderItemWidget(item_path, item_folder_name, parent=target_widget)
-                item_widget.item_double_clicked.connect(self.select_tree_item) # 검색 결과 클릭 시 트리 선택 (Connect tree selection on search result click)
-                new_search_widgets.append(item_widget)
-            except Exception as search_widget_e:
-                 logger.error(f"{item_path}에 대한 검색 결과 위젯 생성 오류: {search_widget_e}")
-                 QMessageBox.warning(self, "검색 위젯 생성 오류", f"검색 결과 위젯 생성 중 오류 발생:\n{os.path.basename(item_path)}\n{search_widget_e}")
-
-        # 새 검색 결과 위젯 생성 후 기존 레이아웃 비우기 (Clear existing layout AFTER creating new search result widgets)
-        if target_layout:
-            while target_layout.count():
-                layout_item = target_layout.takeAt(0)
-                widget = layout_item.widget()
-                if widget:
-                    widget.setParent(None) # 명시적으로 부모 제거 (Explicitly remove parent)
-                    widget.deleteLater()
+        # 검색 결과는 모두 아이템 폴더 (수정 시간/크기는 표시에 쓰이지 않으므로 읽지 않음)
+        items = [DirectoryItem(item_path, os.path.basename(item_path), True) for item_path in item_paths]
+        key, reverse = sort_key(self.current_sort_criteria)
+        items.sort(key=key, reverse=reverse)
+        self._show_search_items(items)
+
+    def _show_search_items(self, items):
+        """검색 결과 아이템을 주어진 순서대로 표시 (정렬을 바꾸면 그 기준으로 다시 정렬됨)"""
+        self._begin_search_results()
+        self.hide_progress()
+        self.item_view.set_empty_text("검색 결과 없음")
+        self.item_model.set_items(items)
+
+        # 폴더 커버를 백그라운드에서 일괄 검색
+        self._resolve_folder_covers(items)
+
+        # 검색 결과 썸네일 지연 로딩 시작
+        self._lazy_load_timer.start()
+
+    def _begin_search_results(self):
+        """
+        검색 결과를 표시하기 전에 진행 중인 목록 읽기/검색을 취소하고 빈 목록에서 시작합니다.
+        검색 결과는 디렉토리 감시/목록 캐시 대상이 아닙니다.
+        """
+        self._save_view_state()
+        self.directory_lister.cancel()
+        self.catalog_search.cancel()
+        self._current_search = None
+        self._pending_result_cache = None
+        self._listing_active = False
+        self._listing_path = None
+        self._pending_scroll = None
+        self.directory_watcher.watch(None)
+        self.thumbnail_scheduler.cancel_all()
+        self.item_model.clear()
+        self.item_view.scrollToTop()
+        self.folder_cover_cache.resolve([])
+        self.folder_tag_cache.load([])
+
+    @handle_exceptions
+    def open_advanced_search(self):
+        """고급 검색 다이얼로그를 열고 조건에 맞는 파일을 표시"""
+        dialog = AdvancedSearchDialog(self)
+        if dialog.exec():
+            self.advanced_search(dialog.get_search_criteria())
+
+    def advanced_search(self, criteria, saved_name=None):
+        """
+        파일 카탈로그에서 고급 검색 조건(이름/크기/날짜/확장자)에 맞는 파일을 찾아 표시합니다.
+        결과는 백그라운드에서 색인으로 질의되어 도착하는 묶음부터 표시됩니다.
+        저장된 검색이면 색인이 그대로일 때 캐시된 결과를 바로 표시하고, 아니면 끝난 뒤 결과를 캐시합니다.
+        """
+        logger.info(f"고급 검색: {criteria}")
+        cached_items = None
+        if saved_name:
+            index_version = self.data_manager.index_version()
+            cached_items = self.search_manager.cached_results(saved_name, index_version)
+        if cached_items is not None:
+            key, reverse = sort_key(self.current_sort_criteria)
+            self._show_search_items(sorted(cached_items, key=key, reverse=reverse))
+            self.search_manager.add_to_history(SEARCH_TYPE_ADVANCED, criteria, cached_items)
         else:
-             # 이 경우는 위의 검사로 인해 발생하지 않아야 하지만, 발생하면 기록합니다. (This case should ideally not happen due to checks above, but log if it does.)
-             logger.error("오류: 검색 결과를 추가하기 전에 target_layout이 유효하지 않게 되었습니다. (Error: target_layout became invalid before adding search results.)")
-
-        # 이제 비어 있는 레이아웃에 새 위젯 또는 "검색 결과 없음" 라벨 추가 (Add new widgets or "No results" label to the now empty layout)
-        if not new_search_widgets:
-            # 고정 스타일로 "검색 결과 없음" 라벨 추가 (Add "No results" label with fixed style)
-            no_results_label = QLabel("검색 결과 없음")
-            no_results_label.setStyleSheet("padding: 20px; color: gray;") # 고정 스타일 사용 (Use fixed style)
-            no_results_label.setAlignment(Qt.AlignCenter)
-            target_layout.addWidget(no_results_label, 0, 0)
+            self._begin_search_results()
+            self.show_progress()
+            self.item_view.set_empty_text("")
+            self.catalog_search.search(criteria)
+            if saved_name:
+                self._pending_result_cache = (saved_name, index_version)
+        self._current_search = (SEARCH_TYPE_ADVANCED, criteria)
+
+    @handle_exceptions
+    def _on_catalog_search_batch(self, generation, items):
+        """고급 검색 결과 묶음을 정렬 순서에 맞춰 추가"""
+        first_batch = self.item_model.rowCount() == 0
+        sort_func, reverse = sort_key(self.current_sort_criteria)
+        self.item_model.add_items(items, key=sort_func, reverse=reverse)
+        if first_batch:
+            self._lazy_load_thumbnails()
         else:
-            # 현재 너비를 기준으로 열 개수 계산 (검색 결과에도 적용) (Calculate columns based on current width for search results too)
-            viewport_width = self.scroll_area.viewport().width()
-            item_width = ITEM_WIDGET_WIDTH # 임포트된 상수 사용 (Use imported constant)
-            spacing = target_layout.spacing() if target_layout else 10 # 레이아웃 간격 또는 기본값 사용 (Use layout spacing or default)
-            col_count = max(1, int(viewport_width / (item_width + spacing)))
-            row, col = 0, 0
+            self._lazy_load_timer.start()
 
-            for item_widget in new_search_widgets: # These are already FolderItemWidget instances
-                target_layout.addWidget(item_widget, row, col)
-                col += 1
+    def _on_catalog_search_finished(self, generation, error):
+        """고급 검색 완료 (또는 실패)"""
+        self.hide_progress()
+        if error:
+            logger.error(f"고급 검색 실패: {error}")
+            self.item_view.set_empty_text(f"검색할 수 없습니다:\n{error}", "red")
+            return
+        self.item_view.set_empty_text("검색 결과 없음")
+        logger.info(f"고급 검색 결과 {self.item_model.rowCount()}개 표시")
+        if self._current_search and self._current_search[0] == SEARCH_TYPE_ADVANCED:
+            self.search_manager.add_to_history(SEARCH_TYPE_ADVANCED, self._current_search[1],
+                                               self.item_model.all_items())
+        if self._pending_result_cache is not None:
+            saved_name, index_version = self._pending_result_cache
+            self._pending_result_cache = None
+            self.search_manager.cache_results(saved_name, index_version, list(self.item_model.all_items()))
+
+    @handle_exceptions
+    def open_saved_searches(self):
+        """저장된 검색 다이얼로그 (현재 검색 결과의 조건 저장 / 저장된 검색 다시 실행)"""
+        search_type, criteria = self._current_search or (None, None)
+        dialog = SearchSaveDialog(self.search_manager, search_type, criteria, self)
+        if dialog.exec() and dialog.loaded_name:
+            self.run_saved_search(dialog.loaded_name)
+
+    @handle_exceptions
+    def open_search_history(self):
+        """검색 기록 다이얼로그 (선택한 검색 다시 실행)"""
+        dialog = SearchHistoryDialog(self.search_manager, self)
+        if dialog.exec():
+            self._run_search(dialog.search_type, dialog.criteria)
+
+    @handle_exceptions
+    def open_tag_cloud(self):
+        """태그 구름 다이얼로그 (선택한 태그로 검색)"""
+        dialog = TagCloudDialog(self.data_manager.tag_stats, self)
+        if dialog.exec() and dialog.selected_tag:
+            self._run_search(SEARCH_TYPE_TAG, quote_tag(dialog.selected_tag))
+
+    def run_saved_search(self, name):
+        """저장된 검색을 현재 색인에 다시 실행 (결과는 항상 최신)"""
+        saved_search = self.search_manager.get_saved_search(name)
+        if saved_search:
+            self._run_search(saved_search['type'], saved_search['criteria'], saved_name=name)
+
+    def _run_search(self, search_type, criteria, saved_name=None):
+        """저장된 검색/검색 기록의 조건으로 다시 검색"""
+        if search_type == SEARCH_TYPE_ADVANCED:
+            self.advanced_search(criteria, saved_name=saved_name)
+            return
+        if isinstance(criteria, list):
+            criteria = ", ".join(criteria)  # 예전 형식의 기록: 태그 리스트
+
+        # 검색창도 저장된 질의로 바꿈 (입력/검색 방식 변경 시그널로 다시 검색하지 않도록 막음)
+        for widget in (self.search_input, self.search_mode_combo):
+            widget.blockSignals(True)
+        self.search_input.setText(criteria)
+        self.search_mode_combo.setCurrentIndex(SEARCH_MODE_TAGS)
+        for widget in (self.search_input, self.search_mode_combo):
+            widget.blockSignals(False)
+        self._update_search_placeholder()
+        self._run_tag_query(criteria, saved_name=saved_name)
+
+    def _resolve_folder_covers(self, items, append=False):
+        """
+        표시된 폴더들의 커버 이미지와 태그를 한 번에 요청 (이전에 찾은 값은 바로 적용).
+        태그는 백그라운드에서 묶어서 읽은 뒤 모델에 일괄 반영됩니다.
+        """
+        folder_paths = [item.path for item in items if item.is_dir]
+        for path in folder_paths:
+            cover_path = self.folder_cover_cache.get(path)
+            if cover_path:
+                self.item_model.set_cover(path, cover_path)
+            tags = self.folder_tag_cache.get(path)
+            if tags is not None:
+                self.item_model.set_tags(path, tags)
+        self.folder_cover_cache.resolve(folder_paths, append=append)
+        self.folder_tag_cache.load(folder_paths, append=append)
+
+    def _on_folder_tags_loaded(self, tags_by_path):
+        """백그라운드에서 읽은 태그를 모델에 일괄 반영"""
+        self.item_model.set_tags_batch(tags_by_path)
+
+    def _on_folder_covers_resolved(self, covers):
+        """백그라운드에서 찾은 커버를 모델에 반영하고 보이는 썸네일 다시 로드"""
+        for path, cover_path in covers.items():
+            self.item_model.set_cover(path, cover_path)
+        self._lazy_load_timer.start()
+
+    @handle_exceptions
+    def on_item_activated(self, item_path):
+        """아이템 더블 클릭: 폴더는 트리에서 선택, 파일은 탐색기에서 위치 표시"""
+        logger.info(f"아이템 더블 클릭: {item_path}")
+        if os.path.isdir(item_path):
+            self.select_tree_item(item_path)
+        elif os.path.exists(item_path):
+            reveal_in_file_manager(item_path)
+
+    @handle_exceptions
+    def edit_item_tags(self, item_path):
+        """태그 편집 다이얼로그를 열고 변경된 태그를 저장"""
+        current_tags = self.data_manager.load_tags(item_path)
+        dialog = TagEditDialog(current_tags, self, theme_name=getattr(self, 'theme_name', 'white'),
+                               tag_stats=self.data_manager.tag_stats)
+        if dialog.exec(): # 사용자가 '확인'을 누르면
+            new_tags = dialog.get_tags()
+            # 태그가 실제로 변경되었는지 확인 후 저장 (순서 무시)
+            if set(current_tags) != set(new_tags):
+                logger.info(f"{os.path.basename(item_path)}의 태그 변경됨: {new_tags}")
+                error = self.data_manager.save_tags(item_path, new_tags)
+                if error:
+                    QMessageBox.warning(self, "저장 오류", f"태그 저장 실패:\n{error}")
+                    return
+                self.item_model.set_tags(item_path, new_tags)
+                self.folder_tag_cache.invalidate(item_path)
+
+    def _on_prewarm_progress(self, done, total):
+        """썸네일 사전 생성 진행 상태 표시"""
+        self.statusBar().setVisible(True)
+        self.prewarm_label.setText(f"썸네일 준비 중: {done}/{total}")
+
+    def _on_prewarm_completed(self):
+        """썸네일 사전 생성 완료 시 상태 표시줄 숨김"""
+        logger.info("썸네일 사전 생성 완료")
+        self.statusBar().setVisible(False)
 
     def show_progress(self, show=True):
         """진행 상태 표시줄 표시/숨김"""
@@ -785,6 +1183,8 @@ class BoothManager(QMainWindow):
         self.progress_bar.setVisible(False)
 
 if __name__ == "__main__":
+    # PyInstaller로 빌드된 경우 썸네일 워커 프로세스 실행에 필요
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = BoothManager()
     window.show()
@@ -0,0 +1,447 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from datetime import datetime
+
+DB_FILE_NAME = ".booth_metadata.sqlite3"
+META_FILE_NAME = ".meta.json"
+SCHEMA_VERSION = 1
+# IN (...) 조회 한 번에 넣을 경로 수 (SQLite 변수 개수 제한보다 작게)
+BATCH_QUERY_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    path TEXT PRIMARY KEY,          -- base_path 기준 상대 경로
+    item_id TEXT,                   -- Booth 상품 ID
+    title TEXT,
+    shop TEXT,
+    downloaded_at TEXT,             -- 마지막 다운로드 시각 (ISO 8601)
+    meta_mtime REAL,                -- 마지막으로 맞춘 .meta.json 수정 시간 (0: 사이드카 삭제됨)
+    updated_at REAL
+);
+CREATE TABLE IF NOT EXISTS item_tags (
+    path TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (path, tag)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS item_tags_tag ON item_tags (tag);
+CREATE TABLE IF NOT EXISTS item_files (
+    path TEXT NOT NULL,
+    name TEXT NOT NULL,             -- 아이템 폴더 기준 파일 이름
+    size INTEGER,
+    downloaded_at TEXT,
+    PRIMARY KEY (path, name)
+) WITHOUT ROWID;
+"""
+
+# .meta.json과 주고받는 items 테이블 필드
+SIDECAR_FIELDS = ("item_id", "title", "shop", "downloaded_at")
+# 사이드카가 밖에서 지워져 태그를 비웠음을 나타내는 meta_mtime (다시 쓰지 않음)
+SIDECAR_DELETED = 0
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_metadata_store(base_path):
+    """base_path의 메타데이터 저장소 (같은 경로는 프로세스 안에서 하나를 공유)"""
+    key = os.path.normpath(os.path.abspath(base_path))
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = MetadataStore(key)
+        return store
+
+
+def clean_tags(raw_tags):
+    """태그 값을 공백 제거/중복 제거한 정렬 리스트로 변환 (리스트가 아니면 빈 리스트)"""
+    if not isinstance(raw_tags, (list, tuple, set, frozenset)):
+        return []
+    return sorted(set(str(tag).strip() for tag in raw_tags if str(tag).strip()))
+
+
+class MetadataStore:
+    """
+    아이템 메타데이터(태그, Booth 상품 ID, 제목, 상점, 다운로드 시각, 파일 목록)를
+    base_path의 SQLite 데이터베이스(WAL 모드) 하나에 모아 관리합니다.
+
+    폴더별 .meta.json은 가져오기/내보내기용 사이드카로 유지합니다.
+    저장소에 쓸 때마다 사이드카도 갱신하고, 사이드카가 밖에서 바뀌면 (수정 시간 비교)
+    import_sidecar()/sync_sidecars()로 다시 가져옵니다. 맞춘 적이 있는 사이드카가 밖에서 지워지면
+    그 아이템의 태그를 지운 것으로 봅니다 (다운로드 기록은 유지).
+    연결은 스레드마다 따로 열어 GUI 스레드와 백그라운드 작업에서 함께 쓸 수 있습니다.
+    """
+    def __init__(self, base_path):
+        self.base_path = base_path
+        self.db_path = os.path.join(base_path, DB_FILE_NAME)
+        self._local = threading.local()
+        self.version = 0  # 아이템 정보(태그/제목/상점/파일 목록)를 쓸 때마다 증가 (저장된 검색 결과 캐시 검증용)
+        self._init_schema()
+
+    # --- 연결 ---
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        conn = self._connection()
+        with conn:
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def close(self):
+        """현재 스레드의 연결 닫기"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # --- 경로 ---
+    def rel_path(self, item_path):
+        """base_path 기준 상대 경로 (밖의 경로면 None)"""
+        try:
+            rel_path = os.path.relpath(os.path.normpath(item_path), self.base_path)
+        except ValueError:
+            return None  # Windows에서 다른 드라이브
+        return None if rel_path.startswith(os.pardir) else rel_path
+
+    def abs_path(self, rel_path):
+        return os.path.normpath(os.path.join(self.base_path, rel_path))
+
+    # --- 조회 ---
+    def get_tags(self, item_path):
+        """아이템 폴더의 태그 (정렬된 리스트)"""
+        return self.get_tags_batch([item_path]).get(item_path, [])
+
+    def get_tags_batch(self, item_paths):
+        """
+        여러 아이템 폴더의 태그를 한 번에 조회합니다 (디렉토리 목록 단위).
+
+        Returns:
+            dict: {item_path: 정렬된 태그 리스트} (태그가 없는 폴더는 빈 리스트).
+        """
+        by_rel = {}
+        for item_path in item_paths:
+            rel_path = self.rel_path(item_path)
+            if rel_path is not None:
+                by_rel[rel_path] = item_path
+        results = {item_path: [] for item_path in item_paths}
+        rel_paths = list(by_rel)
+        conn = self._connection()
+        for start in range(0, len(rel_paths), BATCH_QUERY_SIZE):
+            chunk = rel_paths[start:start + BATCH_QUERY_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT path, tag FROM item_tags WHERE path IN ({placeholders}) ORDER BY path, tag", chunk)
+            for rel_path, tag in rows:
+                results[by_rel[rel_path]].append(tag)
+        return results
+
+    def get_item(self, item_path):
+        """아이템 정보 (items 필드 + tags + files). 저장소에 없으면 None."""
+        rel_path = self.rel_path(item_path)
+        if rel_path is None:
+            return None
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT item_id, title, shop, downloaded_at, meta_mtime FROM items WHERE path = ?",
+            (rel_path,)).fetchone()
+        if row is None:
+            return None
+        item = dict(zip(SIDECAR_FIELDS + ("meta_mtime",), row))
+        item["tags"] = [tag for (tag,) in conn.execute(
+            "SELECT tag FROM item_tags WHERE path = ? ORDER BY tag", (rel_path,))]
+        item["files"] = [{"name": name, "size": size, "downloaded_at": downloaded_at}
+                         for name, size, downloaded_at in conn.execute(
+                             "SELECT name, size, downloaded_at FROM item_files WHERE path = ? ORDER BY name",
+                             (rel_path,))]
+        return item
+
+    def all_tags(self):
+        """(아이템 폴더 절대 경로, 태그) 전체 목록 (태그 색인 생성용)"""
+        rows = self._connection().execute("SELECT path, tag FROM item_tags")
+        return [(self.abs_path(rel_path), tag) for rel_path, tag in rows]
+
+    def all_items(self):
+        """(아이템 폴더 절대 경로, 제목, 상점) 전체 목록 (검색 색인 생성용)"""
+        rows = self._connection().execute("SELECT path, title, shop FROM items")
+        return [(self.abs_path(rel_path), title, shop) for rel_path, title, shop in rows]
+
+    def items_by_shop(self, shop, prefix=False):
+        """상점 이름(Booth 서브도메인)이 shop인 (prefix면 shop으로 시작하는) 아이템 폴더 (대소문자 무시)"""
+        shop = shop.lower()
+        if prefix:
+            rows = self._connection().execute(
+                "SELECT path FROM items WHERE lower(shop) >= ? AND lower(shop) < ?", (shop, shop + "\uffff"))
+        else:
+            rows = self._connection().execute("SELECT path FROM items WHERE lower(shop) = ?", (shop,))
+        return [self.abs_path(rel_path) for (rel_path,) in rows]
+
+    def items_by_title(self, text):
+        """제목에 text가 들어 있는 아이템 폴더 (대소문자 무시)"""
+        rows = self._connection().execute(
+            "SELECT path FROM items WHERE instr(lower(title), ?) > 0", (text.lower(),))
+        return [self.abs_path(rel_path) for (rel_path,) in rows]
+
+    # --- 쓰기 ---
+    def set_tags(self, item_path, tags):
+        """
+        태그를 저장하고 .meta.json 사이드카도 갱신합니다 (한 트랜잭션).
+
+        Returns:
+            str: 오류 메시지. 성공 시 None.
+        """
+        rel_path = self.rel_path(item_path)
+        tags = clean_tags(tags)
+        try:
+            if rel_path is not None:
+                conn = self._connection()
+                with conn:
+                    self._ensure_item(conn, rel_path)
+                    conn.execute("DELETE FROM item_tags WHERE path = ?", (rel_path,))
+                    conn.executemany("INSERT INTO item_tags (path, tag) VALUES (?, ?)",
+                                     [(rel_path, tag) for tag in tags])
+                    self._write_sidecar(conn, rel_path, item_path, tags=tags)
+                self.version += 1
+            else:
+                # base_path 밖의 폴더는 사이드카에만 기록
+                self._write_sidecar(None, None, item_path, tags=tags)
+            return None
+        except (sqlite3.Error, OSError) as e:
+            print(f"태그 저장 오류 {item_path}: {e}")
+            return str(e)
+
+    def record_download(self, item_path, item_id=None, title=None, shop=None, files=()):
+        """
+        다운로드한 아이템 정보와 파일 목록을 기록합니다 (사이드카도 갱신).
+
+        Args:
+            item_path (str): 아이템 폴더 경로.
+            files (iterable): 다운로드한 파일 경로들.
+        """
+        rel_path = self.rel_path(item_path)
+        if rel_path is None:
+            return
+        now = datetime.now().isoformat(timespec="seconds")
+        manifest = []
+        for file_path in files:
+            try:
+                size = os.path.getsize(file_path)
+            except OSError:
+                continue
+            manifest.append((rel_path, os.path.relpath(file_path, item_path), size, now))
+        try:
+            conn = self._connection()
+            with conn:
+                self._ensure_item(conn, rel_path)
+                conn.execute(
+                    "UPDATE items SET item_id = COALESCE(?, item_id), title = COALESCE(?, title), "
+                    "shop = COALESCE(?, shop), downloaded_at = ?, updated_at = ? WHERE path = ?",
+                    (item_id, title, shop, now, time.time(), rel_path))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO item_files (path, name, size, downloaded_at) VALUES (?, ?, ?, ?)",
+                    manifest)
+                self._write_sidecar(conn, rel_path, item_path)
+            self.version += 1
+        except (sqlite3.Error, OSError) as e:
+            print(f"다운로드 정보 기록 오류 {item_path}: {e}")
+
+    def _ensure_item(self, conn, rel_path):
+        conn.execute("INSERT OR IGNORE INTO items (path, updated_at) VALUES (?, ?)", (rel_path, time.time()))
+
+    # --- 사이드카 (.meta.json) ---
+    def _write_sidecar(self, conn, rel_path, item_path, tags=None):
+        """
+        저장소의 내용을 .meta.json에 씁니다 (사이드카에만 있는 다른 필드는 유지).
+        기록한 수정 시간을 저장소에 남겨, 밖에서 바뀐 경우만 다시 가져오도록 합니다.
+        """
+        meta_path = os.path.join(item_path, META_FILE_NAME)
+        meta_data = self._read_sidecar(meta_path) or {}
+        if conn is not None:
+            row = conn.execute("SELECT item_id, title, shop, downloaded_at FROM items WHERE path = ?",
+                               (rel_path,)).fetchone()
+            for field, value in zip(SIDECAR_FIELDS, row or ()):
+                if value is not None:
+                    meta_data[field] = value
+            if tags is None:
+                tags = [tag for (tag,) in conn.execute(
+                    "SELECT tag FROM item_tags WHERE path = ? ORDER BY tag", (rel_path,))]
+            files = [{"name": name, "size": size, "downloaded_at": downloaded_at}
+                     for name, size, downloaded_at in conn.execute(
+                         "SELECT name, size, downloaded_at FROM item_files WHERE path = ? ORDER BY name",
+                         (rel_path,))]
+            if files:
+                meta_data["files"] = files
+        meta_data["tags"] = list(tags or [])
+
+        tmp_path = meta_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            # JSON 형식으로 저장 (들여쓰기 적용, ASCII 아닌 문자 유지)
+            json.dump(meta_data, f, ensure_ascii=False, indent=4)
+        os.replace(tmp_path, meta_path)
+        if conn is not None:
+            conn.execute("UPDATE items SET meta_mtime = ?, updated_at = ? WHERE path = ?",
+                         (os.stat(meta_path).st_mtime, time.time(), rel_path))
+
+    def _read_sidecar(self, meta_path):
+        """사이드카 읽기 (없거나 JSON 객체가 아니면 None)"""
+        if not os.path.exists(meta_path):
+            return None
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta_data = json.load(f)
+            if isinstance(meta_data, dict):
+                return meta_data
+            print(f"경고: 메타 파일 {meta_path}이 유효한 JSON 객체를 포함하지 않습니다.")
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"메타 파일 {meta_path} 읽기 오류: {e}")
+        return None
+
+    def import_sidecar(self, item_path, meta_mtime=None):
+        """
+        .meta.json이 마지막으로 맞춘 뒤 바뀌었으면 저장소로 가져옵니다.
+
+        Returns:
+            bool: 가져왔는지 여부.
+        """
+        rel_path = self.rel_path(item_path)
+        if rel_path is None:
+            return False
+        meta_path = os.path.join(item_path, META_FILE_NAME)
+        conn = self._connection()
+        if meta_mtime is None:
+            try:
+                meta_mtime = os.stat(meta_path).st_mtime
+            except OSError:
+                # 맞춘 적이 있는 사이드카가 지워졌으면 태그 삭제로 반영
+                row = conn.execute("SELECT meta_mtime FROM items WHERE path = ?", (rel_path,)).fetchone()
+                if row is None or row[0] in (None, SIDECAR_DELETED) or not os.path.isdir(item_path):
+                    return False
+                with conn:
+                    self._clear_deleted_sidecar(conn, rel_path)
+                self.version += 1
+                return True
+        row = conn.execute("SELECT meta_mtime FROM items WHERE path = ?", (rel_path,)).fetchone()
+        if row is not None and row[0] == meta_mtime:
+            return False
+
+        with conn:
+            self._import_sidecar(conn, rel_path, meta_path, meta_mtime)
+        self.version += 1
+        return True
+
+    def _import_sidecar(self, conn, rel_path, meta_path, meta_mtime):
+        """사이드카 내용으로 저장소의 항목을 덮어씁니다 (트랜잭션 안에서 호출)."""
+        meta_data = self._read_sidecar(meta_path) or {}
+        self._ensure_item(conn, rel_path)
+        values = [meta_data.get(field) if isinstance(meta_data.get(field), str) else None
+                  for field in SIDECAR_FIELDS]
+        conn.execute(
+            "UPDATE items SET item_id = COALESCE(?, item_id), title = COALESCE(?, title), "
+            "shop = COALESCE(?, shop), downloaded_at = COALESCE(?, downloaded_at), "
+            "meta_mtime = ?, updated_at = ? WHERE path = ?",
+            (*values, meta_mtime, time.time(), rel_path))
+        conn.execute("DELETE FROM item_tags WHERE path = ?", (rel_path,))
+        conn.executemany("INSERT INTO item_tags (path, tag) VALUES (?, ?)",
+                         [(rel_path, tag) for tag in clean_tags(meta_data.get("tags", []))])
+        files = meta_data.get("files")
+        if isinstance(files, list):
+            conn.execute("DELETE FROM item_files WHERE path = ?", (rel_path,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO item_files (path, name, size, downloaded_at) VALUES (?, ?, ?, ?)",
+                [(rel_path, str(f["name"]), f.get("size"), f.get("downloaded_at"))
+                 for f in files if isinstance(f, dict) and f.get("name")])
+
+    def _clear_deleted_sidecar(self, conn, rel_path):
+        """사이드카가 밖에서 지워진 아이템의 태그를 지움 (제목/상점/파일 목록은 유지, 트랜잭션 안에서 호출)"""
+        conn.execute("DELETE FROM item_tags WHERE path = ?", (rel_path,))
+        conn.execute("UPDATE items SET meta_mtime = ?, updated_at = ? WHERE path = ?",
+                     (SIDECAR_DELETED, time.time(), rel_path))
+
+    def find_sidecars(self):
+        """
+        base_path 아래를 직접 훑어 .meta.json이 있는 폴더를 찾습니다 (파일 카탈로그가 없을 때 사용).
+
+        Returns:
+            dict: {아이템 폴더 경로: .meta.json 수정 시간}.
+        """
+        sidecars = {}
+        for root, dirs, files in os.walk(self.base_path):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            if META_FILE_NAME not in files:
+                continue
+            try:
+                sidecars[root] = os.stat(os.path.join(root, META_FILE_NAME)).st_mtime
+            except OSError:
+                continue
+        return sidecars
+
+    def sync_sidecars(self, sidecars=None):
+        """
+        저장소와 base_path 아래의 .meta.json을 양방향으로 맞춥니다.
+        바뀐 사이드카는 가져오고, 폴더 자체가 사라진 기록(폴더 삭제/이동)은 지웁니다.
+        폴더는 있는데 사이드카가 지워졌으면, 맞춘 적이 있는 사이드카는 밖에서 지운 것으로 보고
+        그 아이템의 태그를 지우며 (다운로드 기록은 유지), 사이드카로 쓴 적이 없는 저장소 내용만 새로 씁니다.
+
+        Args:
+            sidecars (dict): {아이템 폴더 경로: .meta.json 수정 시간} (파일 카탈로그에서 조회).
+                None이면 find_sidecars()로 직접 훑습니다.
+
+        Returns:
+            bool: 저장소가 바뀌었는지 여부.
+        """
+        if sidecars is None:
+            sidecars = self.find_sidecars()
+        conn = self._connection()
+        known = dict(conn.execute("SELECT path, meta_mtime FROM items"))
+        seen = set()
+        changed = False
+        # 바뀐 사이드카는 한 트랜잭션으로 가져옴 (처음 가져올 때 수천 개도 커밋 한 번)
+        with conn:
+            for item_path, meta_mtime in sidecars.items():
+                rel_path = self.rel_path(item_path)
+                if rel_path is None:
+                    continue
+                seen.add(rel_path)
+                if known.get(rel_path) != meta_mtime:
+                    self._import_sidecar(conn, rel_path, os.path.join(item_path, META_FILE_NAME), meta_mtime)
+                    changed = True
+
+        stale = []
+        deleted = []
+        for rel_path, known_mtime in known.items():
+            if rel_path in seen or known_mtime == SIDECAR_DELETED:
+                continue
+            item_path = self.abs_path(rel_path)
+            if not os.path.isdir(item_path):
+                stale.append((rel_path,))
+            elif known_mtime is not None:
+                deleted.append(rel_path)  # 맞춘 뒤 밖에서 지운 사이드카
+            else:
+                # 사이드카로 쓴 적이 없는 저장소 내용은 새로 씀
+                try:
+                    with conn:
+                        self._write_sidecar(conn, rel_path, item_path)
+                except (sqlite3.Error, OSError) as e:
+                    print(f"메타 파일 복원 오류 {item_path}: {e}")
+        if deleted:
+            with conn:
+                for rel_path in deleted:
+                    self._clear_deleted_sidecar(conn, rel_path)
+            changed = True
+        if stale:
+            with conn:
+                conn.executemany("DELETE FROM items WHERE path = ?", stale)
+                conn.executemany("DELETE FROM item_tags WHERE path = ?", stale)
+                conn.executemany("DELETE FROM item_files WHERE path = ?", stale)
+            changed = True
+        if changed:
+            self.version += 1
+        return changed
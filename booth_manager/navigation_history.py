@@ -0,0 +1,126 @@
+import os
+from collections import OrderedDict
+
+# 기억할 최근 디렉토리 목록 수와 전체 아이템 수 상한 (큰 폴더가 메모리를 독차지하지 않도록)
+MAX_CACHED_LISTINGS = 8
+MAX_CACHED_ITEMS = 200000
+# 뒤로/앞으로 기록 길이
+MAX_HISTORY = 100
+
+
+class ViewState:
+    """기록 항목 하나를 떠날 때의 보기 상태 (목록 캐시와 별개로 유지)"""
+    __slots__ = ("scroll", "sort_criteria", "filter_text")
+
+    def __init__(self, scroll=0, sort_criteria=0, filter_text=""):
+        self.scroll = scroll
+        self.sort_criteria = sort_criteria
+        self.filter_text = filter_text
+
+
+class NavigationHistory:
+    """
+    웹 브라우저와 같은 뒤로/앞으로 이동 기록.
+    항목마다 떠날 때의 보기 상태(ViewState)를 함께 기억하여, 목록 캐시에서 밀려났거나
+    디렉토리가 바뀌어 다시 읽어야 해도 뒤로/앞으로 이동 시 정렬/필터/스크롤을 복원할 수 있습니다.
+    """
+    def __init__(self, max_length=MAX_HISTORY):
+        self.max_length = max_length
+        self._back = []      # 이전 (경로, 보기 상태)들 (마지막이 가장 최근)
+        self._forward = []   # 뒤로 간 뒤의 다음 (경로, 보기 상태)들 (마지막이 가장 가까움)
+        self.current = None
+        self.state = None    # 현재 항목의 보기 상태 (떠날 때 save_state로 기록)
+
+    def visit(self, path):
+        """새 경로로 이동 (앞으로 기록은 지워짐). 현재 경로와 같으면 무시."""
+        if path == self.current:
+            return
+        if self.current is not None:
+            self._back.append((self.current, self.state))
+            del self._back[:-self.max_length]
+        self._forward.clear()
+        self.current = path
+        self.state = None
+
+    def save_state(self, state):
+        """현재 항목의 보기 상태 기록"""
+        self.state = state
+
+    def can_go_back(self):
+        return bool(self._back)
+
+    def can_go_forward(self):
+        return bool(self._forward)
+
+    def back(self):
+        """이전 경로로 이동하고 그 경로를 반환 (없으면 None)"""
+        if not self._back:
+            return None
+        self._forward.append((self.current, self.state))
+        self.current, self.state = self._back.pop()
+        return self.current
+
+    def forward(self):
+        """다음 경로로 이동하고 그 경로를 반환 (없으면 None)"""
+        if not self._forward:
+            return None
+        self._back.append((self.current, self.state))
+        self.current, self.state = self._forward.pop()
+        return self.current
+
+
+class ListingEntry:
+    """캐시된 디렉토리 목록 하나 (items의 정렬 기준과 떠날 때의 스크롤 위치 포함)"""
+    __slots__ = ("mtime", "items", "scroll", "sort_criteria")
+
+    def __init__(self, mtime, items, scroll=0, sort_criteria=0):
+        self.mtime = mtime
+        self.items = items
+        self.scroll = scroll
+        self.sort_criteria = sort_criteria
+
+
+class ListingCache:
+    """
+    최근 디렉토리 목록의 LRU 캐시.
+    디렉토리 수정 시간이 저장할 때와 같을 때만 유효하므로 (항목 추가/삭제/이름 변경 시 바뀜)
+    다시 돌아온 폴더를 디렉토리를 읽지 않고 바로 표시할 수 있습니다.
+    """
+    def __init__(self, max_entries=MAX_CACHED_LISTINGS, max_items=MAX_CACHED_ITEMS):
+        self.max_entries = max_entries
+        self.max_items = max_items
+        self._entries = OrderedDict()  # dir_path -> ListingEntry
+        self._item_count = 0
+
+    def get(self, dir_path):
+        """
+        유효한 캐시 항목을 반환합니다 (디렉토리 수정 시간이 바뀌었으면 버리고 None).
+        """
+        entry = self._entries.get(dir_path)
+        if entry is None:
+            return None
+        try:
+            mtime = os.stat(dir_path).st_mtime
+        except OSError:
+            mtime = None
+        if mtime != entry.mtime:
+            self.discard(dir_path)
+            return None
+        self._entries.move_to_end(dir_path)
+        return entry
+
+    def put(self, dir_path, entry):
+        """목록 저장 (오래된 항목부터 밀어냄)"""
+        self.discard(dir_path)
+        if len(entry.items) > self.max_items:
+            return
+        self._entries[dir_path] = entry
+        self._item_count += len(entry.items)
+        while len(self._entries) > self.max_entries or self._item_count > self.max_items:
+            _, old = self._entries.popitem(last=False)
+            self._item_count -= len(old.items)
+
+    def discard(self, dir_path):
+        entry = self._entries.pop(dir_path, None)
+        if entry is not None:
+            self._item_count -= len(entry.items)
@@ -43,7 +43,10 @@ class SearchHistoryDialog(QDialog):
             formatted_time = timestamp.strftime("%Y-%m-%d %H:%M:%S")
             
             if item['type'] == 'tag':
-                criteria = f"태그: {', '.join(item['criteria'])}"
+                query = item['criteria']
+                if isinstance(query, list):
+                    query = ', '.join(query)  # 예전 형식: 태그 리스트
+                criteria = f"태그: {query}"
             else:  # advanced
                 criteria = "고급 검색"
                 
@@ -1,39 +1,156 @@
 import json
 import os
-from datetime import datetime
+from datetime import date, datetime
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer
 from PySide6.QtWidgets import QMessageBox
 
-class SearchManager:
-    def __init__(self, base_path):
+# 저장된 검색 종류: 'tag'는 태그 질의 문자열, 'advanced'는 고급 검색 조건 딕셔너리
+SEARCH_TYPE_TAG = 'tag'
+SEARCH_TYPE_ADVANCED = 'advanced'
+
+HISTORY_FILE_NAME = ".search_history.jsonl"
+LEGACY_HISTORY_FILE_NAME = ".search_history.json"
+# 검색 직후 바로 쓰지 않고 이 시간(ms) 동안 모아서 한 번에 추가
+HISTORY_FLUSH_DELAY = 2000
+# 로그 줄 수가 최대 기록 수의 이 배수를 넘으면 최근 기록만 남기고 다시 씀
+HISTORY_COMPACT_FACTOR = 4
+
+
+def _encode_value(value):
+    """JSON으로 저장할 수 없는 값 변환 (고급 검색 조건의 날짜)"""
+    if isinstance(value, date):
+        return {'__date__': value.isoformat()}
+    raise TypeError(f"저장할 수 없는 값: {value!r}")
+
+
+def _decode_value(obj):
+    if set(obj) == {'__date__'}:
+        return date.fromisoformat(obj['__date__'])
+    return obj
+
+
+def _history_line(history_item):
+    return json.dumps(history_item, ensure_ascii=False, default=_encode_value) + "\n"
+
+
+class HistoryWriteJob(QRunnable):
+    """
+    검색 기록 로그 쓰기 작업 (GUI 스레드 밖에서 실행).
+    lines를 파일 끝에 추가하거나, rewrite면 lines로 파일 전체를 바꿉니다 (압축/지우기).
+    """
+    def __init__(self, path, lines, rewrite=False):
+        super().__init__()
+        self.path = path
+        self.lines = lines
+        self.rewrite = rewrite
+
+    def run(self):
+        try:
+            if self.rewrite:
+                tmp_path = self.path + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.writelines(self.lines)
+                os.replace(tmp_path, self.path)
+            else:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.writelines(self.lines)
+        except OSError as e:
+            print(f"검색 히스토리 저장 오류: {e}")
+
+
+class SearchManager(QObject):
+    """
+    검색 히스토리와 저장된 검색을 관리합니다.
+
+    히스토리는 한 줄에 한 항목인 JSON Lines 로그(.search_history.jsonl)에 추가만 하며,
+    검색할 때마다 쓰지 않고 잠시 모아서 백그라운드 스레드에서 한 번에 추가합니다.
+    로그가 최대 기록 수보다 충분히 길어지면 최근 기록만 남기고 다시 씁니다 (압축).
+    파일 크기가 이렇게 제한되므로 처음 사용할 때 읽습니다.
+
+    저장된 검색은 결과가 아닌 검색 조건만 저장하고, 열 때마다 색인에 다시 실행합니다.
+    같은 실행 중에는 결과를 메모리에 캐시하되, 색인 버전(DataManager.index_version)이
+    저장 당시와 다르면 버리고 다시 실행합니다.
+    """
+    def __init__(self, base_path, parent=None):
+        super().__init__(parent)
         self.base_path = base_path
-        self.search_history_file = os.path.join(base_path, ".search_history.json")
+        self.search_history_file = os.path.join(base_path, HISTORY_FILE_NAME)
+        self.legacy_history_file = os.path.join(base_path, LEGACY_HISTORY_FILE_NAME)
         self.saved_searches_file = os.path.join(base_path, ".saved_searches.json")
         self.max_history_items = 50
-        self.load_history()
+        self._result_cache = {}  # 검색 이름 -> (색인 버전, 결과)
+
+        self.search_history = None  # 최신순 (처음 사용할 때 읽음)
+        self._log_lines = 0         # 로그 파일의 줄 수 (압축 시점 판단)
+        self._pending_lines = []    # 아직 쓰지 않은 기록
+        # 쓰기 순서를 지키기 위해 스레드 하나로 처리
+        self._write_pool = QThreadPool(self)
+        self._write_pool.setMaxThreadCount(1)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(HISTORY_FLUSH_DELAY)
+        self._flush_timer.timeout.connect(self.flush_history)
+
         self.load_saved_searches()
         
     def load_history(self):
-        """검색 히스토리를 로드합니다."""
+        """검색 히스토리 로그를 읽습니다 (예전 .search_history.json이 있으면 로그로 옮김)."""
+        history = []
         try:
             if os.path.exists(self.search_history_file):
                 with open(self.search_history_file, 'r', encoding='utf-8') as f:
-                    self.search_history = json.load(f)
-            else:
-                self.search_history = []
+                    for line in f:
+                        self._log_lines += 1
+                        try:
+                            history.append(json.loads(line, object_hook=_decode_value))
+                        except json.JSONDecodeError:
+                            continue  # 쓰다가 끊긴 줄 등은 건너뜀
+                history.reverse()
+            elif os.path.exists(self.legacy_history_file):
+                with open(self.legacy_history_file, 'r', encoding='utf-8') as f:
+                    history = json.load(f)
         except Exception as e:
             print(f"검색 히스토리 로드 오류: {e}")
-            self.search_history = []
-            
-    def save_history(self):
-        """검색 히스토리를 저장합니다."""
-        try:
-            with open(self.search_history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.search_history, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"검색 히스토리 저장 오류: {e}")
+        self.search_history = history[:self.max_history_items]
+
+        if os.path.exists(self.legacy_history_file) and not os.path.exists(self.search_history_file):
+            # 한 번뿐인 변환이므로 바로 쓴 뒤 예전 파일 삭제
+            HistoryWriteJob(self.search_history_file,
+                            [_history_line(item) for item in reversed(self.search_history)], rewrite=True).run()
+            self._log_lines = len(self.search_history)
+            if os.path.exists(self.search_history_file):
+                try:
+                    os.remove(self.legacy_history_file)
+                except OSError as e:
+                    print(f"예전 검색 히스토리 삭제 오류: {e}")
+
+    def _ensure_history(self):
+        if self.search_history is None:
+            self.load_history()
+
+    def flush_history(self, wait=False):
+        """
+        모아 둔 기록을 백그라운드에서 로그에 씁니다 (너무 길어졌으면 압축).
+
+        Args:
+            wait (bool): True면 쓰기가 끝날 때까지 기다림 (종료 시).
+        """
+        self._flush_timer.stop()
+        if self._pending_lines:
+            if self._log_lines + len(self._pending_lines) > self.max_history_items * HISTORY_COMPACT_FACTOR:
+                lines = [_history_line(item) for item in reversed(self.search_history)]
+                self._write_pool.start(HistoryWriteJob(self.search_history_file, lines, rewrite=True))
+                self._log_lines = len(lines)
+            else:
+                self._write_pool.start(HistoryWriteJob(self.search_history_file, self._pending_lines))
+                self._log_lines += len(self._pending_lines)
+            self._pending_lines = []
+        if wait:
+            self._write_pool.waitForDone()
             
     def add_to_history(self, search_type, criteria, results):
-        """검색 히스토리에 항목을 추가합니다."""
+        """검색 히스토리에 항목을 추가합니다 (파일에는 잠시 뒤 모아서 추가)."""
+        self._ensure_history()
         history_item = {
             'timestamp': datetime.now().isoformat(),
             'type': search_type,
@@ -43,41 +160,77 @@ class SearchManager:
         
         self.search_history.insert(0, history_item)
         if len(self.search_history) > self.max_history_items:
-            self.search_history = self.search_history[:self.max_history_items]
-            
-        self.save_history()
+            del self.search_history[self.max_history_items:]
+
+        self._pending_lines.append(_history_line(history_item))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
         
     def get_history(self):
-        """검색 히스토리를 반환합니다."""
+        """검색 히스토리를 반환합니다 (최신순)."""
+        self._ensure_history()
         return self.search_history
+
+    def history_queries(self):
+        """자동 완성용 최근 태그 검색어 (최신순, 중복 제외)"""
+        queries = []
+        for history_item in self.get_history():
+            criteria = history_item.get('criteria')
+            if history_item.get('type') == SEARCH_TYPE_TAG and isinstance(criteria, list):
+                criteria = ", ".join(criteria)  # 예전 형식: 태그 리스트
+            if history_item.get('type') == SEARCH_TYPE_TAG and criteria and criteria not in queries:
+                queries.append(criteria)
+        return queries
         
     def clear_history(self):
         """검색 히스토리를 초기화합니다."""
+        self._flush_timer.stop()
         self.search_history = []
-        self.save_history()
+        self._pending_lines = []
+        self._log_lines = 0
+        self._write_pool.start(HistoryWriteJob(self.search_history_file, [], rewrite=True))
         
     def load_saved_searches(self):
-        """저장된 검색을 로드합니다."""
+        """저장된 검색을 로드합니다 (예전 형식의 결과 목록은 버리고 조건만 남김)."""
         try:
             if os.path.exists(self.saved_searches_file):
                 with open(self.saved_searches_file, 'r', encoding='utf-8') as f:
-                    self.saved_searches = json.load(f)
+                    self.saved_searches = json.load(f, object_hook=_decode_value)
             else:
                 self.saved_searches = {}
         except Exception as e:
             print(f"저장된 검색 로드 오류: {e}")
             self.saved_searches = {}
-            
+            return
+
+        migrated = False
+        for saved_search in self.saved_searches.values():
+            if saved_search.pop('results', None) is not None:
+                migrated = True
+            criteria = saved_search.get('criteria')
+            if saved_search.get('type') == SEARCH_TYPE_TAG and isinstance(criteria, list):
+                saved_search['criteria'] = ", ".join(criteria)  # 예전 형식: 태그 리스트
+                migrated = True
+        if migrated:
+            self.save_searches()
+
     def save_searches(self):
         """저장된 검색을 저장합니다."""
         try:
             with open(self.saved_searches_file, 'w', encoding='utf-8') as f:
-                json.dump(self.saved_searches, f, ensure_ascii=False, indent=2)
+                json.dump(self.saved_searches, f, ensure_ascii=False, indent=2, default=_encode_value)
         except Exception as e:
             print(f"저장된 검색 저장 오류: {e}")
             
-    def save_search(self, name, search_type, criteria, results):
-        """검색을 저장합니다."""
+    def save_search(self, name, search_type, criteria):
+        """
+        검색 조건을 저장합니다 (결과는 저장하지 않음).
+
+        Args:
+            name (str): 검색 이름.
+            search_type (str): SEARCH_TYPE_TAG 또는 SEARCH_TYPE_ADVANCED.
+            criteria: 태그 질의 문자열 또는 고급 검색 조건 딕셔너리.
+        """
         if name in self.saved_searches:
             reply = QMessageBox.question(
                 None,
@@ -92,9 +245,9 @@ class SearchManager:
         self.saved_searches[name] = {
             'timestamp': datetime.now().isoformat(),
             'type': search_type,
-            'criteria': criteria,
-            'results': results
+            'criteria': criteria
         }
+        self._result_cache.pop(name, None)
         self.save_searches()
         return True
         
@@ -106,10 +259,23 @@ class SearchManager:
         """저장된 검색을 삭제합니다."""
         if name in self.saved_searches:
             del self.saved_searches[name]
+            self._result_cache.pop(name, None)
             self.save_searches()
             return True
         return False
         
     def get_all_saved_searches(self):
         """모든 저장된 검색을 반환합니다."""
-        return self.saved_searches 
\ No newline at end of file
+        return self.saved_searches
+
+    def cached_results(self, name, index_version):
+        """저장된 검색의 캐시된 결과. 없거나 그 뒤로 색인이 바뀌었으면 None."""
+        cached = self._result_cache.get(name)
+        if cached is None or cached[0] != index_version:
+            return None
+        return cached[1]
+
+    def cache_results(self, name, index_version, results):
+        """저장된 검색을 실행한 결과를 색인 버전과 함께 캐시 (메모리에만 보관)"""
+        if name in self.saved_searches:
+            self._result_cache[name] = (index_version, results)
@@ -3,12 +3,12 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
 from PySide6.QtCore import Qt
 
 class SearchSaveDialog(QDialog):
-    def __init__(self, search_manager, search_type, criteria, results, parent=None):
+    def __init__(self, search_manager, search_type=None, criteria=None, parent=None):
         super().__init__(parent)
         self.search_manager = search_manager
         self.search_type = search_type
         self.criteria = criteria
-        self.results = results
+        self.loaded_name = None  # 불러오기로 닫은 경우 선택한 검색 이름
         self.setWindowTitle("검색 저장")
         self.setMinimumWidth(500)
         self.setup_ui()
@@ -43,6 +43,10 @@ class SearchSaveDialog(QDialog):
         self.cancel_button = QPushButton("취소")
         self.cancel_button.clicked.connect(self.reject)
         
+        # 현재 검색이 없으면 저장할 것이 없음 (불러오기/삭제만 가능)
+        self.save_button.setEnabled(self.search_type is not None)
+        self.name_input.setEnabled(self.search_type is not None)
+
         button_layout.addWidget(self.save_button)
         button_layout.addWidget(self.load_button)
         button_layout.addWidget(self.delete_button)
@@ -63,7 +67,7 @@ class SearchSaveDialog(QDialog):
             QMessageBox.warning(self, "오류", "검색 이름을 입력해주세요.")
             return
             
-        if self.search_manager.save_search(name, self.search_type, self.criteria, self.results):
+        if self.search_manager.save_search(name, self.search_type, self.criteria):
             self.update_saved_list()
             self.name_input.clear()
             
@@ -79,7 +83,7 @@ class SearchSaveDialog(QDialog):
         if saved_search:
             self.search_type = saved_search['type']
             self.criteria = saved_search['criteria']
-            self.results = saved_search['results']
+            self.loaded_name = name
             self.accept()
             
     def delete_search(self):
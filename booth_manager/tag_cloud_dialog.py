@@ -0,0 +1,111 @@
+import html
+import math
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+                             QLineEdit, QPushButton, QTextBrowser)
+
+# 태그 구름에 표시할 최대 태그 수 (많이 쓰인 순)
+CLOUD_TAG_LIMIT = 300
+# 태그 글자 크기 범위 (pt, 아이템 수의 로그에 비례)
+MIN_FONT_SIZE = 10
+MAX_FONT_SIZE = 28
+# 선택한 태그와 함께 쓰인 태그 표시 수
+RELATED_TAG_LIMIT = 15
+
+
+class TagCloudDialog(QDialog):
+    """
+    태그 구름: 많이 쓰인 태그일수록 크게 표시합니다 (TagStatistics, 파일 시스템 접근 없음).
+    태그를 누르면 아이템 수와 함께 쓰인 태그를 보여주고, 선택한 태그로 검색할 수 있습니다.
+    """
+    def __init__(self, tag_stats, parent=None):
+        super().__init__(parent)
+        self.tag_stats = tag_stats
+        self.selected_tag = None
+        self._cloud_tags = []    # 구름에 표시한 태그 (링크 번호 -> 태그)
+        self._related_tags = []  # 함께 쓰인 태그 (링크 번호 -> 태그)
+        self.setWindowTitle("태그 구름")
+        self.setMinimumSize(600, 450)
+        self.setup_ui()
+        self.update_cloud()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        # 태그 필터
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("태그 필터 (앞부분 입력)")
+        self.filter_input.textChanged.connect(self.update_cloud)
+        layout.addWidget(self.filter_input)
+
+        # 태그 구름
+        self.cloud_view = QTextBrowser()
+        self.cloud_view.setOpenLinks(False)
+        self.cloud_view.anchorClicked.connect(lambda url: self.select_link(url.toString()))
+        layout.addWidget(self.cloud_view)
+
+        # 선택한 태그 정보
+        self.info_label = QLabel("태그를 누르면 함께 쓰인 태그를 보여줍니다.")
+        self.info_label.setWordWrap(True)
+        self.info_label.linkActivated.connect(self.select_link)
+        layout.addWidget(self.info_label)
+
+        # 버튼
+        button_layout = QHBoxLayout()
+        self.search_button = QPushButton("이 태그로 검색")
+        self.search_button.setEnabled(False)
+        self.search_button.clicked.connect(self.accept)
+        self.close_button = QPushButton("닫기")
+        self.close_button.clicked.connect(self.reject)
+
+        button_layout.addWidget(self.search_button)
+        button_layout.addWidget(self.close_button)
+        layout.addLayout(button_layout)
+
+    def update_cloud(self):
+        """필터에 맞는 태그로 구름을 다시 그립니다."""
+        prefix = self.filter_input.text().strip()
+        if prefix:
+            tags = self.tag_stats.complete(prefix, limit=CLOUD_TAG_LIMIT)
+        else:
+            tags = self.tag_stats.top_tags(CLOUD_TAG_LIMIT)
+        if not tags:
+            self._cloud_tags = []
+            self.cloud_view.setHtml("<p>태그가 없습니다.</p>")
+            return
+
+        # 많이 쓰인 태그를 고른 뒤 이름순으로 배치
+        tags.sort()
+        self._cloud_tags = [tag for tag, _ in tags]
+        low = math.log(min(count for _, count in tags))
+        high = math.log(max(count for _, count in tags))
+        links = []
+        for index, (tag, count) in enumerate(tags):
+            ratio = (math.log(count) - low) / (high - low) if high > low else 0.5
+            size = round(MIN_FONT_SIZE + ratio * (MAX_FONT_SIZE - MIN_FONT_SIZE))
+            links.append(f'<a href="cloud:{index}" title="{count}개" '
+                         f'style="font-size:{size}pt; text-decoration:none">{html.escape(tag)}</a>')
+        self.cloud_view.setHtml(f"<p style='line-height:150%'>{' &nbsp; '.join(links)}</p>")
+
+    def select_link(self, link):
+        """구름/함께 쓰인 태그의 링크를 눌렀을 때 그 태그를 선택"""
+        kind, _, index = link.partition(":")
+        tags = self._cloud_tags if kind == "cloud" else self._related_tags
+        try:
+            tag = tags[int(index)]
+        except (ValueError, IndexError):
+            return
+        self.select_tag(tag)
+
+    def select_tag(self, tag):
+        """선택한 태그의 아이템 수와 함께 쓰인 태그 표시"""
+        self.selected_tag = tag
+        self.search_button.setEnabled(True)
+        count = self.tag_stats.count(tag)
+        related = self.tag_stats.related(tag, limit=RELATED_TAG_LIMIT)
+        self._related_tags = [other for other, _ in related]
+        text = f"<b>{html.escape(tag)}</b>: 아이템 {count}개"
+        if related:
+            links = ", ".join(f'<a href="related:{index}">{html.escape(other)}</a> ({shared})'
+                              for index, (other, shared) in enumerate(related))
+            text += f"<br>함께 쓰인 태그: {links}"
+        self.info_label.setText(text)
@@ -0,0 +1,104 @@
+import re
+from PySide6.QtCore import Qt, QModelIndex, Signal
+from PySide6.QtGui import QStandardItem, QStandardItemModel
+from PySide6.QtWidgets import QCompleter
+
+from tag_query import quote_tag
+
+# 입력 중인 마지막 태그 (태그 목록: 쉼표로만 구분, 태그 안의 공백 허용)
+TAG_LIST_TERM = re.compile(r'[^,]*$')
+# 입력 중인 마지막 조건 (태그 질의: 공백/쉼표/괄호로 구분)
+QUERY_TERM = re.compile(r'[^\s,()"]*$')
+
+# 후보 항목에 저장하는 완성 후 입력창 전체 문자열
+COMPLETION_TEXT_ROLE = Qt.UserRole + 1
+# 최근 검색어 후보 여부
+HISTORY_ROLE = Qt.UserRole + 2
+# 검색어 기록 후보 최대 수
+HISTORY_LIMIT = 5
+
+
+class TagCompleter(QCompleter):
+    """
+    입력창의 마지막 태그를 태그 이름으로 완성하는 자동 완성.
+    입력할 때마다 TagStatistics.complete()로 접두어 후보를 찾아 많이 쓰인 순으로 보여주고,
+    선택하면 입력 중인 태그만 바꿉니다 (앞에 입력한 태그/조건은 유지).
+
+    query_mode면 태그 질의(공백/괄호/-/tag: 구분)로 보고, history가 주어지면
+    입력한 내용이 들어간 최근 검색어도 후보로 보여줍니다 (선택하면 입력창 전체를 바꾸고 query_selected 발생).
+    """
+    query_selected = Signal(str)  # 최근 검색어 후보를 선택함
+
+    def __init__(self, tag_stats, line_edit, query_mode=False, history=None):
+        super().__init__(line_edit)
+        self.tag_stats = tag_stats
+        self.line_edit = line_edit
+        self.query_mode = query_mode
+        self.history = history  # 최근 검색어 리스트를 반환하는 함수
+
+        self._model = QStandardItemModel(self)
+        self.setModel(self._model)
+        # 후보는 직접 고르므로 QCompleter의 필터링은 쓰지 않음
+        self.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.setWidget(line_edit)
+        line_edit.textEdited.connect(self.update_completions)
+        self.activated[QModelIndex].connect(self._insert_completion)
+
+    def update_completions(self, text):
+        """입력이 바뀔 때 후보를 다시 찾아 팝업 표시"""
+        cursor = self.line_edit.cursorPosition()
+        head, tail = text[:cursor], text[cursor:]
+        self._model.clear()
+
+        if self.history and text.strip():
+            needle = text.strip().lower()
+            candidates = [query for query in self.history() if needle in query.lower() and query != text]
+            for query in candidates[:HISTORY_LIMIT]:
+                self._add_row(f"{query}  (최근 검색)", query, is_history=True)
+
+        term = (QUERY_TERM if self.query_mode else TAG_LIST_TERM).search(head).group()
+        start = len(head) - len(term)
+        prefix = term.lstrip()
+        start += len(term) - len(prefix)
+        if self.query_mode:
+            while prefix.startswith("-"):
+                prefix, start = prefix[1:], start + 1
+            if prefix.lower().startswith("tag:"):
+                prefix, start = prefix[4:], start + 4
+            if ":" in prefix or prefix in ("AND", "OR", "NOT"):
+                prefix = ""  # 다른 필드 조건이나 연산자는 완성하지 않음
+        if prefix:
+            exclude = self._entered_tags(head[:start] + tail)
+            for tag, count in self.tag_stats.complete(prefix, exclude=exclude):
+                self._add_row(f"{tag}  ({count})", head[:start] + self._format_tag(tag) + tail.lstrip())
+
+        if self._model.rowCount():
+            self.complete()
+        else:
+            self.popup().hide()
+
+    def _add_row(self, label, completion_text, is_history=False):
+        item = QStandardItem(label)
+        item.setData(completion_text, COMPLETION_TEXT_ROLE)
+        item.setData(is_history, HISTORY_ROLE)
+        self._model.appendRow(item)
+
+    def _entered_tags(self, text):
+        """이미 입력한 태그 (태그 목록에서만, 후보에서 제외)"""
+        if self.query_mode:
+            return set()
+        return {tag.strip().lower() for tag in text.split(',') if tag.strip()}
+
+    def _format_tag(self, tag):
+        """선택한 태그 뒤에 다음 태그를 바로 입력할 수 있도록 구분자를 붙임"""
+        if not self.query_mode:
+            return tag + ", "
+        return quote_tag(tag) + " "  # 공백이 있는 태그는 따옴표로 감쌈 (질의 안에서 공백은 AND)
+
+    def _insert_completion(self, index):
+        text = index.data(COMPLETION_TEXT_ROLE)
+        if text is None:
+            return
+        self.line_edit.setText(text)
+        if index.data(HISTORY_ROLE):
+            self.query_selected.emit(text)
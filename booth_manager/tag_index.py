@@ -0,0 +1,361 @@
+import os
+import bisect
+import threading
+
+
+def normalize_tags(raw_tags):
+    """태그 값을 검색용 소문자 태그 집합으로 변환 (리스트가 아니면 빈 집합)"""
+    if not isinstance(raw_tags, (list, tuple, set, frozenset)):
+        return frozenset()
+    return frozenset(str(tag).strip().lower() for tag in raw_tags if str(tag).strip())
+
+
+def tag_display_forms(raw_tags):
+    """검색용 태그 -> 입력한 그대로의 태그 (자동 완성/태그 구름에 표시할 대소문자)"""
+    if not isinstance(raw_tags, (list, tuple, set, frozenset)):
+        return {}
+    return {str(tag).strip().lower(): str(tag).strip() for tag in raw_tags if str(tag).strip()}
+
+
+def bit_count(bitmap):
+    """비트맵(int)에서 켜진 비트 수 (int.bit_count()는 Python 3.10부터라 쓰지 않음)"""
+    return bin(bitmap).count('1')
+
+
+def bitmap_ids(bitmap):
+    """비트맵(int)에서 켜진 비트 번호들 (오름차순)"""
+    bits = bin(bitmap)[:1:-1]  # 최하위 비트부터
+    ids = []
+    index = bits.find('1')
+    while index >= 0:
+        ids.append(index)
+        index = bits.find('1', index + 1)
+    return ids
+
+
+def bitmap_from_ids(ids):
+    """비트 번호들로 비트맵(int) 만들기 (큰 포스팅도 한 번에 만듦)"""
+    ids = list(ids)
+    if not ids:
+        return 0
+    buffer = bytearray(max(ids) // 8 + 1)
+    for doc_id in ids:
+        buffer[doc_id >> 3] |= 1 << (doc_id & 7)
+    return int.from_bytes(buffer, 'little')
+
+
+class TagSnapshot:
+    """
+    태그 통계용 색인 스냅샷 (TagIndex.snapshot).
+    색인이 바뀌면 새 스냅샷으로 교체될 뿐 내용은 바뀌지 않으므로 잠금 없이 읽을 수 있습니다.
+    """
+    __slots__ = ("version", "counts", "display", "postings")
+
+    def __init__(self, version=0, counts=None, display=None, postings=None):
+        self.version = version
+        self.counts = counts or {}      # 검색용 태그 -> 아이템 폴더 수
+        self.display = display or {}    # 검색용 태그 -> 표시용 태그 (원래 대소문자)
+        self.postings = postings or {}  # 검색용 태그 -> 폴더 번호 비트맵
+
+
+class TagIndex:
+    """
+    태그 -> 아이템 폴더 비트맵 역색인 (메모리).
+    메타데이터 저장소(MetadataStore)의 태그 테이블에서 한 번 만들어 두고,
+    아이템 폴더마다 번호를 붙여 태그별 포스팅을 비트맵(int)으로 저장합니다.
+    검색은 비트 AND/OR/NOT으로 처리하며 (작은 포스팅부터 교집합), 태그 질의(tag_query)도 이 비트맵을 씁니다.
+    앱에서 태그를 저장할 때는 update()로 해당 폴더만 갱신하고,
+    refresh()는 .meta.json 사이드카를 저장소와 맞춘 뒤 바뀐 것이 있을 때만 다시 만듭니다.
+    파일 카탈로그(FileCatalog)가 있으면 사이드카 위치는 트리를 훑지 않고 카탈로그에서 얻습니다.
+
+    검색과 백그라운드 갱신이 동시에 일어날 수 있으므로 잠금으로 보호하되, 잠금은 짧게만 잡습니다.
+    사이드카 동기화와 색인 생성은 잠금 밖에서 하고, 새 색인을 다 만든 뒤 잠금을 잡고 한 번에 교체합니다.
+    생성 도중 update()로 바뀐 폴더는 교체할 때 다시 반영합니다.
+
+    태그 수와 표시용 태그(원래 대소문자)는 바뀔 때마다 새 스냅샷(snapshot)으로 내보내,
+    자동 완성처럼 GUI 스레드에서 자주 읽는 쪽은 색인 잠금을 잡지 않습니다.
+    포스팅/태그 수 딕셔너리는 제자리에서 고치지 않고 새로 만들어 교체합니다.
+    """
+    def __init__(self, store, catalog=None):
+        self.store = store
+        self.catalog = catalog
+        self._ids = {}        # 폴더 경로 -> 번호
+        self._paths = []      # 번호 -> 폴더 경로
+        self._entries = {}    # 폴더 경로 -> 태그 frozenset
+        self._postings = {}   # 태그 -> 폴더 번호 비트맵
+        self._counts = {}     # 태그 -> 폴더 수
+        self._display = {}    # 태그 -> 표시용 태그 (원래 대소문자)
+        self.snapshot = TagSnapshot()
+        self._sorted_tags = None  # 접두어 검색용 정렬된 태그 목록 (태그 목록이 바뀌면 다시 만듦)
+        self._loaded = False
+        self._lock = threading.RLock()            # 색인 읽기/교체 (짧게만 잡음)
+        self._refresh_lock = threading.Lock()     # 백그라운드 갱신끼리 순서 보장 (검색은 기다리지 않음)
+        self._reload_count = 0                    # 시작한 reload 수 (늦게 끝난 오래된 결과는 버림)
+        self._applied_reload = 0                  # 마지막으로 교체한 reload 번호
+        self._reloads_running = 0
+        self._pending_updates = {}                # reload 도중 update()로 바뀐 폴더 -> 태그
+        self.version = 0  # 색인이 바뀔 때마다 증가 (저장된 검색 결과 캐시 검증용)
+
+    # --- 검색 ---
+    def search(self, search_tags):
+        """
+        모든 태그를 가진 아이템 폴더의 경로 리스트 (이름순).
+        일치한 폴더 안의 하위 폴더는 제외합니다 (아이템 폴더 안쪽은 탐색하지 않던 기존 동작과 동일).
+
+        Args:
+            search_tags (set): 검색할 태그 문자열 집합 (소문자).
+        """
+        if not search_tags:
+            return []
+        self.ensure_loaded()
+        with self._lock:
+            postings = [self._postings.get(tag, 0) for tag in search_tags]
+            if not all(postings):
+                return []
+            # 작은 비트맵부터 교집합 (결과가 빨리 줄어듦)
+            postings.sort(key=bit_count)
+            result = postings[0]
+            for posting in postings[1:]:
+                result &= posting
+                if not result:
+                    return []
+            return self.paths_of(result)
+
+    def paths_of(self, bitmap):
+        """
+        비트맵의 아이템 폴더 경로 리스트 (이름순).
+        일치한 폴더 안의 하위 폴더는 제외합니다.
+        """
+        with self._lock:
+            matches = {self._paths[doc_id] for doc_id in bitmap_ids(bitmap)}
+        return [path for path in sorted(matches) if not self._has_matching_ancestor(path, matches)]
+
+    def _has_matching_ancestor(self, path, matches):
+        parent = os.path.dirname(path)
+        while parent and parent != path:
+            if parent in matches:
+                return True
+            path, parent = parent, os.path.dirname(parent)
+        return False
+
+    def tags_of(self, item_path):
+        """색인된 폴더의 태그 집합 (색인에 없으면 빈 집합)"""
+        self.ensure_loaded()
+        with self._lock:
+            return self._entries.get(os.path.normpath(item_path), frozenset())
+
+    def tag_counts(self):
+        """태그별 아이템 폴더 수 (스냅샷에서 읽음, 잠금 없음)"""
+        return dict(self.snapshot.counts)
+
+    # --- 비트맵 (태그 질의용) ---
+    def bitmap(self, tag):
+        """태그를 가진 폴더 비트맵"""
+        self.ensure_loaded()
+        with self._lock:
+            return self._postings.get(tag, 0)
+
+    def prefix_bitmap(self, prefix):
+        """prefix로 시작하는 태그 중 하나라도 가진 폴더 비트맵"""
+        self.ensure_loaded()
+        with self._lock:
+            if self._sorted_tags is None:
+                self._sorted_tags = sorted(self._postings)
+            tags = self._sorted_tags
+            result = 0
+            for i in range(bisect.bisect_left(tags, prefix), len(tags)):
+                if not tags[i].startswith(prefix):
+                    break
+                result |= self._postings[tags[i]]
+            return result
+
+    def universe(self):
+        """알려진 모든 아이템 폴더 비트맵 (NOT 계산용)"""
+        self.ensure_loaded()
+        with self._lock:
+            return (1 << len(self._paths)) - 1
+
+    def bitmap_of_paths(self, paths):
+        """폴더 경로들의 비트맵 (처음 보는 폴더는 번호를 새로 붙임)"""
+        self.ensure_loaded()
+        with self._lock:
+            return bitmap_from_ids(self._id_for(os.path.normpath(path)) for path in paths)
+
+    # --- 갱신 ---
+    def ensure_loaded(self):
+        """
+        처음 사용할 때 저장소에 있는 태그로 색인을 만듭니다.
+        사이드카 동기화는 백그라운드 refresh()가 맡으므로 첫 검색이 그것을 기다리지 않습니다.
+        """
+        if not self._loaded:
+            self.reload()
+
+    def reload(self):
+        """저장소의 아이템/태그 테이블 전체로 색인을 다시 만들어 교체합니다 (잠금 밖에서 생성)."""
+        with self._lock:
+            self._reload_count += 1
+            reload_number = self._reload_count
+            self._reloads_running += 1
+        try:
+            tags_by_path = {path: set() for path, _, _ in self.store.all_items()}
+            display_forms = {}  # 태그 -> {표시용 태그: 쓰인 수}
+            for path, tag in self.store.all_tags():
+                tags_by_path.setdefault(path, set()).add(tag)
+                for key, form in tag_display_forms([tag]).items():
+                    forms = display_forms.setdefault(key, {})
+                    forms[form] = forms.get(form, 0) + 1
+            ids = {}
+            paths = []
+            entries = {}
+            ids_by_tag = {}
+            for path, tags in tags_by_path.items():
+                doc_id = ids[path] = len(paths)
+                paths.append(path)
+                tags = normalize_tags(tags)
+                if not tags:
+                    continue
+                entries[path] = tags
+                for tag in tags:
+                    ids_by_tag.setdefault(tag, []).append(doc_id)
+            postings = {tag: bitmap_from_ids(tag_ids) for tag, tag_ids in ids_by_tag.items()}
+            counts = {tag: len(tag_ids) for tag, tag_ids in ids_by_tag.items()}
+            # 같은 태그를 여러 대소문자로 썼으면 가장 많이 쓴 형태로 표시
+            display = {tag: max(display_forms.get(tag, {tag: 1}).items(), key=lambda entry: (entry[1], entry[0]))[0]
+                       for tag in postings}
+        except BaseException:
+            with self._lock:
+                self._finish_reload()
+            raise
+
+        with self._lock:
+            pending = self._finish_reload()
+            if reload_number < self._applied_reload:
+                return  # 더 나중에 시작한 reload가 이미 교체함
+            self._applied_reload = reload_number
+            self._ids = ids
+            self._paths = paths
+            self._entries = entries
+            self._postings = postings
+            self._counts = counts
+            self._display = display
+            self._sorted_tags = None
+            # 생성 도중 저장된 태그는 새 색인에 다시 반영
+            self._set_entries((path, tags, forms) for path, (tags, forms) in pending.items())
+            self._loaded = True
+            self.version += 1
+            self._publish()
+
+    def update(self, item_path, tags):
+        """한 아이템 폴더의 태그 변경 반영 (태그 저장 직후 호출)"""
+        self.update_many({item_path: tags})
+
+    def update_many(self, tags_by_path):
+        """
+        여러 아이템 폴더의 태그 변경을 한 번에 반영 (사이드카를 묶어서 가져온 뒤 호출).
+        포스팅/태그 수는 한 번만 복사하고 스냅샷도 한 번만 내보냅니다.
+
+        Args:
+            tags_by_path (dict): {item_path: 태그 리스트}.
+        """
+        if not self._loaded or not tags_by_path:
+            return  # 처음 사용할 때 저장소에서 만들어짐
+        changes = [(os.path.normpath(item_path), normalize_tags(tags), tag_display_forms(tags))
+                   for item_path, tags in tags_by_path.items()]
+        with self._lock:
+            if self._reloads_running:
+                for path, tags, forms in changes:
+                    self._pending_updates[path] = (tags, forms)
+            if self._set_entries(changes):
+                self._publish()
+
+    def refresh(self):
+        """
+        .meta.json 사이드카를 저장소와 맞추고 (바뀐 파일만 읽음), 바뀌었으면 색인을 다시 만듭니다.
+        모두 색인 잠금 밖에서 하므로 그동안에도 검색은 이전 색인으로 바로 처리됩니다.
+
+        Returns:
+            bool: 색인이 바뀌었는지 여부.
+        """
+        with self._refresh_lock:
+            # 카탈로그 갱신(라이브러리 전체 확인)은 검색이 기다리지 않도록 색인 잠금 밖에서
+            sidecars = None
+            if self.catalog is not None and self.catalog.update() >= 0:
+                sidecars = self.catalog.item_sidecars()
+            changed = self.store.sync_sidecars(sidecars)
+            if changed or not self._loaded:
+                self.reload()
+            return changed
+
+    @property
+    def lock(self):
+        """질의 하나를 계산하는 동안 잡아 두면 도중에 색인이 교체되지 않음 (짧게만 잡을 것)"""
+        return self._lock
+
+    # --- 내부 ---
+    def _finish_reload(self):
+        """reload 하나가 끝남. 생성 도중 바뀐 폴더를 반환 (잠금을 잡은 상태에서 호출)."""
+        self._reloads_running -= 1
+        pending = self._pending_updates
+        if not self._reloads_running:
+            self._pending_updates = {}
+        return pending
+
+    def _id_for(self, path):
+        """폴더 번호 (없으면 새로 붙임). 잠금을 잡은 상태에서 호출."""
+        doc_id = self._ids.get(path)
+        if doc_id is None:
+            doc_id = self._ids[path] = len(self._paths)
+            self._paths.append(path)
+        return doc_id
+
+    def _set_entries(self, changes):
+        """
+        색인 항목 교체 (tags가 비어 있으면 태그만 삭제). 잠금을 잡은 상태에서 호출.
+        포스팅/태그 수는 스냅샷이 가리키는 딕셔너리를 고치지 않도록,
+        처음 바뀌는 항목에서 한 번만 복사한 뒤 나머지 항목도 그 복사본에 반영합니다.
+
+        Args:
+            changes (iterable): (경로, 검색용 태그 frozenset, {검색용 태그: 표시용 태그}) 튜플들.
+
+        Returns:
+            bool: 바뀌었는지 여부.
+        """
+        postings = counts = display = None
+        for path, tags, forms in changes:
+            bit = 1 << self._id_for(path)
+            old = self._entries.pop(path, frozenset())
+            if tags:
+                self._entries[path] = tags
+            if old == tags:
+                continue
+            if postings is None:
+                postings = dict(self._postings)
+                counts = dict(self._counts)
+                display = dict(self._display)
+            for tag in old - tags:
+                posting = postings.get(tag, 0) & ~bit
+                if posting:
+                    postings[tag] = posting
+                    counts[tag] -= 1
+                else:
+                    postings.pop(tag, None)
+                    counts.pop(tag, None)
+                    display.pop(tag, None)
+                    self._sorted_tags = None
+            for tag in tags - old:
+                if tag not in postings:
+                    self._sorted_tags = None
+                    display[tag] = (forms or {}).get(tag, tag)
+                postings[tag] = postings.get(tag, 0) | bit
+                counts[tag] = counts.get(tag, 0) + 1
+        if postings is None:
+            return False
+        self.version += 1
+        self._postings = postings
+        self._counts = counts
+        self._display = display
+        return True
+
+    def _publish(self):
+        """현재 태그 수/표시용 태그를 새 스냅샷으로 내보냄 (잠금을 잡은 상태에서 호출)"""
+        self.snapshot = TagSnapshot(self.version, self._counts, self._display, self._postings)
@@ -0,0 +1,407 @@
+"""
+태그 검색 질의 언어.
+
+    헤어 리본              두 태그를 모두 가진 아이템 (공백/쉼표/AND는 모두 AND)
+    헤어 OR 리본           둘 중 하나
+    NOT 유료, -유료        유료 태그가 없는 아이템
+    (헤어 OR 리본) -유료   괄호로 묶기 (-(헤어 OR 리본)은 괄호 전체의 NOT)
+    헤어*                  '헤어'로 시작하는 태그
+    "hair pin"             공백이 들어간 태그 (따옴표 안의 "는 \\", \\는 \\\\로 씀)
+    ext:unitypackage       .unitypackage 파일이 있는 아이템 (ext:png* 처럼 접두어도 가능)
+    size:>100MB            100MB보다 큰 파일이 있는 아이템 (>, >=, <, <=, =, 10MB..1GB)
+    shop:xyz               상점(Booth 서브도메인)이 xyz인 아이템 (shop:xy* 접두어 가능)
+    title:드레스           상품 제목에 '드레스'가 들어간 아이템
+
+질의 문법이 하나도 없는 입력("헤어핀, 무료 아이템")은 예전처럼 쉼표로만 나눈 태그 목록으로 보고,
+공백이 들어간 태그가 실제로 없으면 공백으로 나눈 단어들의 AND로 찾습니다.
+질의는 태그 비트맵(TagIndex)과 파일 카탈로그/메타데이터 저장소 색인을 쓰는 계획으로 바뀌며,
+AND는 결과가 작은 것(선택도가 높은 것)부터 계산하고 결과가 비면 나머지는 계산하지 않습니다.
+"""
+import re
+
+from file_catalog import SIZE_UNITS
+from tag_index import bit_count
+
+# 필드 조건 (태그 외)
+FIELDS = ("tag", "ext", "size", "shop", "title")
+# 연산자는 대문자만 (소문자 'or', 'not'은 태그로 취급)
+_KEYWORDS = {"AND", "OR", "NOT"}
+# 이 중 하나라도 있으면 질의 문법으로 해석 (없으면 예전 쉼표 목록)
+_SYNTAX = re.compile(r'[()"*]|(^|[\s,])-\S|\b(AND|OR|NOT)\b|\b(?i:' + "|".join(FIELDS) + r'):')
+_TOKEN = re.compile(r'\s*(?:(\()|(\))|(,)|((?:[^\s(),"]*"(?:[^"\\]|\\.)*"\*?)|[^\s(),"]+))')
+# 따옴표 안의 이스케이프 (\" -> ", \\ -> \)
+_ESCAPE = re.compile(r'\\(.)', re.DOTALL)
+_FIELD = re.compile(r'([A-Za-z]+):(.*)', re.DOTALL)
+_SIZE = re.compile(r'(>=|<=|>|<|=)?\s*([\d.]+)\s*([KMG]?B)?$', re.IGNORECASE)
+_SIZE_UNITS = dict(SIZE_UNITS, B=1)
+
+# 필드 조건은 SQL 조회가 필요하므로 태그 조건을 모두 계산한 뒤에 계산
+COST_BITMAP = 0
+COST_FIELD = 1
+
+
+class QueryError(ValueError):
+    """해석할 수 없는 검색어"""
+
+
+class QueryContext:
+    """질의 계산에 쓰는 색인들과 한 번의 계산 안에서 재사용할 결과"""
+    def __init__(self, tag_index, catalog, store):
+        self.tag_index = tag_index
+        self.catalog = catalog
+        self.store = store
+        self.cache = {}  # 노드 -> 비트맵
+
+    def universe(self):
+        if "universe" not in self.cache:
+            self.cache["universe"] = self.tag_index.universe()
+        return self.cache["universe"]
+
+
+class Node:
+    cost = COST_BITMAP
+
+    def estimate(self, context):
+        """결과 크기 추정 (AND 계산 순서 결정용)"""
+        return bit_count(self.evaluate(context))
+
+    def evaluate(self, context):
+        bitmap = context.cache.get(self)
+        if bitmap is None:
+            bitmap = context.cache[self] = self._evaluate(context)
+        return bitmap
+
+    def _evaluate(self, context):
+        raise NotImplementedError
+
+
+class TagTerm(Node):
+    def __init__(self, tag, prefix=False):
+        self.tag = tag
+        self.prefix = prefix
+        self.split_words = not prefix and len(tag.split()) > 1
+
+    def _evaluate(self, context):
+        if self.prefix:
+            return context.tag_index.prefix_bitmap(self.tag)
+        bitmap = context.tag_index.bitmap(self.tag)
+        if not bitmap and self.split_words:
+            # 그런 태그가 없으면 공백으로 나눈 단어를 모두 가진 아이템 ("헤어 리본" -> 헤어 AND 리본)
+            bitmap = And([TagTerm(word) for word in self.tag.split()]).evaluate(context)
+        return bitmap
+
+    def __repr__(self):
+        return f"TagTerm({self.tag!r}{', prefix' if self.prefix else ''})"
+
+
+class FieldTerm(Node):
+    cost = COST_FIELD
+
+    def __init__(self, field, value, prefix=False):
+        self.field = field
+        self.value = value
+        self.prefix = prefix
+        if field == "size":
+            self.low, self.high = parse_size(value)
+
+    def estimate(self, context):
+        # 계산해 보기 전에는 크기를 알 수 없으므로 태그 조건 뒤에 둠 (비용 순서로 정렬됨)
+        return bit_count(context.universe())
+
+    def _evaluate(self, context):
+        if self.field == "ext":
+            paths = context.catalog.items_with_extension(self.value, self.prefix)
+        elif self.field == "size":
+            paths = context.catalog.items_with_size(self.low, self.high)
+        elif self.field == "shop":
+            paths = context.store.items_by_shop(self.value, self.prefix)
+        else:
+            paths = context.store.items_by_title(self.value)
+        return context.tag_index.bitmap_of_paths(paths)
+
+    def __repr__(self):
+        return f"FieldTerm({self.field!r}, {self.value!r}{', prefix' if self.prefix else ''})"
+
+
+class Not(Node):
+    def __init__(self, child):
+        self.child = child
+        self.cost = child.cost
+
+    def estimate(self, context):
+        return bit_count(context.universe()) - self.child.estimate(context)
+
+    def _evaluate(self, context):
+        return context.universe() & ~self.child.evaluate(context)
+
+    def __repr__(self):
+        return f"Not({self.child!r})"
+
+
+class And(Node):
+    def __init__(self, children):
+        self.children = children
+        self.cost = max(child.cost for child in children)
+
+    def estimate(self, context):
+        return min(child.estimate(context) for child in self.children)
+
+    def _evaluate(self, context):
+        # 제외 조건은 마지막에 빼고 (전체 집합의 여집합을 만들지 않음),
+        # 나머지는 비용이 낮고 결과가 작은 것부터 교집합
+        positives = [child for child in self.children if not isinstance(child, Not)]
+        negatives = [child.child for child in self.children if isinstance(child, Not)]
+        if not positives:
+            result = context.universe()
+        else:
+            positives.sort(key=lambda child: (child.cost, child.estimate(context)))
+            result = positives[0].evaluate(context)
+            for child in positives[1:]:
+                if not result:
+                    return 0
+                result &= child.evaluate(context)
+        negatives.sort(key=lambda child: child.cost)
+        for child in negatives:
+            if not result:
+                return 0
+            result &= ~child.evaluate(context)
+        return result
+
+    def __repr__(self):
+        return f"And({self.children!r})"
+
+
+class Or(Node):
+    def __init__(self, children):
+        self.children = children
+        self.cost = max(child.cost for child in children)
+
+    def estimate(self, context):
+        return min(bit_count(context.universe()), sum(child.estimate(context) for child in self.children))
+
+    def _evaluate(self, context):
+        result = 0
+        for child in self.children:
+            result |= child.evaluate(context)
+        return result
+
+    def __repr__(self):
+        return f"Or({self.children!r})"
+
+
+def parse_size(text):
+    """
+    크기 조건을 (최소, 최대) 바이트로 변환 ('>100MB', '<=1GB', '10MB..1GB', '500KB'는 500KB 이상).
+    """
+    if ".." in text:
+        low_text, high_text = text.split("..", 1)
+        low = _size_bytes(low_text, text) if low_text else None
+        high = _size_bytes(high_text, text) if high_text else None
+        return low, high
+    match = _SIZE.match(text.strip())
+    if not match:
+        raise QueryError(f"크기 조건을 해석할 수 없습니다: size:{text}")
+    operator = match.group(1) or ">="
+    size = _size_bytes(match.group(2) + (match.group(3) or ""), text)
+    if operator == ">":
+        return size + 1, None
+    if operator == ">=":
+        return size, None
+    if operator == "<":
+        return None, size - 1
+    if operator == "<=":
+        return None, size
+    return size, size
+
+
+def _size_bytes(text, original):
+    match = _SIZE.match(text.strip())
+    if not match or match.group(1):
+        raise QueryError(f"크기 조건을 해석할 수 없습니다: size:{original}")
+    try:
+        value = float(match.group(2))
+    except ValueError:
+        raise QueryError(f"크기 조건을 해석할 수 없습니다: size:{original}")
+    return int(value * _SIZE_UNITS[(match.group(3) or "B").upper()])
+
+
+def parse_query(text):
+    """
+    검색어를 질의 트리로 변환합니다.
+
+    Raises:
+        QueryError: 괄호가 맞지 않거나 조건을 해석할 수 없는 경우.
+
+    Returns:
+        Node: 질의 트리 (검색어가 비어 있으면 None).
+    """
+    text = text.strip()
+    if not text:
+        return None
+    if not _SYNTAX.search(text):
+        # 예전 형식: 쉼표로 나눈 태그 목록 (태그 안의 공백 유지)
+        tags = sorted({tag.strip().lower() for tag in text.split(',') if tag.strip()})
+        return _combine(And, [TagTerm(tag) for tag in tags]) if tags else None
+    return _Parser(_tokenize(text)).parse()
+
+
+def _tokenize(text):
+    tokens = []
+    position = 0
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if not match or match.end() == position:
+            if text[position:].strip():
+                raise QueryError(f"검색어를 해석할 수 없습니다: {text[position:]}")
+            break
+        position = match.end()
+        lparen, rparen, comma, term = match.groups()
+        if lparen:
+            tokens.append("(")
+        elif rparen:
+            tokens.append(")")
+        elif comma:
+            tokens.append(",")
+        elif term:
+            tokens.append(term)
+    return tokens
+
+
+def _combine(node_type, children):
+    return children[0] if len(children) == 1 else node_type(children)
+
+
+class _Parser:
+    """
+    재귀 하강 파서.
+        or_expr  := and_expr (OR and_expr)*
+        and_expr := not_expr ([AND | ,] not_expr)*
+        not_expr := (NOT | -) not_expr | atom
+        atom     := ( or_expr ) | 조건
+    """
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.position = 0
+
+    def parse(self):
+        node = self._or_expr()
+        if self.position < len(self.tokens):
+            raise QueryError(f"예상하지 못한 '{self.tokens[self.position]}'")
+        return node
+
+    def _peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _next(self):
+        token = self._peek()
+        self.position += 1
+        return token
+
+    def _is_keyword(self, token, keyword):
+        return token == keyword
+
+    def _or_expr(self):
+        children = [self._and_expr()]
+        while self._is_keyword(self._peek(), "OR"):
+            self._next()
+            children.append(self._and_expr())
+        return _combine(Or, children)
+
+    def _and_expr(self):
+        children = [self._not_expr()]
+        while True:
+            token = self._peek()
+            if token is None or token == ")" or self._is_keyword(token, "OR"):
+                break
+            if token == "," or self._is_keyword(token, "AND"):
+                self._next()
+            children.append(self._not_expr())
+        return _combine(And, children)
+
+    def _not_expr(self):
+        token = self._peek()
+        if self._is_keyword(token, "NOT"):
+            self._next()
+            return Not(self._not_expr())
+        if token == "-":
+            # 단독 '-'는 바로 뒤에 괄호가 올 때만 NOT ('-(헤어 OR 모자)')
+            self._next()
+            if self._peek() != "(":
+                raise QueryError("'-' 뒤에는 괄호가 와야 합니다 (태그는 -유료처럼 붙여 씁니다).")
+            return Not(self._atom())
+        if token and token.startswith("-"):
+            self.tokens[self.position] = token[1:]
+            return Not(self._not_expr())
+        return self._atom()
+
+    def _atom(self):
+        token = self._next()
+        if token is None:
+            raise QueryError("검색어가 끝나지 않았습니다.")
+        if token == "(":
+            node = self._or_expr()
+            if self._next() != ")":
+                raise QueryError("괄호가 닫히지 않았습니다.")
+            return node
+        if token in (")", ",") or token in _KEYWORDS:
+            raise QueryError(f"예상하지 못한 '{token}'")
+        return _term(token)
+
+
+def _term(token):
+    """조건 하나 (field:값, 따옴표, 끝의 *는 접두어)"""
+    field = "tag"
+    match = _FIELD.match(token)
+    if match and match.group(1).lower() in FIELDS:
+        field, token = match.group(1).lower(), match.group(2)
+    prefix = token.endswith("*")
+    if prefix:
+        token = token[:-1]
+    if len(token) >= 2 and token.startswith('"') and token.endswith('"'):
+        token = _ESCAPE.sub(r'\1', token[1:-1])
+    value = token.strip().lower()
+    if not value:
+        raise QueryError(f"{field} 조건의 값이 비어 있습니다.")
+    if field == "tag":
+        return TagTerm(value, prefix)
+    if field in ("size", "title") and prefix:
+        raise QueryError(f"{field} 조건에는 *를 쓸 수 없습니다.")
+    return FieldTerm(field, value, prefix)
+
+
+def quote_tag(tag):
+    """
+    태그 하나를 질의에 넣을 수 있는 형태로 (공백이나 질의 문법으로 해석될 글자가 있으면 따옴표로 감싸고
+    안의 "와 \\는 이스케이프).
+    """
+    if not re.search(r'\s', tag.strip()):
+        try:
+            node = parse_query(tag)
+        except QueryError:
+            node = None
+        if isinstance(node, TagTerm) and node.tag == tag.strip().lower() and not node.prefix:
+            return tag
+    escaped = tag.replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+class TagQuery:
+    """파싱한 질의 (같은 질의를 여러 번 계산할 수 있음)"""
+    def __init__(self, text):
+        self.text = text
+        self.root = parse_query(text)
+
+    def evaluate(self, tag_index, catalog, store):
+        """
+        질의에 맞는 아이템 폴더.
+
+        Returns:
+            list: 아이템 폴더 경로 리스트 (이름순, 일치한 폴더 안의 하위 폴더 제외).
+        """
+        if self.root is None:
+            return []
+        tag_index.ensure_loaded()
+        # 비트 번호가 같은 색인을 가리키도록 계산하는 동안 색인 교체를 막음
+        with tag_index.lock:
+            bitmap = self.root.evaluate(QueryContext(tag_index, catalog, store))
+            return tag_index.paths_of(bitmap) if bitmap else []
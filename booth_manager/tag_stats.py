@@ -0,0 +1,121 @@
+import bisect
+import threading
+
+from tag_index import bit_count
+
+# 자동 완성 후보 최대 수
+COMPLETION_LIMIT = 20
+# 함께 쓰인 태그 최대 수
+RELATED_LIMIT = 20
+
+
+class TagStatistics:
+    """
+    태그 통계: 태그별 아이템 수, 접두어 자동 완성, 함께 쓰인 태그(동시 출현 수).
+
+    태그 색인(TagIndex)이 바뀔 때마다 내보내는 스냅샷(TagIndex.snapshot)에서 계산합니다.
+    스냅샷은 교체만 되고 고쳐지지 않으므로 색인 잠금을 잡지 않으며 (입력할 때마다 불러도
+    백그라운드 갱신을 기다리지 않음), 파일 시스템을 훑거나 .meta.json을 읽지도 않습니다.
+    색인이 아직 만들어지지 않았으면 빈 결과를 돌려줍니다 (시작 시 백그라운드에서 만들어짐).
+
+    태그는 검색용(소문자)으로 비교하고, 결과는 원래 대소문자인 표시용 태그로 돌려줍니다.
+    동시 출현 수는 태그별로 처음 요청할 때 두 비트맵의 AND로 센 뒤 같은 스냅샷 동안 재사용합니다.
+    """
+    def __init__(self, tag_index):
+        self.tag_index = tag_index
+        self._lock = threading.Lock()  # 이 객체의 캐시용 (색인 잠금과 별개)
+        self._snapshot = None
+        self._sorted_tags = []   # 접두어 검색용 (검색용 태그)
+        self._related = {}       # 검색용 태그 -> [(표시용 태그, 수)] (요청한 태그만)
+
+    def _current(self):
+        """현재 스냅샷 (바뀌었으면 정렬된 태그 목록을 다시 만듦)"""
+        snapshot = self.tag_index.snapshot
+        with self._lock:
+            if snapshot is not self._snapshot:
+                self._sorted_tags = sorted(snapshot.counts)
+                self._related = {}
+                self._snapshot = snapshot
+            return snapshot, self._sorted_tags
+
+    def count(self, tag):
+        """태그를 가진 아이템 폴더 수 (대소문자 무시)"""
+        snapshot, _ = self._current()
+        return snapshot.counts.get(tag.strip().lower(), 0)
+
+    def counts(self):
+        """
+        태그별 아이템 폴더 수.
+
+        Returns:
+            dict: {표시용 태그: 수}.
+        """
+        snapshot, _ = self._current()
+        return {snapshot.display.get(tag, tag): count for tag, count in snapshot.counts.items()}
+
+    def top_tags(self, limit=None):
+        """
+        많이 쓰인 태그 (태그 구름용).
+
+        Returns:
+            list: (표시용 태그, 수) 튜플 리스트 (수가 많은 순, 같으면 이름순).
+        """
+        snapshot, _ = self._current()
+        tags = sorted(snapshot.counts.items(), key=lambda entry: (-entry[1], entry[0]))
+        if limit:
+            tags = tags[:limit]
+        return [(snapshot.display.get(tag, tag), count) for tag, count in tags]
+
+    def complete(self, prefix, limit=COMPLETION_LIMIT, exclude=()):
+        """
+        prefix로 시작하는 태그 (자동 완성용, 대소문자 무시).
+
+        Args:
+            prefix (str): 입력 중인 태그 앞부분.
+            limit (int): 최대 후보 수.
+            exclude (set): 이미 입력한 태그 (검색용 소문자, 후보에서 제외).
+
+        Returns:
+            list: (표시용 태그, 수) 튜플 리스트 (수가 많은 순).
+        """
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        snapshot, tags = self._current()
+        matches = []
+        for i in range(bisect.bisect_left(tags, prefix), len(tags)):
+            tag = tags[i]
+            if not tag.startswith(prefix):
+                break
+            if tag not in exclude:
+                matches.append((tag, snapshot.counts[tag]))
+        matches.sort(key=lambda entry: (-entry[1], entry[0]))
+        return [(snapshot.display.get(tag, tag), count) for tag, count in matches[:limit]]
+
+    def related(self, tag, limit=RELATED_LIMIT):
+        """
+        tag와 같은 아이템에 함께 쓰인 태그.
+
+        Returns:
+            list: (표시용 태그, 함께 쓰인 아이템 수) 튜플 리스트 (수가 많은 순).
+        """
+        tag = tag.strip().lower()
+        snapshot, tags = self._current()
+        with self._lock:
+            related = self._related.get(tag) if snapshot is self._snapshot else None
+        if related is None:
+            bitmap = snapshot.postings.get(tag, 0)
+            related = []
+            if bitmap:
+                for other in tags:
+                    if other == tag:
+                        continue
+                    count = bit_count(bitmap & snapshot.postings[other])
+                    if count:
+                        related.append((other, count))
+                related.sort(key=lambda entry: (-entry[1], entry[0]))
+                related = [(snapshot.display.get(other, other), count) for other, count in related]
+            with self._lock:
+                if snapshot is self._snapshot:
+                    self._related[tag] = related
+        return related[:limit]
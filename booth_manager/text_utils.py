@@ -0,0 +1,30 @@
+"""
+정렬/검색용 문자열 정규화 함수 모음.
+"""
+import re
+import unicodedata
+
+_DIGITS = re.compile(r'(\d+)')
+
+# 가타카나(ァ-ヶ)를 히라가나로 바꾸는 변환표 (같은 읽기는 같은 순서로 정렬)
+_KATAKANA_TO_HIRAGANA = {code: code - 0x60 for code in range(0x30A1, 0x30F7)}
+
+
+def fold_text(text):
+    """
+    비교용으로 문자열을 접습니다.
+    NFKC 정규화(전각 영숫자/반각 가타카나 통일) 후 대소문자를 무시하고 가타카나를 히라가나로 바꿉니다.
+    """
+    return unicodedata.normalize("NFKC", text).casefold().translate(_KATAKANA_TO_HIRAGANA)
+
+
+def natural_sort_key(name):
+    """
+    자연 정렬 키: 숫자 부분은 수의 크기로 비교합니다 ("item2" < "item10").
+    한글은 음절 코드 순서(가나다순), 일본어는 히라가나/가타카나 구분 없이 오십음순으로 정렬됩니다.
+
+    Returns:
+        tuple: 문자열과 정수가 번갈아 오는 튜플 (짝수 위치는 항상 문자열, 홀수 위치는 정수).
+    """
+    parts = _DIGITS.split(fold_text(name))
+    return tuple(int(part) if i % 2 else part for i, part in enumerate(parts))
@@ -1,5 +1,6 @@
 import os
 import time
+import hashlib
 from collections import OrderedDict
 from PySide6.QtGui import QImage
 from PySide6.QtCore import QThread, Signal, QObject
@@ -11,17 +12,16 @@ class CacheWorkerSignals(QObject):
     error = Signal(str, str)  # path, error message
 
 class CacheWorker(QThread):
-    def __init__(self, path, image, cache_dir):
+    def __init__(self, path, image, cache_path):
         super().__init__()
         self.path = path
         self.image = image
-        self.cache_dir = cache_dir
+        self.cache_path = cache_path
         self.signals = CacheWorkerSignals()
 
     def run(self):
         try:
-            cache_path = os.path.join(self.cache_dir, f"{hash(self.path)}.jpg")
-            self.image.save(cache_path, "JPEG", 85)
+            self.image.save(self.cache_path, "JPEG", 85)
             self.signals.finished.emit(self.path, self.image)
         except Exception as e:
             self.signals.error.emit(self.path, str(e))
@@ -34,20 +34,13 @@ class ThumbnailCache:
         self.cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'thumbnail_cache')
         self.cache_lock = threading.Lock()
         self.worker_pool = ThreadPoolExecutor(max_workers=4)
+        # 디스크 캐시 파일 (오래 안 쓴 순서) 과 전체 크기 (저장할 때마다 크기 제한 적용)
+        self.disk_lock = threading.Lock()
+        self.disk_files = OrderedDict()  # 캐시 파일 경로 -> 크기
+        self.disk_size = 0
         
-        # 캐시 디렉토리 초기화
-        if os.path.exists(self.cache_dir):
-            try:
-                for filename in os.listdir(self.cache_dir):
-                    file_path = os.path.join(self.cache_dir, filename)
-                    try:
-                        os.remove(file_path)
-                    except Exception as e:
-                        print(f"캐시 파일 삭제 실패: {e}")
-            except Exception as e:
-                print(f"캐시 디렉토리 초기화 실패: {e}")
-        else:
-            os.makedirs(self.cache_dir, exist_ok=True)
+        # 캐시 디렉토리 준비 (디스크 캐시는 재시작 후에도 유지)
+        os.makedirs(self.cache_dir, exist_ok=True)
         
         # 디스크 캐시 크기 초기화
         self._init_disk_cache()
@@ -55,32 +48,97 @@ class ThumbnailCache:
     def _init_disk_cache(self):
         """디스크 캐시 초기화 및 크기 관리"""
         try:
-            total_size = 0
             cache_files = []
             
             # 캐시 파일 목록 및 크기 계산
             for filename in os.listdir(self.cache_dir):
                 file_path = os.path.join(self.cache_dir, filename)
                 if os.path.isfile(file_path):
-                    size = os.path.getsize(file_path)
-                    total_size += size
-                    cache_files.append((file_path, os.path.getmtime(file_path)))
+                    stat = os.stat(file_path)
+                    cache_files.append((file_path, stat.st_mtime, stat.st_size))
             
-            # 캐시 크기가 제한을 초과하면 가장 오래된 파일부터 삭제
-            if total_size > self.max_disk_size:
-                cache_files.sort(key=lambda x: x[1])  # 수정 시간 기준 정렬
-                for file_path, _ in cache_files:
-                    if total_size <= self.max_disk_size:
-                        break
-                    size = os.path.getsize(file_path)
-                    try:
-                        os.remove(file_path)
-                        total_size -= size
-                    except Exception as e:
-                        print(f"캐시 파일 삭제 실패: {e}")
+            # 수정 시간 순으로 기록 (가장 오래된 파일부터 삭제 대상)
+            cache_files.sort(key=lambda x: x[1])
+            with self.disk_lock:
+                for file_path, _, size in cache_files:
+                    self.disk_files[file_path] = size
+                    self.disk_size += size
+                self._trim_disk_cache()
         except Exception as e:
             print(f"디스크 캐시 초기화 실패: {e}")
 
+    def _track_disk_file(self, cache_path):
+        """저장한 캐시 파일을 기록하고 크기 제한을 넘으면 오래 안 쓴 파일부터 삭제"""
+        try:
+            size = os.path.getsize(cache_path)
+        except OSError:
+            return
+        with self.disk_lock:
+            self.disk_size += size - self.disk_files.pop(cache_path, 0)
+            self.disk_files[cache_path] = size
+            self._trim_disk_cache(keep=cache_path)
+
+    def _trim_disk_cache(self, keep=None):
+        """디스크 캐시가 제한을 넘으면 오래 안 쓴 파일부터 삭제 (disk_lock 안에서 호출)"""
+        while self.disk_size > self.max_disk_size and self.disk_files:
+            file_path, size = next(iter(self.disk_files.items()))
+            if file_path == keep:
+                break  # 방금 저장한 파일만 남음
+            del self.disk_files[file_path]
+            self.disk_size -= size
+            try:
+                os.remove(file_path)
+            except OSError as e:
+                print(f"캐시 파일 삭제 실패: {e}")
+
+    def _touch_disk_file(self, cache_path):
+        """디스크 캐시 파일을 최근에 쓴 것으로 표시 (삭제 순서를 뒤로)"""
+        with self.disk_lock:
+            if cache_path in self.disk_files:
+                self.disk_files.move_to_end(cache_path)
+
+    def _forget_disk_file(self, cache_path):
+        with self.disk_lock:
+            self.disk_size -= self.disk_files.pop(cache_path, 0)
+
+    def _disk_path(self, file_path):
+        """캐시 키에 대한 디스크 캐시 파일 경로 (실행마다 달라지지 않는 해시 사용)"""
+        digest = hashlib.md5(file_path.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.jpg")
+
+    def _is_stale(self, file_path, cache_path):
+        """원본 파일이 디스크 캐시보다 최근에 수정되었는지 확인"""
+        try:
+            return os.path.getmtime(file_path) > os.path.getmtime(cache_path)
+        except OSError:
+            return False
+
+    def has(self, file_path):
+        """메모리 또는 디스크에 유효한 썸네일이 있는지 확인 (이미지는 읽지 않음)"""
+        with self.cache_lock:
+            if file_path in self.memory_cache:
+                return True
+        cache_path = self._disk_path(file_path)
+        return os.path.exists(cache_path) and not self._is_stale(file_path, cache_path)
+
+    def store_disk(self, file_path, image):
+        """
+        디스크 캐시에만 동기적으로 저장 (백그라운드 스레드에서 사용).
+
+        Returns:
+            bool: 저장 성공 여부.
+        """
+        cache_path = self._disk_path(file_path)
+        try:
+            if not image.save(cache_path, "JPEG", 85):
+                print(f"캐시 저장 실패 ({file_path})")
+                return False
+        except Exception as e:
+            print(f"캐시 저장 실패 ({file_path}): {e}")
+            return False
+        self._track_disk_file(cache_path)
+        return True
+
     def get(self, file_path):
         """썸네일 가져오기 (메모리 -> 디스크 순서)"""
         with self.cache_lock:
@@ -91,14 +149,21 @@ class ThumbnailCache:
                 self.memory_cache[file_path] = image
                 return image
 
-            # 디스크 캐시 확인
-            cache_path = os.path.join(self.cache_dir, f"{hash(file_path)}.jpg")
-            if os.path.exists(cache_path):
+            # 디스크 캐시 확인 (원본이 바뀐 경우 무효화)
+            cache_path = self._disk_path(file_path)
+            if os.path.exists(cache_path) and self._is_stale(file_path, cache_path):
+                try:
+                    os.remove(cache_path)
+                except OSError:
+                    pass
+                self._forget_disk_file(cache_path)
+            elif os.path.exists(cache_path):
                 try:
                     image = QImage(cache_path)
                     if not image.isNull():
                         # 메모리 캐시에 추가
                         self._add_to_memory_cache(file_path, image)
+                        self._touch_disk_file(cache_path)
                         return image
                 except Exception as e:
                     print(f"디스크 캐시 로드 실패: {e}")
@@ -114,10 +179,15 @@ class ThumbnailCache:
             # 메모리 캐시에 추가
             self._add_to_memory_cache(file_path, image)
             
-            # 비동기로 디스크에 저장
-            worker = CacheWorker(file_path, image, self.cache_dir)
+            # 비동기로 디스크에 저장 (저장 후 크기 제한 적용)
+            worker = CacheWorker(file_path, image, self._disk_path(file_path))
             worker.signals.error.connect(lambda path, err: print(f"캐시 저장 실패 ({path}): {err}"))
-            self.worker_pool.submit(worker.run)
+            self.worker_pool.submit(self._run_worker, worker)
+
+    def _run_worker(self, worker):
+        """스레드 풀에서 디스크 저장 실행 후 캐시 크기 기록"""
+        worker.run()
+        self._track_disk_file(worker.cache_path)
 
     def _add_to_memory_cache(self, file_path, image):
         """메모리 캐시에 이미지 추가 (LRU 관리)"""
@@ -131,6 +201,9 @@ class ThumbnailCache:
         """캐시 초기화"""
         with self.cache_lock:
             self.memory_cache.clear()
+            with self.disk_lock:
+                self.disk_files.clear()
+                self.disk_size = 0
             try:
                 for filename in os.listdir(self.cache_dir):
                     file_path = os.path.join(self.cache_dir, filename)
@@ -0,0 +1,102 @@
+"""
+썸네일 디코딩 함수 모음 (프로세스 풀 워커에서 실행됨).
+워커 프로세스의 import 부담을 줄이기 위해 Qt에 의존하지 않습니다.
+"""
+import os
+from io import BytesIO
+from PIL import Image, ExifTags
+
+# 내장 썸네일을 찾아볼 확장자 (EXIF를 담을 수 있는 형식)
+EXIF_THUMBNAIL_EXTENSIONS = {'.jpg', '.jpeg', '.webp'}
+# 내장 썸네일 비율이 원본과 이 이상 다르면 (레터박스 등) 사용하지 않음
+EXIF_ASPECT_TOLERANCE = 0.02
+# EXIF IFD1의 내장 JPEG 썸네일 위치/길이 태그
+JPEG_INTERCHANGE_FORMAT = 0x0201
+JPEG_INTERCHANGE_FORMAT_LENGTH = 0x0202
+
+
+def _fit_size(width, height, max_width, max_height):
+    """(width, height)를 비율을 유지하며 최대 크기 이내로 줄인 크기 (확대하지 않음)"""
+    scale = min(max_width / width, max_height / height, 1.0)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def exif_thumbnail_bytes(img, max_width, max_height):
+    """
+    열린 이미지의 EXIF에 내장된 JPEG 썸네일을 반환합니다.
+    축소 결과 크기 이상이고 원본과 비율이 같을 때만 사용합니다.
+
+    Returns:
+        bytes: 내장 썸네일 JPEG 데이터. 사용할 수 없으면 None.
+    """
+    raw = img.info.get("exif")
+    if not raw:
+        return None
+    ifd1 = img.getexif().get_ifd(ExifTags.IFD.IFD1)
+    offset = ifd1.get(JPEG_INTERCHANGE_FORMAT)
+    length = ifd1.get(JPEG_INTERCHANGE_FORMAT_LENGTH)
+    if not offset or not length:
+        return None
+
+    # 오프셋은 TIFF 헤더 기준
+    if raw.startswith(b"Exif\x00\x00"):
+        raw = raw[6:]
+    data = raw[offset:offset + length]
+    if len(data) != length:
+        return None
+
+    with Image.open(BytesIO(data)) as thumb:
+        need_width, need_height = _fit_size(img.width, img.height, max_width, max_height)
+        if thumb.width < need_width or thumb.height < need_height:
+            return None
+        aspect = img.width / img.height
+        if abs(thumb.width / thumb.height - aspect) > aspect * EXIF_ASPECT_TOLERANCE:
+            return None
+    return data
+
+
+def read_exif_thumbnail(source_path, max_width, max_height):
+    """파일의 EXIF 내장 썸네일을 읽습니다 (헤더만 읽음). 없으면 None."""
+    if os.path.splitext(source_path)[1].lower() not in EXIF_THUMBNAIL_EXTENSIONS:
+        return None
+    try:
+        with Image.open(source_path) as img:
+            return exif_thumbnail_bytes(img, max_width, max_height)
+    except Exception as e:
+        print(f"EXIF 썸네일 읽기 오류 ({source_path}): {e}")
+        return None
+
+
+def decode_thumbnail(source_path, max_width, max_height):
+    """
+    이미지를 디코딩하여 지정 크기 이내로 축소한 RGBA 픽셀 버퍼를 반환합니다.
+    EXIF 내장 썸네일 -> JPEG DCT 축소 디코딩(1/2, 1/4, 1/8) -> 전체 디코딩 순으로 시도합니다.
+
+    Args:
+        source_path (str): 원본 이미지 경로.
+        max_width (int): 최대 너비.
+        max_height (int): 최대 높이.
+
+    Returns:
+        tuple: (width, height, RGBA bytes). 디코딩 실패 시 None.
+    """
+    try:
+        with Image.open(source_path) as img:
+            data = None
+            if img.format in ("JPEG", "WEBP"):
+                data = exif_thumbnail_bytes(img, max_width, max_height)
+
+            if data is not None:
+                source = Image.open(BytesIO(data))
+            else:
+                # JPEG은 목표 크기의 2배 이상을 유지하는 가장 작은 배율로 디코딩 (다른 형식은 무시됨)
+                img.draft(img.mode, (max_width * 2, max_height * 2))
+                source = img
+
+            with source:
+                source.thumbnail((max_width, max_height), Image.LANCZOS)
+                rgba = source.convert("RGBA")
+                return rgba.width, rgba.height, rgba.tobytes()
+    except Exception as e:
+        print(f"썸네일 디코딩 오류 ({source_path}): {e}")
+        return None
@@ -0,0 +1,158 @@
+import os
+import json
+import threading
+from PySide6.QtCore import QThread, QTimer, Signal
+
+from widgets import HIDDEN_FILES, find_folder_cover
+from thumbnail_scheduler import load_scaled_image
+
+# 사용자 조작 후 다시 시작하기까지 대기 시간 (ms)
+IDLE_RESUME_DELAY = 3000
+# 진행 상태 파일 저장 주기 (폴더 수)
+STATE_SAVE_INTERVAL = 50
+
+
+class ThumbnailPrewarmer(QThread):
+    """
+    유휴 시간에 라이브러리 전체를 순회하며 폴더 썸네일을 미리 생성해 디스크 캐시에 저장합니다.
+    사용자가 조작 중이거나 다운로드가 진행 중이면 일시정지하고,
+    처리한 폴더는 상태 파일에 기록하여 재시작 후 이어서 진행합니다.
+    """
+    progress = Signal(int, int)  # 처리한 폴더 수, 전체 폴더 수
+    completed = Signal()
+
+    REASON_USER = "user"
+    REASON_DOWNLOAD = "download"
+
+    def __init__(self, base_path, thumbnail_cache, parent=None):
+        super().__init__(parent)
+        self.base_path = base_path
+        self.thumbnail_cache = thumbnail_cache
+        self.state_path = os.path.join(base_path, ".thumbnail_prewarm.json")
+
+        self._pause_reasons = set()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._stop_requested = False
+
+        # 사용자 조작이 멈춘 뒤 일정 시간이 지나면 재개
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(IDLE_RESUME_DELAY)
+        self._idle_timer.timeout.connect(lambda: self.resume(self.REASON_USER))
+
+    def notify_user_activity(self):
+        """사용자 조작 시 호출: 일시정지 후 유휴 상태가 되면 자동 재개"""
+        self.pause(self.REASON_USER)
+        self._idle_timer.start()
+
+    def pause(self, reason):
+        self._pause_reasons.add(reason)
+        self._resume_event.clear()
+
+    def resume(self, reason):
+        self._pause_reasons.discard(reason)
+        if not self._pause_reasons:
+            self._resume_event.set()
+
+    def stop(self):
+        """작업을 중단하고 스레드 종료를 기다립니다."""
+        self._stop_requested = True
+        self._resume_event.set()
+        self.wait()
+
+    def _load_state(self):
+        """완료한 폴더 목록 로드: {상대 경로: [폴더 수정 시간, 커버 이미지 경로 또는 None]}"""
+        try:
+            if os.path.exists(self.state_path):
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                    if isinstance(state, dict):
+                        return state
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"썸네일 사전 생성 상태 로드 오류: {e}")
+        return {}
+
+    def _save_state(self, state):
+        try:
+            tmp_path = self.state_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(tmp_path, self.state_path)
+        except IOError as e:
+            print(f"썸네일 사전 생성 상태 저장 오류: {e}")
+
+    def _collect_folders(self):
+        """base_path 아래의 모든 폴더 경로 (숨김 폴더, 캐시 폴더 제외)"""
+        folders = []
+        cache_dir = os.path.normpath(self.thumbnail_cache.cache_dir)
+        for root, dirs, _ in os.walk(self.base_path):
+            self._resume_event.wait()
+            if self._stop_requested:
+                break
+            dirs[:] = [d for d in dirs
+                       if not d.startswith('.') and d not in HIDDEN_FILES
+                       and os.path.normpath(os.path.join(root, d)) != cache_dir]
+            folders.extend(os.path.join(root, d) for d in dirs)
+        return folders
+
+    def _is_done(self, entry, mtime):
+        """
+        상태 파일에 기록된 폴더를 건너뛸 수 있는지 확인.
+        폴더가 그대로여도 썸네일이 캐시 크기 제한으로 지워졌으면 다시 만듭니다.
+        """
+        if not isinstance(entry, list) or len(entry) != 2 or entry[0] != mtime:
+            return False
+        cover = entry[1]
+        return not cover or self.thumbnail_cache.has(cover)
+
+    def _prewarm(self, cover):
+        """
+        커버 이미지의 썸네일을 디스크 캐시에 저장.
+
+        Returns:
+            bool: 완료 여부 (커버가 없거나 이미 캐시에 있어도 True, 디코딩/저장 실패 시 False).
+        """
+        if not cover or self.thumbnail_cache.has(cover):
+            return True
+        image = load_scaled_image(cover)
+        if image.isNull():
+            return False  # 기록하지 않음 (다음 실행에서 다시 시도)
+        return self.thumbnail_cache.store_disk(cover, image)
+
+    def run(self):
+        folders = self._collect_folders()
+        # 삭제된 폴더의 기록은 정리
+        rel_paths = {os.path.relpath(folder, self.base_path) for folder in folders}
+        state = {k: v for k, v in self._load_state().items() if k in rel_paths}
+        total = len(folders)
+        done = 0
+        unsaved = 0
+
+        for folder in folders:
+            self._resume_event.wait()
+            if self._stop_requested:
+                break
+
+            rel_path = os.path.relpath(folder, self.base_path)
+            try:
+                mtime = os.path.getmtime(folder)
+                if not self._is_done(state.get(rel_path), mtime):
+                    state.pop(rel_path, None)
+                    cover = find_folder_cover(folder)
+                    if self._prewarm(cover):
+                        state[rel_path] = [mtime, cover]
+                    unsaved += 1
+            except OSError as e:
+                print(f"썸네일 사전 생성 오류 ({folder}): {e}")
+
+            done += 1
+            self.progress.emit(done, total)
+            if unsaved >= STATE_SAVE_INTERVAL:
+                self._save_state(state)
+                unsaved = 0
+
+        if unsaved:
+            self._save_state(state)
+        if not self._stop_requested:
+            self.completed.emit()
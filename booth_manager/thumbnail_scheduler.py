@@ -0,0 +1,236 @@
+import heapq
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QImage, QImageReader, QImageIOHandler
+
+from widgets import THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT
+from thumbnail_decoder import decode_thumbnail, read_exif_thumbnail
+
+# 작업 우선순위 (값이 작을수록 먼저 처리)
+PRIORITY_VISIBLE = 0   # 현재 뷰포트에 보이는 아이템
+PRIORITY_PREFETCH = 1  # 다음 화면 미리 불러오기
+
+
+# 디코딩 백엔드
+BACKEND_THREAD = "thread"    # QThreadPool 스레드에서 QImage로 디코딩
+BACKEND_PROCESS = "process"  # 워커 프로세스에서 PIL로 디코딩 (GIL 경합 없음)
+
+
+def load_scaled_image(source_path):
+    """
+    원본 이미지를 읽어 썸네일 크기로 축소한 QImage를 반환 (실패 시 null QImage).
+    EXIF 내장 썸네일이 있으면 사용하고, 없으면 축소 디코딩을 지원하는 형식(JPEG)은
+    목표 크기의 2배 정도로 줄여서 읽은 뒤 부드럽게 축소합니다.
+    """
+    try:
+        loaded = QImage()
+        data = read_exif_thumbnail(source_path, THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT)
+        if data:
+            loaded = QImage.fromData(data)
+
+        if loaded.isNull():
+            reader = QImageReader(source_path)
+            size = reader.size()
+            if size.isValid() and reader.supportsOption(QImageIOHandler.ScaledSize):
+                target = size.scaled(THUMBNAIL_WIDTH * 2, THUMBNAIL_HEIGHT * 2, Qt.KeepAspectRatio)
+                if target.width() < size.width():
+                    reader.setScaledSize(target)
+            loaded = reader.read()
+
+        if not loaded.isNull():
+            return loaded.scaled(THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT,
+                                 Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    except Exception as e:
+        print(f"썸네일 생성 오류 ({source_path}): {e}")
+    return QImage()
+
+
+def image_from_buffer(result):
+    """decode_thumbnail 결과 (width, height, RGBA bytes)를 QImage로 변환"""
+    if not result:
+        return QImage()
+    width, height, data = result
+    # copy()로 bytes 버퍼와 분리된 QImage를 만듦
+    return QImage(data, width, height, width * 4, QImage.Format_RGBA8888).copy()
+
+
+class ThumbnailJobSignals(QObject):
+    finished = Signal(str, QImage)  # source_path, image (실패 시 null QImage)
+    decoded = Signal(str, object)   # source_path, (width, height, RGBA bytes) 또는 None
+
+
+class ThumbnailJob(QRunnable):
+    """원본 이미지를 읽어 썸네일 크기로 축소하는 작업"""
+    def __init__(self, source_path, signals):
+        super().__init__()
+        self.source_path = source_path
+        self.signals = signals
+
+    def run(self):
+        self.signals.finished.emit(self.source_path, load_scaled_image(self.source_path))
+
+
+class _PendingRequest:
+    """대기 중인 썸네일 요청 (같은 원본 경로의 요청은 하나로 합쳐짐)"""
+    __slots__ = ("priority", "subscribers")
+
+    def __init__(self, priority):
+        self.priority = priority
+        self.subscribers = {}  # owner -> callback
+
+
+class ThumbnailScheduler(QObject):
+    """
+    우선순위 기반 썸네일 작업 스케줄러.
+    보이는 아이템을 먼저, 다음 화면을 그 다음으로 처리하고,
+    더 이상 표시되지 않는 아이템의 대기 작업은 취소합니다.
+    같은 원본 경로에 대한 요청은 하나의 작업으로 합쳐집니다.
+    """
+    def __init__(self, thumbnail_cache=None, thread_pool=None, backend=BACKEND_THREAD, parent=None):
+        super().__init__(parent)
+        self.thumbnail_cache = thumbnail_cache
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self.max_in_flight = max(1, self.thread_pool.maxThreadCount())
+
+        self.backend = backend
+        self._executor = None
+        if backend == BACKEND_PROCESS:
+            try:
+                workers = max(1, multiprocessing.cpu_count() - 1)
+                self._executor = ProcessPoolExecutor(max_workers=workers)
+                # 워커가 쉬지 않도록 프로세스 수보다 조금 더 많이 넘겨둠
+                self.max_in_flight = workers * 2
+            except Exception as e:
+                print(f"프로세스 풀 생성 실패, 스레드 백엔드 사용: {e}")
+                self.backend = BACKEND_THREAD
+
+        self._pending = {}     # source_path -> _PendingRequest
+        self._in_flight = {}   # source_path -> {owner: callback}
+        self._owners = {}      # owner -> source_path
+        self._heap = []        # (priority, seq, source_path)
+        self._seq = itertools.count()
+
+        # 스케줄러가 살아있는 동안 유지되는 공용 시그널 객체
+        self._signals = ThumbnailJobSignals()
+        self._signals.finished.connect(self._on_job_finished)
+        self._signals.decoded.connect(self._on_buffer_decoded)
+
+    def request(self, owner, source_path, callback, priority=PRIORITY_VISIBLE):
+        """
+        썸네일을 요청합니다. 캐시에 있으면 즉시 callback을 호출합니다.
+
+        Args:
+            owner: 요청 주체 (취소 시 식별자로 사용, 보통 아이템 위젯).
+            source_path (str): 썸네일을 만들 원본 이미지 경로 (캐시 키로도 사용).
+            callback (callable): QImage를 인자로 받는 완료 콜백.
+            priority (int): PRIORITY_VISIBLE 또는 PRIORITY_PREFETCH.
+        """
+        if self.thumbnail_cache:
+            cached_image = self.thumbnail_cache.get(source_path)
+            if cached_image:
+                self.cancel(owner)
+                callback(cached_image)
+                return
+
+        # 다른 원본을 기다리던 owner면 이전 요청에서 제거
+        previous = self._owners.get(owner)
+        if previous is not None and previous != source_path:
+            self.cancel(owner)
+        self._owners[owner] = source_path
+
+        # 이미 실행 중인 작업이 있으면 결과만 함께 받음
+        if source_path in self._in_flight:
+            self._in_flight[source_path][owner] = callback
+            return
+
+        pending = self._pending.get(source_path)
+        if pending is None:
+            pending = _PendingRequest(priority)
+            self._pending[source_path] = pending
+            heapq.heappush(self._heap, (priority, next(self._seq), source_path))
+        elif priority < pending.priority:
+            # 우선순위 상향: 새 항목을 넣고 이전 항목은 꺼낼 때 무시
+            pending.priority = priority
+            heapq.heappush(self._heap, (priority, next(self._seq), source_path))
+        pending.subscribers[owner] = callback
+
+        self._dispatch()
+
+    def cancel(self, owner):
+        """owner의 요청을 취소합니다. 실행 중인 작업은 결과만 전달되지 않습니다."""
+        source_path = self._owners.pop(owner, None)
+        if source_path is None:
+            return
+        pending = self._pending.get(source_path)
+        if pending is not None:
+            pending.subscribers.pop(owner, None)
+            if not pending.subscribers:
+                # 힙에 남은 항목은 꺼낼 때 무시됨
+                del self._pending[source_path]
+        elif source_path in self._in_flight:
+            self._in_flight[source_path].pop(owner, None)
+
+    def retain(self, owners):
+        """주어진 owner 외의 모든 요청을 취소합니다."""
+        keep = set(owners)
+        for owner in [o for o in self._owners if o not in keep]:
+            self.cancel(owner)
+
+    def cancel_all(self):
+        """모든 대기 요청을 취소합니다."""
+        for owner in list(self._owners):
+            self.cancel(owner)
+
+    def _dispatch(self):
+        """동시 실행 한도 안에서 우선순위가 높은 대기 작업을 스레드 풀에 넘깁니다."""
+        while self._heap and len(self._in_flight) < self.max_in_flight:
+            priority, _, source_path = heapq.heappop(self._heap)
+            pending = self._pending.get(source_path)
+            if pending is None or pending.priority != priority:
+                continue  # 취소되었거나 우선순위가 바뀐 오래된 항목
+            del self._pending[source_path]
+            self._in_flight[source_path] = pending.subscribers
+            if self._executor is not None:
+                future = self._executor.submit(decode_thumbnail, source_path,
+                                               THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT)
+                # 완료 콜백은 풀 내부 스레드에서 호출되므로 시그널로 GUI 스레드에 전달
+                future.add_done_callback(
+                    lambda f, path=source_path: self._signals.decoded.emit(
+                        path, None if f.cancelled() or f.exception() else f.result()))
+            else:
+                # QThreadPool은 값이 클수록 먼저 실행
+                self.thread_pool.start(ThumbnailJob(source_path, self._signals), -priority)
+
+    def _on_buffer_decoded(self, source_path, result):
+        """프로세스 백엔드의 픽셀 버퍼를 GUI 스레드에서 QImage로 변환"""
+        self._on_job_finished(source_path, image_from_buffer(result))
+
+    def _on_job_finished(self, source_path, image):
+        """작업 완료 시 캐시에 저장하고 남아있는 요청자들에게 결과를 전달합니다."""
+        subscribers = self._in_flight.pop(source_path, {})
+        if image.isNull():
+            print(f"썸네일 로드 실패: {source_path}")
+            image = QImage(THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT, QImage.Format_ARGB32)
+            image.fill(Qt.red)
+        elif self.thumbnail_cache:
+            self.thumbnail_cache.set(source_path, image)
+
+        for owner, callback in subscribers.items():
+            if self._owners.get(owner) == source_path:
+                del self._owners[owner]
+            try:
+                callback(image)
+            except RuntimeError:
+                # 이미 삭제된 위젯
+                pass
+
+        self._dispatch()
+
+    def shutdown(self):
+        """프로세스 풀을 종료합니다 (애플리케이션 종료 시 호출)."""
+        self.cancel_all()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
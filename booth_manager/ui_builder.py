@@ -1,10 +1,11 @@
 from PySide6.QtCore import Qt, QDir
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSplitter,
-                             QTreeView, QFileSystemModel, QComboBox, QScrollArea,
+                             QTreeView, QFileSystemModel, QComboBox,
                              QGridLayout, QPushButton, QLineEdit, QTabWidget)
-from PySide6.QtGui import QColor
+from PySide6.QtGui import QColor, QKeySequence
 
 from logger_config import logger
+from item_view import ItemListModel, ItemGridView
 
 class UIBuilder:
     def __init__(self, main_window):
@@ -52,23 +53,61 @@ class UIBuilder:
         controls_layout.setContentsMargins(0, 0, 0, 0)
         controls_layout.setSpacing(0)
 
-        # Tag search
-        controls_layout.addWidget(QLabel("태그 검색:"))
+        # Back / forward navigation
+        self.main_window.back_button = QPushButton("◀")
+        self.main_window.back_button.setToolTip("뒤로 (Alt+←)")
+        self.main_window.back_button.setShortcut(QKeySequence.Back)
+        self.main_window.back_button.clicked.connect(self.main_window.navigate_back)
+        controls_layout.addWidget(self.main_window.back_button)
+
+        self.main_window.forward_button = QPushButton("▶")
+        self.main_window.forward_button.setToolTip("앞으로 (Alt+→)")
+        self.main_window.forward_button.setShortcut(QKeySequence.Forward)
+        self.main_window.forward_button.clicked.connect(self.main_window.navigate_forward)
+        controls_layout.addWidget(self.main_window.forward_button)
+
+        # Search (tag / fuzzy name search)
+        self.main_window.search_mode_combo = QComboBox()
+        self.main_window.search_mode_combo.addItems(["태그 검색", "이름/태그 검색"])
+        self.main_window.search_mode_combo.setToolTip("이름/태그 검색: 이름, 태그, 상품 제목/상점을 입력하는 대로 유사 검색")
+        self.main_window.search_mode_combo.currentIndexChanged.connect(self.main_window.change_search_mode)
+        controls_layout.addWidget(self.main_window.search_mode_combo)
         self.main_window.search_input = QLineEdit()
-        self.main_window.search_input.setPlaceholderText("검색할 태그 입력 (쉼표로 구분)")
-        self.main_window.search_input.returnPressed.connect(self.main_window.search_by_tags)
+        self.main_window.search_input.setPlaceholderText("태그 검색 (예: 헤어 AND -유료, ext:unitypackage size:>100MB)")
+        self.main_window.search_input.returnPressed.connect(self.main_window.perform_search)
+        self.main_window.search_input.textChanged.connect(self.main_window.schedule_fuzzy_search)
         controls_layout.addWidget(self.main_window.search_input)
         
-        search_button = QPushButton("태그 검색")
-        search_button.clicked.connect(self.main_window.search_by_tags)
+        search_button = QPushButton("검색")
+        search_button.clicked.connect(self.main_window.perform_search)
         controls_layout.addWidget(search_button)
+
+        advanced_search_button = QPushButton("고급 검색")
+        advanced_search_button.setToolTip("파일명/크기/날짜/확장자로 전체 파일 검색")
+        advanced_search_button.clicked.connect(self.main_window.open_advanced_search)
+        controls_layout.addWidget(advanced_search_button)
+
+        saved_search_button = QPushButton("저장된 검색")
+        saved_search_button.setToolTip("현재 검색 조건 저장 / 저장된 검색 다시 실행")
+        saved_search_button.clicked.connect(self.main_window.open_saved_searches)
+        controls_layout.addWidget(saved_search_button)
+
+        history_button = QPushButton("검색 기록")
+        history_button.setToolTip("최근 검색 다시 실행")
+        history_button.clicked.connect(self.main_window.open_search_history)
+        controls_layout.addWidget(history_button)
+
+        tag_cloud_button = QPushButton("태그 구름")
+        tag_cloud_button.setToolTip("많이 쓰인 태그와 함께 쓰인 태그 보기")
+        tag_cloud_button.clicked.connect(self.main_window.open_tag_cloud)
+        controls_layout.addWidget(tag_cloud_button)
         controls_layout.addStretch(1)
 
         # File filter
         controls_layout.addWidget(QLabel("파일 필터:"))
         self.main_window.filter_input = QLineEdit()
         self.main_window.filter_input.setPlaceholderText("이름 또는 확장자 필터")
-        self.main_window.filter_input.textChanged.connect(self.main_window.apply_filter_sort)
+        self.main_window.filter_input.textChanged.connect(self.main_window.schedule_filter)
         controls_layout.addWidget(self.main_window.filter_input)
         
         # Sort
@@ -76,7 +115,7 @@ class UIBuilder:
         self.main_window.sort_combo = QComboBox()
         for idx, (name, *_) in self.main_window.sort_options.items():
             self.main_window.sort_combo.addItem(name)
-        self.main_window.sort_combo.currentIndexChanged.connect(self.main_window.apply_filter_sort)
+        self.main_window.sort_combo.currentIndexChanged.connect(self.main_window.apply_sort)
         controls_layout.addWidget(self.main_window.sort_combo)
 
         return controls_layout
@@ -93,6 +132,7 @@ class UIBuilder:
         from downloader_widget import DownloaderWidget
         downloader_widget = DownloaderWidget(self.base_path)
         tab_widget.addTab(downloader_widget, "다운로더")
+        self.main_window.downloader_widget = downloader_widget
 
         return tab_widget
 
@@ -111,9 +151,9 @@ class UIBuilder:
         tree_view = self._build_tree_view()
         splitter.addWidget(tree_view)
 
-        # Add scroll area
-        scroll_area = self._build_scroll_area()
-        splitter.addWidget(scroll_area)
+        # Add item grid view
+        item_view = self._build_item_view()
+        splitter.addWidget(item_view)
 
         # Set initial splitter sizes
         splitter.setSizes([250, 750])
@@ -148,17 +188,19 @@ class UIBuilder:
 
         return tree_view
 
-    def _build_scroll_area(self):
-        """Build the scroll area for content display"""
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setWidget(self.main_window.content_widget)
-        scroll_area.setStyleSheet("QScrollArea { background-color: transparent; border: none; }")
-        
-        # Store reference
-        self.main_window.scroll_area = scroll_area
+    def _build_item_view(self):
+        """Build the virtualized grid view for content display"""
+        item_model = ItemListModel(self.main_window)
+        item_view = ItemGridView()
+        item_view.setModel(item_model)
+        item_view.item_activated.connect(self.main_window.on_item_activated)
+        item_view.tag_edit_requested.connect(self.main_window.edit_item_tags)
+
+        # Store references
+        self.main_window.item_model = item_model
+        self.main_window.item_view = item_view
 
-        return scroll_area
+        return item_view
 
     def _adjust_brightness(self, hex_color, factor):
         """Adjust the brightness of a hex color"""